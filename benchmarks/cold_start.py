@@ -0,0 +1,123 @@
+"""
+Benchmark of the import time of a synthetic application with thousands of injectables, with and
+without :py:attr:`.Config.injection_cache_dir`. Each start is done in a new process:
+
+- no cache: :py:attr:`.Config.injection_cache_dir` isn't set.
+- cold: the cache directory is empty, everything is inspected and then written to it.
+- warm: the cache directory was filled by a previous start.
+
+.. code-block:: bash
+
+    python benchmarks/cold_start.py
+
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import textwrap
+import time
+
+APP = "synthetic_app"
+
+PACKAGE_INIT = """
+import os
+
+from antidote import config
+
+config.injection_cache_dir = os.environ.get("ANTIDOTE_BENCHMARK_CACHE") or None
+"""
+
+SERVICE = """
+
+@injectable
+class Service{i}:
+    def __init__(self, a: {dep_a} = inject.me(), b: Optional[{dep_b}] = inject.me()) -> None:
+        self.a = a
+        self.b = b
+
+    @inject
+    def method(self, x: {dep_a} = inject.me(), *, y: int = 0) -> object:
+        return x
+"""
+
+
+def generate(directory: str, *, modules: int, services: int) -> None:
+    package = os.path.join(directory, APP)
+    os.makedirs(package)
+    with open(os.path.join(package, "__init__.py"), "w") as file:
+        file.write(PACKAGE_INIT)
+    imports = []
+    for m in range(modules):
+        source = [
+            "from __future__ import annotations\n",
+            "from typing import Optional\n",
+            "from antidote import inject, injectable\n",
+        ]
+        if m > 0:
+            source.append(f"from .module{m - 1} import Service{m - 1}_0 as Previous\n")
+        else:
+            source.append("\n\n@injectable\nclass Previous:\n    pass\n")
+        for s in range(services):
+            dep_a = f"Service{m}_{s - 1}" if s > 0 else "Previous"
+            source.append(SERVICE.format(i=f"{m}_{s}", dep_a=dep_a, dep_b=dep_a))
+        with open(os.path.join(package, f"module{m}.py"), "w") as file:
+            file.write("".join(source))
+        imports.append(f"import {APP}.module{m}")
+
+    with open(os.path.join(directory, "main.py"), "w") as file:
+        file.write("\n".join(imports))
+
+
+def start(directory: str, cache: str | None) -> float:
+    env = dict(os.environ, ANTIDOTE_BENCHMARK_CACHE=cache or "")
+    code = textwrap.dedent(
+        """
+        import time
+        import antidote
+        start = time.perf_counter()
+        import main
+        print(time.perf_counter() - start)
+        """
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=directory,
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return float(output)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--modules", type=int, default=50)
+    parser.add_argument("--services", type=int, default=40, help="per module")
+    parser.add_argument("--repeat", type=int, default=5)
+    options = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        generate(directory, modules=options.modules, services=options.services)
+        # Ensure bytecode is compiled before any measurement.
+        start(directory, None)
+
+        results: dict[str, list[float]] = {"no cache": [], "cold": [], "warm": []}
+        for i in range(options.repeat):
+            cache = os.path.join(directory, f"cache{i}")
+            results["no cache"].append(start(directory, None))
+            results["cold"].append(start(directory, cache))
+            results["warm"].append(start(directory, cache))
+
+    print(f"{options.modules * options.services} injectables, median of {options.repeat} starts")
+    for name, timings in results.items():
+        print(f"{name:<10} {statistics.median(timings) * 1000:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+Micro-benchmarks of the per-call overhead added by Antidote when injecting dependencies or
+retrieving them directly from a catalog.
+
+Compare two revisions by running it on each of them:
+
+.. code-block:: bash
+
+    python benchmarks/injection.py
+
+"""
+from __future__ import annotations
+
+import argparse
+import timeit
+from typing import Callable
+
+from antidote import config, inject, injectable, lazy, new_catalog, ScopeGlobalVar, world
+
+
+@injectable
+class A:
+    pass
+
+
+@injectable
+class B:
+    pass
+
+
+@injectable(lifetime="transient")
+class Transient:
+    pass
+
+
+version = ScopeGlobalVar(default=1)
+
+
+@lazy.value(lifetime="scoped")
+def scoped(v: int = inject[version]) -> int:
+    return v
+
+
+def raw(a: object = None, b: object = None) -> object:
+    return a
+
+
+@inject
+def one(a: A = inject.me()) -> object:
+    return a
+
+
+@inject
+def two(a: A = inject.me(), b: B = inject.me()) -> object:
+    return a
+
+
+@inject
+def transient(t: Transient = inject.me()) -> object:
+    return t
+
+
+@inject
+def scoped_injection(v: int = inject[scoped]) -> object:
+    return v
+
+
+class Service:
+    @inject
+    def method(self, a: A = inject.me()) -> object:
+        return a
+
+
+config.specialize_injections = True
+
+
+@inject
+def specialized_one(a: A = inject.me()) -> object:
+    return a
+
+
+@inject
+def specialized_two(a: A = inject.me(), b: B = inject.me()) -> object:
+    return a
+
+
+class SpecializedService:
+    @inject
+    def method(self, a: A = inject.me()) -> object:
+        return a
+
+
+config.specialize_injections = False
+
+frozen_catalog = new_catalog(name="frozen")
+frozen_services = [injectable(type(f"S{i}", (), {}), catalog=frozen_catalog) for i in range(5)]
+
+
+def five(s0: object, s1: object, s2: object, s3: object, s4: object) -> object:
+    return s0
+
+
+five_kwargs = {f"s{i}": service for i, service in enumerate(frozen_services)}
+frozen_five = inject(five, kwargs=five_kwargs, app_catalog=frozen_catalog)
+config.specialize_injections = True
+specialized_frozen_five = inject(five, kwargs=five_kwargs, app_catalog=frozen_catalog)
+config.specialize_injections = False
+# Each child catalog is walked on a miss.
+for i in range(10):
+    frozen_catalog.include(new_catalog(name=f"frozen-child-{i}"))
+frozen_catalog.freeze()
+
+service = Service()
+a_handle = world.handle(A)
+specialized_service = SpecializedService()
+a = A()
+b = B()
+
+CASES: dict[str, Callable[[], object]] = {
+    "raw function call (reference)": lambda: raw(),
+    "inject: 1 singleton": lambda: one(),
+    "inject: 2 singletons": lambda: two(),
+    "inject: all arguments given": lambda: two(a, b),
+    "inject: 1 transient": lambda: transient(),
+    "inject: 1 scoped": lambda: scoped_injection(),
+    "inject: method": lambda: service.method(),
+    "inject: method attribute access": lambda: service.method,
+    "inject (specialized): 1 singleton": lambda: specialized_one(),
+    "inject (specialized): 2 singletons": lambda: specialized_two(),
+    "inject (specialized): all arguments given": lambda: specialized_two(a, b),
+    "inject (specialized): method": lambda: specialized_service.method(),
+    "inject: 5 singletons (frozen catalog)": lambda: frozen_five(),
+    "inject (specialized): 5 singletons (frozen catalog)": lambda: specialized_frozen_five(),
+    "world[singleton]": lambda: world[A],
+    "world.handle(singleton)()": lambda: a_handle(),
+    "world[transient]": lambda: world[Transient],
+    "world[...]: 3 transients": lambda: (world[Transient], world[Transient], world[Transient]),
+    "world.get_many(): 3 transients": lambda: world.get_many([Transient, Transient, Transient]),
+    "world[scoped]": lambda: world[scoped],
+    "world[...]: 3 scoped": lambda: (world[scoped], world[scoped], world[scoped]),
+    "world.get_many(): 3 scoped": lambda: world.get_many([scoped, scoped, scoped]),
+    "world.get(unknown)": lambda: world.get(object),
+    "catalog.get(unknown) (frozen catalog)": lambda: frozen_catalog.get(object),
+    "unknown in catalog (frozen catalog)": lambda: object in frozen_catalog,
+}
+
+
+def run(number: int, repeat: int) -> None:
+    width = max(map(len, CASES))
+    for name, case in CASES.items():
+        case()  # warm-up, creates singletons
+        best = min(timeit.repeat(case, number=number, repeat=repeat))
+        print(f"{name:<{width}} {best / number * 1e9:>8.0f} ns/call")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--number", type=int, default=100_000)
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    args = parser.parse_args()
+    run(args.number, args.repeat)
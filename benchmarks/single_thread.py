@@ -0,0 +1,86 @@
+"""
+Benchmark of the dependencies requiring a lock on every retrieval, run in a single thread with a
+thread-safe catalog and with one created with :code:`new_catalog(thread_safe=False)`.
+
+.. code-block:: bash
+
+    python benchmarks/single_thread.py
+
+"""
+from __future__ import annotations
+
+import argparse
+import timeit
+from typing import Callable
+
+from antidote import (
+    antidote_lib,
+    inject,
+    injectable,
+    lazy,
+    new_catalog,
+    PublicCatalog,
+    ScopeGlobalVar,
+)
+
+
+class Override:
+    pass
+
+
+def cases(catalog: PublicCatalog) -> dict[str, Callable[[], object]]:
+    version = ScopeGlobalVar(default=1, catalog=catalog)
+
+    @injectable(catalog=catalog)
+    class Singleton:
+        pass
+
+    @injectable(catalog=catalog, lifetime="transient")
+    class Transient:
+        pass
+
+    @lazy.value(catalog=catalog, lifetime="scoped")
+    def scoped(v: int = inject[version]) -> int:
+        return v
+
+    @lazy(catalog=catalog, lifetime="transient")
+    def parameterized(n: int, s: object = inject[Singleton]) -> int:
+        return n
+
+    return {
+        "singleton": lambda: catalog[Singleton],
+        "transient": lambda: catalog[Transient],
+        "scoped": lambda: catalog[scoped],
+        "scope var": lambda: catalog[version],
+        "lazy call with a singleton": lambda: catalog[parameterized(1)],
+    }
+
+
+def run(number: int, repeat: int) -> None:
+    results: dict[str, list[float]] = {}
+
+    def measure(name: str, case: Callable[[], object]) -> None:
+        case()  # warm-up, creates singletons
+        best = min(timeit.repeat(case, number=number, repeat=repeat))
+        results.setdefault(name, []).append(best / number * 1e9)
+
+    for thread_safe in [True, False]:
+        catalog = new_catalog(include=[antidote_lib], thread_safe=thread_safe)
+        for name, case in cases(catalog).items():
+            measure(name, case)
+        with catalog.test.empty() as overrides:
+            overrides.factory(Override)(lambda: Override())
+            measure("test factory override", lambda: catalog[Override])
+
+    width = max(map(len, results))
+    print(f"{'':<{width}} {'thread-safe':>12} {'single thread':>14}")
+    for name, (safe, unsafe) in results.items():
+        print(f"{name:<{width}} {safe:>9.0f} ns {unsafe:>11.0f} ns")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--number", type=int, default=100_000)
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    args = parser.parse_args()
+    run(args.number, args.repeat)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Callable
+
 from typing_extensions import Protocol
 
 from ._internal import API, ConfigImpl
@@ -26,6 +28,7 @@ from .core import (
     MissingProviderError,
     new_catalog,
     ParameterDependency,
+    PoolTimeoutError,
     PublicCatalog,
     ReadOnlyCatalog,
     scope,
@@ -95,6 +98,7 @@ __all__ = [
     "ParameterDependency",
     "Predicate",
     "PredicateConstraint",
+    "PoolTimeoutError",
     "PublicCatalog",
     "QualifiedBy",
     "ReadOnlyCatalog",
@@ -184,3 +188,115 @@ class Config(Protocol):
         config.auto_detect_type_hints_locals = False
 
     """
+
+    specialize_injections: bool
+    """
+    Whether :py:obj:`.inject` should generate, at decoration time, a function specialized for
+    the injected arguments instead of relying on a generic implementation. It reduces the
+    overhead of each call, at the expense of a slower decoration. It's only applied to functions
+    decorated after the change. Deactivated by default.
+
+    .. doctest:: config_specialize_injections
+
+        >>> from antidote import config, injectable, inject, world
+        >>> config.specialize_injections = True
+        >>> @injectable
+        ... class Service:
+        ...     pass
+        >>> @inject
+        ... def f(service: Service = inject.me()) -> Service:
+        ...     return service
+        >>> f() is world[Service]
+        True
+
+    .. testcleanup:: config_specialize_injections
+
+        config.specialize_injections = False
+
+    """
+
+    defer_injections: bool
+    """
+    Whether :py:obj:`.inject` and all other decorators relying on it should defer the inspection
+    of the signature and type hints to the first call of the function, reducing the import time.
+    Deferred injections are created when freezing the catalog they rely on, so errors are raised
+    before serving anything. Functions without an explicit :code:`app_catalog` rely on the current
+    one, typically :py:obj:`.world`. A failing function is only reported by the first freeze and
+    raises again on each call. Type hints are only evaluated at that point, so forward references defined
+    later in the module can be used. However, functions without any dependencies to inject are
+    still wrapped. It's only applied to functions decorated after the change. Deactivated by
+    default.
+
+    .. doctest:: config_defer_injections
+
+        >>> from antidote import config, injectable, inject, world
+        >>> config.defer_injections = True
+        >>> @inject
+        ... def f(service: Service = inject.me()) -> Service:
+        ...     return service
+        >>> @injectable
+        ... class Service:
+        ...     pass
+        >>> f() is world[Service]
+        True
+
+    .. testcleanup:: config_defer_injections
+
+        config.defer_injections = False
+
+    """
+
+    injection_cache_dir: str | None
+    """
+    Directory in which :py:obj:`.inject` and all other decorators relying on it store the
+    inspected signature and type hints of injected functions. On the next start, functions that
+    haven't changed skip the inspection entirely, reducing the import time. Entries are
+    invalidated whenever the module file or the function code changes. Type hints are stored as
+    import paths, so only classes, optionally wrapped in :py:obj:`~typing.Optional`, are supported.
+    Other functions are inspected as usual. New entries are written when the process exits.
+    Deactivated by default with :py:obj:`None`.
+
+    It's only applied to functions decorated after the change, so it should be set before
+    importing any module relying on Antidote:
+
+    .. code-block:: python
+
+        from antidote import config
+
+        config.injection_cache_dir = ".antidote_cache"
+
+    """
+
+    @property
+    def clock(self) -> Callable[[], float]:
+        """
+        Clock used to determine when the value of a dependency with a :code:`ttl` expires, in
+        seconds. Defaults to :py:func:`time.monotonic`. It's mostly interesting during tests to
+        control the time:
+
+        .. doctest:: config_clock
+
+            >>> from antidote import config, lazy, world
+            >>> now = 0.0
+            >>> config.clock = lambda: now
+            >>> @lazy.value(ttl=10)
+            ... def token() -> object:
+            ...     return object()
+            >>> first = world[token]
+            >>> world[token] is first
+            True
+            >>> now = 10.0
+            >>> world[token] is first
+            False
+
+        .. testcleanup:: config_clock
+
+            import time
+            config.clock = time.monotonic
+
+        """
+        ...
+
+    @clock.setter
+    def clock(self, value: Callable[[], float]) -> None:
+        ...
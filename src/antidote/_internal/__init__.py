@@ -21,6 +21,7 @@ from .utils import (
     prepare_injection,
     short_id,
     Singleton,
+    validate_ttl,
     wraps_frozen,
 )
 
@@ -47,4 +48,5 @@ __all__ = [
     "EMPTY_TUPLE",
     "wraps_frozen",
     "short_id",
+    "validate_ttl",
 ]
@@ -1,4 +1,7 @@
+import os
+import time
 from dataclasses import dataclass
+from typing import Callable, Optional, Union
 
 from typing_extensions import final
 
@@ -10,11 +13,25 @@ from .utils import Singleton
 @final
 @dataclass(eq=False)
 class ConfigImpl(Singleton):
-    __slots__ = ("_auto_detect_type_hints_locals",)
+    __slots__ = (
+        "_auto_detect_type_hints_locals",
+        "_specialize_injections",
+        "_defer_injections",
+        "_injection_cache_dir",
+        "_clock",
+    )
     _auto_detect_type_hints_locals: bool
+    _specialize_injections: bool
+    _defer_injections: bool
+    _injection_cache_dir: Optional[str]
+    _clock: Callable[[], float]
 
     def __init__(self) -> None:
         object.__setattr__(self, "_auto_detect_type_hints_locals", False)
+        object.__setattr__(self, "_specialize_injections", False)
+        object.__setattr__(self, "_defer_injections", False)
+        object.__setattr__(self, "_injection_cache_dir", None)
+        object.__setattr__(self, "_clock", time.monotonic)
 
     @property
     def auto_detect_type_hints_locals(self) -> bool:
@@ -28,5 +45,48 @@ class ConfigImpl(Singleton):
             )
         object.__setattr__(self, "_auto_detect_type_hints_locals", value)
 
+    @property
+    def specialize_injections(self) -> bool:
+        return self._specialize_injections
+
+    @specialize_injections.setter
+    def specialize_injections(self, value: bool) -> None:
+        if not isinstance(value, bool):
+            raise TypeError(f"specialize_injections must be a boolean, not a {type(value)}.")
+        object.__setattr__(self, "_specialize_injections", value)
+
+    @property
+    def defer_injections(self) -> bool:
+        return self._defer_injections
+
+    @defer_injections.setter
+    def defer_injections(self, value: bool) -> None:
+        if not isinstance(value, bool):
+            raise TypeError(f"defer_injections must be a boolean, not a {type(value)}.")
+        object.__setattr__(self, "_defer_injections", value)
+
+    @property
+    def injection_cache_dir(self) -> Optional[str]:
+        return self._injection_cache_dir
+
+    @injection_cache_dir.setter
+    def injection_cache_dir(self, value: Union[str, "os.PathLike[str]", None]) -> None:
+        if not (value is None or isinstance(value, (str, os.PathLike))):
+            raise TypeError(
+                f"injection_cache_dir must be None or a path to a directory, not a {type(value)}."
+            )
+        path = None if value is None else os.fspath(value)
+        object.__setattr__(self, "_injection_cache_dir", path)
+
+    @property
+    def clock(self) -> Callable[[], float]:
+        return self._clock
+
+    @clock.setter
+    def clock(self, value: Callable[[], float]) -> None:
+        if not callable(value):
+            raise TypeError(f"clock must be callable, not a {type(value)}.")
+        object.__setattr__(self, "_clock", value)
+
 
 config = ConfigImpl()
@@ -54,7 +54,9 @@ class CachedMeta(type):
 
     def __call__(cls, *args: Any, **kwargs: Any) -> Any:
         instance = super().__call__(*args, **kwargs)
-        return cls.__cache.setdefault(instance, weakref.ref(instance))()
+        # The cached instance may be garbage collected by another thread in the meantime.
+        cached = cls.__cache.setdefault(instance, weakref.ref(instance))()
+        return instance if cached is None else cached
 
 
 @final
@@ -193,6 +195,18 @@ def enforce_valid_name(name: str) -> None:
         raise ValueError(f"name must match the regex {pattern!r}")
 
 
+def validate_ttl(ttl: object, serve_stale: object) -> float | None:
+    if not isinstance(serve_stale, bool):
+        raise TypeError(f"serve_stale must be a boolean, not a {type(serve_stale)!r}")
+    if ttl is None:
+        return None
+    if not isinstance(ttl, (int, float)) or isinstance(ttl, bool):
+        raise TypeError(f"ttl must be a number of seconds or None, not a {type(ttl)!r}")
+    if not ttl > 0:
+        raise ValueError(f"ttl must be strictly positive, not {ttl!r}")
+    return float(ttl)
+
+
 # Imitates @functools.wraps
 def wraps_frozen(__wrapped: object, signature: inspect.Signature | None = None) -> Callable[[T], T]:
     def f(wrapper: T) -> T:
@@ -25,6 +25,8 @@ from .._internal.typing import F, T
 from ._objects import app_catalog, inject, world
 from .annotation import InjectMe
 from .data import (
+    CacheInfo,
+    CacheLimit,
     CatalogId,
     DebugInfoPrefix,
     Dependency,
@@ -32,6 +34,9 @@ from .data import (
     dependencyOf,
     LifeTime,
     ParameterDependency,
+    PoolInfo,
+    PoolLimit,
+    ProviderRouting,
     TestContextKind,
 )
 from .exceptions import (
@@ -44,6 +49,7 @@ from .exceptions import (
     DuplicateProviderError,
     FrozenCatalogError,
     MissingProviderError,
+    PoolTimeoutError,
     UndefinedScopeVarError,
 )
 from .provider import ProvidedDependency, Provider, ProviderCatalog
@@ -56,6 +62,9 @@ if TYPE_CHECKING:
 
 __all__ = [
     "AntidoteError",
+    "CacheInfo",
+    "CacheLimit",
+    "CacheStore",
     "CannotInferDependencyError",
     "Catalog",
     "CatalogId",
@@ -78,9 +87,13 @@ __all__ = [
     "Missing",
     "MissingProviderError",
     "ParameterDependency",
+    "PoolInfo",
+    "PoolLimit",
+    "PoolTimeoutError",
     "ProvidedDependency",
     "Provider",
     "ProviderCatalog",
+    "ProviderRouting",
     "PublicCatalog",
     "ReadOnlyCatalog",
     "ScopeGlobalVar",
@@ -109,7 +122,10 @@ AnyNoArgsCallable = TypeVar("AnyNoArgsCallable", bound=Callable[[], object])
 # PUBLIC #
 ##########
 
-LifetimeType: TypeAlias = Union[Literal["singleton", "scoped", "transient"], LifeTime]
+LifetimeType: TypeAlias = Union[
+    Literal["singleton", "scoped", "transient", "weak", "thread", "pooled", "resolution", "loop"],
+    LifeTime,
+]
 TypeHintsLocals: TypeAlias = Union[Mapping[str, object], Literal["auto"], Default, None]
 
 
@@ -259,6 +275,71 @@ class ReadOnlyCatalog(DependencyAccessor, Protocol):
         """
         ...
 
+    @API.experimental
+    def get_many(self, __dependencies: Iterable[object], default: object = None) -> tuple[Any, ...]:
+        """
+        Returns the values of all the specified dependencies in the same order, equivalent to
+        calling :py:meth:`~.DependencyAccessor.get` for each of them. Missing dependencies are
+        replaced by *default*. It's faster than separate calls, as their retrieval shares the
+        same resolution context and locks.
+
+        .. doctest:: readonly_catalog_get_many
+
+            >>> from antidote import world, injectable
+            >>> @injectable
+            ... class Database:
+            ...     pass
+            >>> @injectable
+            ... class Cache:
+            ...     pass
+            >>> database, cache, unknown = world.get_many([Database, Cache, object()])
+            >>> database is world[Database] and cache is world[Cache]
+            True
+            >>> unknown is None
+            True
+
+        """
+        ...
+
+    # for @interface & @lazy & custom
+    @overload
+    def handle(self, __dependency: Dependency[T] | Type[instanceOf[T]]) -> Callable[[], T]:
+        ...
+
+    # for @injectable / @interface class
+    @overload
+    def handle(self, __dependency: Type[T]) -> Callable[[], T]:
+        ...
+
+    # for @interface function
+    @overload
+    def handle(self, __dependency: Callable[P, T]) -> Callable[[], Callable[P, T]]:
+        ...
+
+    @overload
+    def handle(self, __dependency: object) -> Callable[[], object]:
+        ...
+
+    @API.experimental
+    def handle(self, __dependency: Any) -> Callable[[], object]:
+        """
+        Returns a callable equivalent to :code:`catalog[dependency]`. The dependency is unwrapped
+        only once, which is useful when retrieving it repeatedly, in a loop for example. Test
+        environments are taken into account on each call.
+
+        .. doctest:: readonly_catalog_handle
+
+            >>> from antidote import world, injectable
+            >>> @injectable
+            ... class Service:
+            ...     pass
+            >>> service = world.handle(Service)
+            >>> service() is world[Service]
+            True
+
+        """
+        ...
+
     def debug(self, __obj: object, *, depth: int = -1) -> str:
         """
         If the object is a dependency that can be provided, a tree representation of all of its
@@ -286,6 +367,11 @@ class ReadOnlyCatalog(DependencyAccessor, Protocol):
             ∅ = transient
             ↻ = bound
             🟉 = singleton
+            ◌ = weak
+            ⇶ = thread
+            ⧉ = pooled
+            ⊚ = resolution
+            ∿ = loop
             <BLANKLINE>
 
         Args:
@@ -425,6 +511,101 @@ class Catalog(ReadOnlyCatalog, DependencyAccessor, Protocol):
         """
         ...
 
+    def evict(self, __dependency: object) -> bool:
+        """
+        Removes the value of the dependency kept by the catalog, if any, and returns whether it
+        was present. It will be created again on its next retrieval. Scope vars are never removed
+        and values of child catalogs can only be removed through them.
+
+        Scoped dependencies relying on an evicted scoped dependency are computed again. However,
+        values which were already injected elsewhere, into a singleton for example, are kept.
+
+        .. doctest:: core_catalog_evict
+
+            >>> from antidote import new_catalog, injectable
+            >>> catalog = new_catalog(name='my-catalog')
+            >>> @injectable(catalog=catalog)
+            ... class Service:
+            ...     pass
+            >>> service = catalog[Service]
+            >>> catalog.evict(Service)
+            True
+            >>> catalog[Service] is service
+            False
+
+        """
+        ...
+
+    def evict_where(self, __predicate: Callable[[Any], bool]) -> int:
+        """
+        Removes the values of all the dependencies kept by the catalog matching the predicate and
+        returns how many were removed. It behaves otherwise like :py:meth:`.evict`. The predicate
+        is called without holding any lock of the catalog.
+
+        .. doctest:: core_catalog_evict_where
+
+            >>> from antidote import new_catalog, lazy
+            >>> catalog = new_catalog(name='my-catalog')
+            >>> @lazy(catalog=catalog)
+            ... def load(name: str) -> str:
+            ...     return name.upper()
+            >>> catalog[load('a')], catalog[load('b')]
+            ('A', 'B')
+            >>> catalog.evict_where(load.is_call)
+            2
+
+        """
+        ...
+
+
+@API.experimental
+class CacheStore(Protocol):
+    """
+    Storage of the values kept by a catalog, such as singletons, which can be customized with the
+    :code:`cache_store` argument of :py:func:`.new_catalog`. A :py:class:`dict` is used by default
+    and remains the fastest option. Alternative stores can count hits and misses, limit their
+    size, etc.
+
+    Stored values are opaque and should be kept as is. A store may drop any entry at any time,
+    the value will just be computed again when needed. :py:meth:`.get` and
+    :py:meth:`.__contains__` may be called concurrently without any lock.
+
+    .. doctest:: core_cache_store
+
+        >>> from antidote import new_catalog, injectable
+        >>> class CountingStore(dict):
+        ...     hits = 0
+        ...     def get(self, key: object, default: object = None) -> object:
+        ...         value = super().get(key, default)
+        ...         if value is not default:
+        ...             CountingStore.hits += 1
+        ...         return value
+        >>> catalog = new_catalog(cache_store=CountingStore)
+        >>> @injectable(catalog=catalog)
+        ... class Service:
+        ...     pass
+        >>> catalog[Service] is catalog[Service]
+        True
+        >>> CountingStore.hits
+        1
+
+    """
+
+    def get(self, __key: object, __default: object) -> object:
+        ...
+
+    def setdefault(self, __key: object, __default: object) -> object:
+        ...
+
+    def pop(self, __key: object, __default: object) -> object:
+        ...
+
+    def __contains__(self, __key: object) -> bool:
+        ...
+
+    def items(self) -> Iterable[tuple[object, object]]:
+        ...
+
 
 @API.public
 @final
@@ -473,10 +654,18 @@ class PublicCatalog(Catalog, Protocol):
         """
         ...
 
-    def freeze(self) -> None:
+    def freeze(self, *, optimize: bool = False) -> None:
         """
         Freezes the catalog, no additional dependencies, child catalog or providers can be added.
-        Currently, it does not provide any performance improvements but may in the future.
+        Injected functions will retrieve singletons only once afterwards. All injections deferred
+        with :py:attr:`.Config.defer_injections` are also created, raising any error they may
+        have.
+
+        With :code:`optimize=True`, the catalog and all of its children are also prepared for
+        lookups: the index of their providers and child catalogs is built right away and
+        singletons provided by child catalogs are kept, once retrieved, by the catalog itself.
+        They're then returned directly, without any lock, as for its own singletons. Test
+        environments work as usual.
 
         .. doctest:: world_freeze
 
@@ -14,6 +14,7 @@ from typing import (
     Iterator,
     Mapping,
     overload,
+    Sequence,
     Type,
     TYPE_CHECKING,
     TypeVar,
@@ -25,7 +26,13 @@ from typing_extensions import final, Protocol, TypeAlias
 from .._internal import API, auto_detect_origin_frame, Default, Singleton
 from ..core.exceptions import DoubleInjectionError, DuplicateProviderError, FrozenCatalogError
 from ._debug import debug_str
-from ._raw import create_public_private, current_catalog_onion, is_catalog_onion
+from ._raw import (
+    build_pending_blueprints,
+    create_public_private,
+    current_catalog_onion,
+    is_catalog_onion,
+    NotFoundSentinel,
+)
 from ._test import Factory, TestContext, TestContextIdImpl
 from .data import DependencyDebug, dependencyOf, TestContextId, TestContextKind
 from .provider import Provider, ProviderCatalog
@@ -33,6 +40,7 @@ from .provider import Provider, ProviderCatalog
 if TYPE_CHECKING:
     from . import (
         AnyNoArgsCallable,
+        CacheStore,
         Catalog,
         CatalogId,
         CatalogOverride,
@@ -108,12 +116,20 @@ class CatalogOnionLayer(Protocol):
     def maybe_debug(self, dependency: object) -> DependencyDebug | None:
         ...
 
+    def optimize(self) -> None:
+        ...
+
     def __contains__(self, dependency: object) -> bool:
         ...
 
     def get(self, dependency: object, default: object) -> object:
         ...
 
+    def get_many(
+        self, dependencies: Sequence[object], defaults: Sequence[object]
+    ) -> tuple[object, ...]:
+        ...
+
     def register_scope_var(
         self,
         dependency: object,
@@ -125,6 +141,12 @@ class CatalogOnionLayer(Protocol):
     def update_scope_var(self, dependency: object, value: object) -> object:
         ...
 
+    def evict(self, dependency: object) -> bool:
+        ...
+
+    def evict_where(self, predicate: Callable[[object], bool]) -> int:
+        ...
+
 
 @API.private
 class CatalogSetupCallback(Protocol):
@@ -133,6 +155,49 @@ class CatalogSetupCallback(Protocol):
 
 
 _unique_ids = itertools.count()
+# Classes are by far the most common dependencies, so their unwrapping is only done once.
+_unwrapped_classes: weakref.WeakKeyDictionary[type, dependencyOf[Any]] = weakref.WeakKeyDictionary()
+
+
+@API.private
+def unwrap(dependency: Any) -> dependencyOf[Any]:
+    if isinstance(dependency, type):
+        try:
+            return _unwrapped_classes[dependency]
+        except KeyError:
+            unwrapped: dependencyOf[Any] = dependencyOf(dependency)
+            _unwrapped_classes[dependency] = unwrapped
+            return unwrapped
+    return dependencyOf(dependency)
+
+
+@API.private
+def unwrap_many(dependencies: Iterable[Any], default: object) -> tuple[list[object], list[object]]:
+    unwrapped = [unwrap(dependency) for dependency in dependencies]
+    return [d.wrapped for d in unwrapped], [
+        default if d.default is NotFoundSentinel else d.default for d in unwrapped
+    ]
+
+
+@API.private
+@final
+@dataclass(frozen=True, eq=False)
+class DependencyHandle:
+    """
+    Pre-unwrapped dependency returned by :py:meth:`.ReadOnlyCatalog.handle`. Without any onion,
+    the current app catalog is used.
+    """
+
+    __slots__ = ("dependency", "default", "onion")
+    dependency: object
+    default: object
+    onion: CatalogOnion | None
+
+    def __call__(self) -> Any:
+        onion = self.onion
+        if onion is None:
+            return current_catalog_onion.get().layer.get(self.dependency, self.default)
+        return onion.layer.get(self.dependency, self.default)
 
 
 @API.private
@@ -156,16 +221,23 @@ class AppCatalogProxy(Singleton):
         return f"AppProxy@{self.__layer!r}"
 
     def __contains__(self, __dependency: object) -> bool:
-        return dependencyOf(__dependency).wrapped in self.__layer
+        return unwrap(__dependency).wrapped in self.__layer
 
     def get(self, __dependency: Any, default: Any = None) -> Any:
-        d = dependencyOf[Any](__dependency, default=default)
-        return self.__layer.get(d.wrapped, d.default)
+        d = unwrap(__dependency)
+        return self.__layer.get(d.wrapped, default if d.default is NotFoundSentinel else d.default)
 
     def __getitem__(self, __dependency: Any) -> Any:
-        d = dependencyOf[Any](__dependency)
+        d = unwrap(__dependency)
         return self.__layer.get(d.wrapped, d.default)
 
+    def get_many(self, __dependencies: Iterable[Any], default: Any = None) -> Any:
+        return self.__layer.get_many(*unwrap_many(__dependencies, default))
+
+    def handle(self, __dependency: Any) -> Any:
+        d = unwrap(__dependency)
+        return DependencyHandle(d.wrapped, d.default, None)
+
     def debug(self, __obj: object, *, depth: int = -1) -> str:
         from ._debug import debug_str
 
@@ -195,11 +267,19 @@ class CatalogImpl:
         return next(_unique_ids)
 
     @classmethod
-    def create_public(cls, *, name: str) -> PublicCatalog:
+    def create_public(
+        cls,
+        *,
+        name: str,
+        thread_safe: bool = True,
+        cache_store: Callable[[], CacheStore] = dict,
+    ) -> PublicCatalog:
         lock = threading.RLock()
         public, private = create_public_private(
             public_name=name,
             private_name=f"{name}#private",
+            thread_safe=thread_safe,
+            cache_store=cache_store,
         )
         return CatalogImpl(onion=public, private=CatalogImpl(onion=private, lock=lock), lock=lock)
 
@@ -227,16 +307,25 @@ class CatalogImpl:
         return self.__private or self
 
     def __contains__(self, __dependency: object) -> bool:
-        return dependencyOf(__dependency).wrapped in self.onion.layer
+        return unwrap(__dependency).wrapped in self.onion.layer
 
     def get(self, __dependency: Any, default: Any = None) -> Any:
-        d = dependencyOf[Any](__dependency, default=default)
-        return self.onion.layer.get(d.wrapped, d.default)
+        d = unwrap(__dependency)
+        return self.onion.layer.get(
+            d.wrapped, default if d.default is NotFoundSentinel else d.default
+        )
 
     def __getitem__(self, __dependency: Any) -> Any:
-        d = dependencyOf[Any](__dependency)
+        d = unwrap(__dependency)
         return self.onion.layer.get(d.wrapped, d.default)
 
+    def get_many(self, __dependencies: Iterable[Any], default: Any = None) -> Any:
+        return self.onion.layer.get_many(*unwrap_many(__dependencies, default))
+
+    def handle(self, __dependency: Any) -> Any:
+        d = unwrap(__dependency)
+        return DependencyHandle(d.wrapped, d.default, self.onion)
+
     def debug(self, __obj: object, *, depth: int = -1) -> str:
         return debug_str(onion=self.onion, origin=__obj, max_depth=depth)
 
@@ -254,12 +343,26 @@ class CatalogImpl:
         if self.onion.layer.frozen:
             raise FrozenCatalogError(self)
 
-    def freeze(self) -> None:
+    def evict(self, __dependency: object) -> bool:
+        return self.onion.layer.evict(unwrap(__dependency).wrapped)
+
+    def evict_where(self, __predicate: Callable[[Any], bool]) -> int:
+        if not callable(__predicate):
+            raise TypeError(f"predicate must be callable, not a {type(__predicate)!r}")
+        return self.onion.layer.evict_where(__predicate)
+
+    def freeze(self, *, optimize: bool = False) -> None:
         if self.__private is None:  # private
             raise RuntimeError("Cannot be called on private Catalog")
+        if not isinstance(optimize, bool):
+            raise TypeError(f"optimize must be a boolean, not a {type(optimize)!r}")
         self.raise_if_frozen()
+        # Raises any error in the deferred injections before the catalog is used.
+        build_pending_blueprints(_recursive_onions(self.onion))
         with self.__lock:
             _recursive_freeze(self.onion)
+            if optimize:
+                _recursive_optimize(self.onion)
 
     @overload
     def include(self, __obj: Type[AnyProvider]) -> Type[AnyProvider]:
@@ -342,6 +445,17 @@ def _setup_override(
     private_onion.layer.frozen = private_previous.frozen if frozen is None else frozen
 
 
+def _recursive_onions(onion: CatalogOnion) -> set[CatalogOnion]:
+    onions = {onion}
+    private = onion.private
+    if private is not None:
+        onions |= _recursive_onions(private)
+
+    for child in onion.layer.children:
+        onions |= _recursive_onions(child)
+    return onions
+
+
 def _recursive_freeze(onion: CatalogOnion) -> None:
     onion.layer.frozen = True
     private = onion.private
@@ -352,6 +466,16 @@ def _recursive_freeze(onion: CatalogOnion) -> None:
         _recursive_freeze(child)
 
 
+def _recursive_optimize(onion: CatalogOnion) -> None:
+    for child in onion.layer.children:
+        _recursive_optimize(child)
+
+    private = onion.private
+    if private is not None:
+        _recursive_optimize(private)
+    onion.layer.optimize()
+
+
 OnionToLayerWeakRefs: TypeAlias = "dict[CatalogOnion, weakref.ReferenceType[CatalogOnionLayer]]"
 
 
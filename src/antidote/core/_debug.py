@@ -47,6 +47,11 @@ def scope_repr(lifetime: LifeTime | None) -> str:
             LifeTime.TRANSIENT: " ∅ ",
             LifeTime.SCOPED: " ↻ ",
             LifeTime.SINGLETON: " 🟉 ",
+            LifeTime.WEAK: " ◌ ",
+            LifeTime.THREAD: " ⇶ ",
+            LifeTime.POOLED: " ⧉ ",
+            LifeTime.RESOLUTION: " ⊚ ",
+            LifeTime.LOOP: " ∿ ",
         }[lifetime]
 
 
@@ -54,6 +59,11 @@ _LEGEND = f"""
 {scope_repr(LifeTime.TRANSIENT).strip()} = transient
 {scope_repr(LifeTime.SCOPED).strip()} = bound
 {scope_repr(LifeTime.SINGLETON).strip()} = singleton
+{scope_repr(LifeTime.WEAK).strip()} = weak
+{scope_repr(LifeTime.THREAD).strip()} = thread
+{scope_repr(LifeTime.POOLED).strip()} = pooled
+{scope_repr(LifeTime.RESOLUTION).strip()} = resolution
+{scope_repr(LifeTime.LOOP).strip()} = loop
 """
 
 
@@ -28,8 +28,15 @@ from .._internal import (
     retrieve_or_validate_injection_locals,
     Singleton,
 )
+from .._internal.config import config
 from ._catalog import AppCatalogProxy, CatalogImpl, CatalogOnion
-from ._injection import create_blueprint, InjectionParameters
+from ._injection import (
+    create_blueprint,
+    InjectionBlueprint,
+    InjectionParameters,
+    is_unbound_method,
+    unwrap_injectable_function,
+)
 from ._raw import rewrap, wrap
 from .data import Dependency, dependencyOf, ParameterDependency
 from .exceptions import CannotInferDependencyError
@@ -233,15 +240,8 @@ class InjectImpl(Singleton):
             hardwired = False
             maybe_app_catalog_onion = None
 
-        def decorate(
-            obj: AnyF,
-            kwargs: dict[str, object] | None = dict(kwargs) if kwargs is not None else None,
-        ) -> AnyF:
-            if inspect.isclass(obj):
-                # User-friendlier error for classes.
-                raise TypeError("Classes cannot be wrapped with @inject. Consider using @wire")
-
-            signature, parameters = InjectionParameters.of(
+        def build(obj: AnyF, *, deferred: bool) -> InjectionBlueprint | None:
+            parameters = InjectionParameters.of(
                 obj,
                 ignore_type_hints=ignore_type_hints,
                 type_hints_locals=tp_locals,
@@ -256,35 +256,67 @@ class InjectImpl(Singleton):
                     "Can only use @inject.method on methods, not static/class ones or functions."
                 )
 
-            if args is not None or kwargs is not None:
+            injected_kwargs = dict(kwargs) if kwargs is not None else None
+            if args is not None or injected_kwargs is not None:
+                signature = inspect.signature(unwrap_injectable_function(obj), follow_wrapped=False)
                 if args is not None and parameters.has_self:
                     signature = signature.replace(
                         parameters=list(signature.parameters.values())[1:]
                     )
 
                 # Shouldn't fail
-                signature.bind_partial(*(args or EMPTY_TUPLE), **(kwargs or EMPTY_DICT))
+                signature.bind_partial(*(args or EMPTY_TUPLE), **(injected_kwargs or EMPTY_DICT))
                 if args is not None:
-                    kwargs = kwargs or {}
+                    injected_kwargs = injected_kwargs or {}
                     for arg, parameter in zip(args, parameters.without_self):
                         if arg is not None:
-                            kwargs[parameter.name] = arg
+                            injected_kwargs[parameter.name] = arg
 
             maybe_blueprint = create_blueprint(
                 parameters=parameters,
                 fallback=fallback or {},
-                kwargs=kwargs or {},
+                kwargs=injected_kwargs or {},
                 ignore_defaults=ignore_defaults,
                 inject_self=_inject_self,
             )
-            # If nothing can be injected, just return the existing function without
-            # any overhead.
-            if maybe_blueprint is None:
-                return obj
+            if maybe_blueprint is None and deferred:
+                # Too late to return the original function, so nothing will be injected.
+                return InjectionBlueprint(
+                    injections=(),
+                    positional_arguments_count=parameters.positional_arguments_count,
+                    inject_self=False,
+                )
+            return maybe_blueprint
+
+        def decorate(obj: AnyF) -> AnyF:
+            if inspect.isclass(obj):
+                # User-friendlier error for classes.
+                raise TypeError("Classes cannot be wrapped with @inject. Consider using @wire")
+
+            if config.defer_injections:
+                # Only the checks which do not require any inspection are done eagerly.
+                unwrap_injectable_function(obj)
+                if _inject_self and (
+                    not is_unbound_method(obj) or isinstance(obj, (staticmethod, classmethod))
+                ):
+                    raise TypeError(
+                        "Can only use @inject.method on methods, not static/class ones or "
+                        "functions."
+                    )
+                blueprint: InjectionBlueprint | Callable[[], InjectionBlueprint] = cast(
+                    Callable[[], InjectionBlueprint], lambda: build(obj, deferred=True)
+                )
+            else:
+                maybe_blueprint = build(obj, deferred=False)
+                # If nothing can be injected, just return the existing function without
+                # any overhead.
+                if maybe_blueprint is None:
+                    return obj
+                blueprint = maybe_blueprint
 
             wrapper = wrap(
                 obj.__func__ if isinstance(obj, (classmethod, staticmethod)) else obj,
-                blueprint=maybe_blueprint,
+                blueprint=blueprint,
                 maybe_app_catalog_onion=maybe_app_catalog_onion,
                 hardwired=hardwired,
             )
@@ -7,7 +7,8 @@ from typing import Any, Callable, cast, Iterator, Mapping, Sequence, TYPE_CHECKI
 from typing_extensions import Annotated, final, get_origin, get_type_hints, TypeGuard
 
 from .._internal import API, is_optional, optional_value
-from ._raw import is_wrapper, NotFoundSentinel, unwrap
+from ._injection_cache import injection_cache
+from ._raw import is_wrapper, NotFoundSentinel
 from .data import Dependency, dependencyOf, ParameterDependency
 from .exceptions import CannotInferDependencyError, DoubleInjectionError
 
@@ -194,63 +195,43 @@ class InjectionParameters:
         *,
         ignore_type_hints: bool,
         type_hints_locals: Mapping[str, object] | None = None,
-    ) -> tuple[inspect.Signature, InjectionParameters]:
-        func = cast(
-            Callable[..., Any],
-            __obj.__func__ if isinstance(__obj, (staticmethod, classmethod)) else __obj,
-        )
-        func = inspect.unwrap(func, stop=is_wrapper)
-        __unwrapped__ = unwrap(func)
-        if __unwrapped__ is not None:
-            raise DoubleInjectionError(__unwrapped__[0])
-
-        if not inspect.isfunction(func):
-            raise TypeError(f"Object {func} is neither a function nor a (class/static) method")
-
-        if ignore_type_hints or (
+    ) -> InjectionParameters:
+        func = unwrap_injectable_function(__obj)
+        use_type_hints = not ignore_type_hints and not (
             len(func.__annotations__) <= 1
             and (not func.__annotations__ or next(iter(func.__annotations__.keys())) == "return")
-        ):
-            type_hints = {}
-            extra_type_hints = {}
-        else:
-            localns = dict(type_hints_locals) if type_hints_locals is not None else None
-            type_hints = get_type_hints(func, localns=localns)
-            extra_type_hints = get_type_hints(func, localns=localns, include_extras=True)
-
-        positional_arguments_count = 0
-        kw_only_arguments = False
-        parameters: list[InjectionParameter] = []
-        signature = inspect.signature(func, follow_wrapped=False)
-        for name, parameter in signature.parameters.items():
-            if parameter.kind in KW_ONLY_PARAMETERS:
-                kw_only_arguments = True
-
-            if not kw_only_arguments:
-                positional_arguments_count += 1
-
-            if parameter.kind in KW_PARAMETERS:
-                parameters.append(
-                    InjectionParameter(
-                        name=name,
-                        default=parameter.default,
-                        type_hint=type_hints.get(name),
-                        type_hint_with_extras=extra_type_hints.get(name),
-                        to_ignore=False,
-                    )
+        )
+        cached = injection_cache.load(
+            func, type_hints=use_type_hints, type_hints_locals=type_hints_locals
+        )
+        if cached is not None:
+            positional_arguments_count, cached_parameters = cached
+            defaults = _defaults(func)
+            parameters = [
+                InjectionParameter(
+                    name=name,
+                    default=defaults.get(name, inspect.Parameter.empty),
+                    type_hint=type_hint,
+                    type_hint_with_extras=type_hint,
+                    to_ignore=to_ignore,
                 )
-            elif not kw_only_arguments:
-                parameters.append(
-                    InjectionParameter(
-                        name=name,
-                        default=parameter.default,
-                        type_hint=None,
-                        type_hint_with_extras=None,
-                        to_ignore=True,
-                    )
+                for name, to_ignore, type_hint in cached_parameters
+            ]
+        else:
+            positional_arguments_count, parameters = _inspect_parameters(
+                func, use_type_hints=use_type_hints, type_hints_locals=type_hints_locals
+            )
+            # Extras, from Annotated, are not supported.
+            if all(p.type_hint == p.type_hint_with_extras for p in parameters):
+                injection_cache.store(
+                    func,
+                    type_hints=use_type_hints,
+                    type_hints_locals=type_hints_locals,
+                    positional_arguments_count=positional_arguments_count,
+                    parameters=[(p.name, p.to_ignore, p.type_hint) for p in parameters],
                 )
 
-        return signature, InjectionParameters(
+        return InjectionParameters(
             positional_arguments_count=positional_arguments_count,
             parameters=tuple(parameters),
             has_self=is_unbound_method(cast(Any, __obj)),
@@ -274,6 +255,89 @@ class InjectionParameters:
         return iter(self._parameters)
 
 
+@API.private
+def _inspect_parameters(
+    func: Callable[..., Any],
+    *,
+    use_type_hints: bool,
+    type_hints_locals: Mapping[str, object] | None,
+) -> tuple[int, list[InjectionParameter]]:
+    if use_type_hints:
+        localns = dict(type_hints_locals) if type_hints_locals is not None else None
+        type_hints = get_type_hints(func, localns=localns)
+        extra_type_hints = get_type_hints(func, localns=localns, include_extras=True)
+    else:
+        type_hints = {}
+        extra_type_hints = {}
+
+    positional_arguments_count = 0
+    kw_only_arguments = False
+    parameters: list[InjectionParameter] = []
+    signature = inspect.signature(func, follow_wrapped=False)
+    for name, parameter in signature.parameters.items():
+        if parameter.kind in KW_ONLY_PARAMETERS:
+            kw_only_arguments = True
+
+        if not kw_only_arguments:
+            positional_arguments_count += 1
+
+        if parameter.kind in KW_PARAMETERS:
+            parameters.append(
+                InjectionParameter(
+                    name=name,
+                    default=parameter.default,
+                    type_hint=type_hints.get(name),
+                    type_hint_with_extras=extra_type_hints.get(name),
+                    to_ignore=False,
+                )
+            )
+        elif not kw_only_arguments:
+            parameters.append(
+                InjectionParameter(
+                    name=name,
+                    default=parameter.default,
+                    type_hint=None,
+                    type_hint_with_extras=None,
+                    to_ignore=True,
+                )
+            )
+    return positional_arguments_count, parameters
+
+
+@API.private
+def _defaults(func: Callable[..., Any]) -> dict[str, object]:
+    """
+    Default values of all arguments, retrieved directly from the function as
+    :py:func:`inspect.signature` would.
+    """
+    code = func.__code__
+    defaults: tuple[object, ...] = func.__defaults__ or ()
+    positional = code.co_varnames[: code.co_argcount]
+    first_default = len(positional) - len(defaults)
+    result: dict[str, object] = dict(zip(positional[first_default:], defaults))
+    result.update(func.__kwdefaults__ or {})
+    return result
+
+
+@API.private
+def unwrap_injectable_function(__obj: object) -> Callable[..., Any]:
+    """
+    Retrieves the underlying function to inject and checks whether it can be, without any
+    inspection of its signature or type hints.
+    """
+    func = cast(
+        Callable[..., Any],
+        __obj.__func__ if isinstance(__obj, (staticmethod, classmethod)) else __obj,
+    )
+    func = inspect.unwrap(func, stop=is_wrapper)
+    if is_wrapper(func):
+        raise DoubleInjectionError(func.__antidote_wrapped__)
+
+    if not inspect.isfunction(func):
+        raise TypeError(f"Object {func} is neither a function nor a (class/static) method")
+    return func
+
+
 @API.private
 def is_unbound_method(func: Callable[..., object] | staticmethod[Any] | classmethod[Any]) -> bool:
     """
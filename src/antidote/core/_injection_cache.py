@@ -0,0 +1,329 @@
+from __future__ import annotations
+
+import atexit
+import hashlib
+import importlib
+import json
+import marshal
+import os
+import sys
+import tempfile
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Mapping, Optional, Sequence
+
+from typing_extensions import final
+
+from .._internal import API, is_optional, optional_value
+from .._internal.config import config
+
+__all__ = ["InjectionCache", "injection_cache"]
+
+# Must be changed whenever the format of the stored entries changes.
+_FORMAT_VERSION = 2
+_OPTIONAL_PREFIX = "?"
+
+
+@API.private
+class _Uncacheable(Exception):
+    pass
+
+
+@API.private
+@final
+@dataclass(eq=False)
+class _ModuleEntries:
+    """
+    Cached entries of a single module, stored in a single file. All of them are discarded as soon
+    as the module source file changes.
+    """
+
+    __slots__ = ("path", "mtime_ns", "size", "entries", "dirty")
+    path: str
+    mtime_ns: int
+    size: int
+    entries: dict[str, Any]
+    dirty: bool
+
+
+@API.private
+@final
+class InjectionCache:
+    """
+    Persistent cache of the parameters of injected functions, avoiding the costly
+    :py:func:`inspect.signature` and :py:func:`typing.get_type_hints` on each start. Each function
+    is identified by the digest of its code object and each module file by its modification time
+    and size. Type hints are stored as import paths, so only classes, optionally wrapped in
+    :py:obj:`~typing.Optional`, that can be imported back are supported. Anything else is simply
+    not cached. Each entry also records the modification time and size of the modules defining
+    its type hints, so that a type hint resolving to another class after an edit of those is
+    detected.
+
+    Entries are loaded lazily per module and all new ones are written once at exit, or explicitly
+    with :py:meth:`.save`.
+    """
+
+    __slots__ = ("__lock", "__directory", "__modules", "__fingerprints", "__save_registered")
+    __directory: Optional[str]
+    __modules: dict[str, Optional[_ModuleEntries]]
+    __fingerprints: dict[str, Optional[list[int]]]
+    __save_registered: bool
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__directory = None
+        self.__modules = {}
+        self.__fingerprints = {}
+        self.__save_registered = False
+
+    def load(
+        self,
+        func: Callable[..., Any],
+        *,
+        type_hints: bool,
+        type_hints_locals: Mapping[str, object] | None,
+    ) -> Optional[tuple[int, list[tuple[str, bool, Any]]]]:
+        """
+        Returns the positional arguments count and for each parameter its name, whether it must
+        be ignored and its type hint. :py:obj:`None` is returned if there is no valid entry.
+        """
+        module = self.__module_entries(func)
+        if module is None:
+            return None
+        key = _entry_key(func, type_hints, type_hints_locals)
+        entry = module.entries.get(key) if key is not None else None
+        if entry is None:
+            return None
+        try:
+            parameters = [
+                (name, to_ignore, _decode(type_hint)) for name, to_ignore, type_hint in entry[1]
+            ]
+        except _Uncacheable:
+            # Stale, one of the type hints doesn't exist anymore.
+            return None
+        for module_name, fingerprint in entry[2].items():
+            if self.__fingerprint(module_name) != fingerprint:
+                # Stale, a type hint may resolve to another class now.
+                return None
+        return entry[0], parameters
+
+    def store(
+        self,
+        func: Callable[..., Any],
+        *,
+        type_hints: bool,
+        type_hints_locals: Mapping[str, object] | None,
+        positional_arguments_count: int,
+        parameters: Sequence[tuple[str, bool, Any]],
+    ) -> None:
+        module = self.__module_entries(func)
+        if module is None:
+            return
+        key = _entry_key(func, type_hints, type_hints_locals)
+        if key is None:
+            return
+        try:
+            encoded: list[list[Any]] = [
+                [name, to_ignore, _encode(type_hint)] for name, to_ignore, type_hint in parameters
+            ]
+        except _Uncacheable:
+            return
+        # The module of the function itself is already checked for the whole file.
+        dependencies = {
+            module_name: self.__fingerprint(module_name)
+            for module_name in sorted(
+                {_module_name(path) for _, _, path in encoded if path is not None}
+            )
+            if module_name != func.__module__
+        }
+        entry = [positional_arguments_count, encoded, dependencies]
+        with self.__lock:
+            module.entries[key] = entry
+            module.dirty = True
+            if not self.__save_registered:
+                self.__save_registered = True
+                atexit.register(self.save)
+
+    def save(self) -> None:
+        """
+        Writes all modified modules entries. Each file is replaced atomically, so concurrent
+        processes at worst lose some entries.
+        """
+        with self.__lock:
+            directory = self.__directory
+            modules = [m for m in self.__modules.values() if m is not None and m.dirty]
+            for module in modules:
+                module.dirty = False
+        if directory is None:
+            return
+
+        for module in modules:
+            data = {
+                "format": _FORMAT_VERSION,
+                "python": sys.version,
+                "path": module.path,
+                "mtime_ns": module.mtime_ns,
+                "size": module.size,
+                "entries": module.entries,
+            }
+            try:
+                os.makedirs(directory, exist_ok=True)
+                fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+                with os.fdopen(fd, "w") as file:
+                    json.dump(data, file)
+                os.replace(tmp, _cache_file(directory, module.path))
+            except OSError:  # pragma: no cover
+                # The cache is only an optimization.
+                pass
+
+    def __fingerprint(self, module_name: str) -> Optional[list[int]]:
+        # Computed once per process, a module is never re-executed on its own.
+        with self.__lock:
+            try:
+                return self.__fingerprints[module_name]
+            except KeyError:
+                pass
+            fingerprint: Optional[list[int]] = None
+            path: Optional[str] = getattr(sys.modules.get(module_name), "__file__", None)
+            if path is not None:
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    pass
+                else:
+                    fingerprint = [stat.st_mtime_ns, stat.st_size]
+            self.__fingerprints[module_name] = fingerprint
+            return fingerprint
+
+    def __module_entries(self, func: Callable[..., Any]) -> Optional[_ModuleEntries]:
+        directory = config.injection_cache_dir
+        if directory is None:
+            return None
+
+        with self.__lock:
+            if directory != self.__directory:
+                self.__directory = directory
+                self.__modules = {}
+            module_name: str = func.__module__
+            try:
+                return self.__modules[module_name]
+            except KeyError:
+                pass
+
+            module = sys.modules.get(module_name)
+            path: Optional[str] = getattr(module, "__file__", None)
+            entries: Optional[_ModuleEntries] = None
+            if path is not None:
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    pass
+                else:
+                    entries = _ModuleEntries(
+                        path=path,
+                        mtime_ns=stat.st_mtime_ns,
+                        size=stat.st_size,
+                        entries=_read_entries(directory, path, stat),
+                        dirty=False,
+                    )
+            self.__modules[module_name] = entries
+            return entries
+
+
+@API.private
+def _read_entries(directory: str, path: str, stat: os.stat_result) -> dict[str, Any]:
+    try:
+        with open(_cache_file(directory, path)) as file:
+            data = json.load(file)
+    except (OSError, ValueError):
+        return {}
+    if (
+        not isinstance(data, dict)
+        or data.get("format") != _FORMAT_VERSION
+        or data.get("python") != sys.version
+        or data.get("path") != path
+        or data.get("mtime_ns") != stat.st_mtime_ns
+        or data.get("size") != stat.st_size
+        or not isinstance(data.get("entries"), dict)
+    ):
+        # stale
+        return {}
+    entries: dict[str, Any] = data["entries"]
+    return entries
+
+
+@API.private
+def _cache_file(directory: str, path: str) -> str:
+    digest = hashlib.sha1(path.encode()).hexdigest()[:16]
+    name = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(directory, f"{name}-{digest}.json")
+
+
+@API.private
+def _entry_key(
+    func: Callable[..., Any], type_hints: bool, type_hints_locals: Mapping[str, object] | None
+) -> Optional[str]:
+    # An explicit __signature__ would be used by inspect.signature.
+    if hasattr(func, "__signature__"):
+        return None
+
+    locals_fingerprint = ""
+    if type_hints and type_hints_locals is not None:
+        if type_hints_locals is not getattr(func, "__globals__", None):
+            # Locals must be deterministic for the entry to be valid in another process, which is
+            # the case for classes. Typically, they're the class being wired itself.
+            names = []
+            for name, value in sorted(type_hints_locals.items()):
+                if not isinstance(value, type):
+                    return None
+                names.append(f"{name}={value.__module__}:{value.__qualname__}")
+            locals_fingerprint = ",".join(names)
+
+    digest = hashlib.sha1(marshal.dumps(func.__code__))
+    digest.update(locals_fingerprint.encode())
+    return f"{digest.hexdigest()}:{int(type_hints)}"
+
+
+@API.private
+def _encode(type_hint: object) -> Optional[str]:
+    if type_hint is None:
+        return None
+    prefix = ""
+    if is_optional(type_hint):
+        type_hint = optional_value(type_hint)
+        prefix = _OPTIONAL_PREFIX
+    if not isinstance(type_hint, type):
+        raise _Uncacheable()
+    path = f"{type_hint.__module__}:{type_hint.__qualname__}"
+    if _decode(path) is not type_hint:
+        raise _Uncacheable()
+    return prefix + path
+
+
+@API.private
+def _module_name(path: str) -> str:
+    return path.lstrip(_OPTIONAL_PREFIX).partition(":")[0]
+
+
+@API.private
+def _decode(path: Optional[str]) -> Any:
+    if path is None:
+        return None
+    if path.startswith(_OPTIONAL_PREFIX):
+        start = len(_OPTIONAL_PREFIX)
+        return Optional[_decode(path[start:])]  # type: ignore
+
+    module_name, _, qualname = path.partition(":")
+    try:
+        obj: Any = sys.modules.get(module_name) or importlib.import_module(module_name)
+        for attr in qualname.split("."):
+            obj = getattr(obj, attr)
+    except Exception:
+        raise _Uncacheable()
+    # The class may have been replaced by another one with the same name.
+    if not isinstance(obj, type) or obj.__module__ != module_name or obj.__qualname__ != qualname:
+        raise _Uncacheable()
+    return obj
+
+
+injection_cache = InjectionCache()
@@ -7,10 +7,20 @@ from typing import Any, Awaitable, Callable, cast, TYPE_CHECKING, TypeVar
 from typing_extensions import ParamSpec, TypeGuard
 
 from ..._internal import API, Default
+from ..._internal.config import config
+from .codegen import specialize
 from .onion import CatalogOnionImpl, NotFoundSentinel
-from .wrapper import current_catalog_onion, InjectedWrapper
+from .wrapper import (
+    build_pending_blueprints,
+    current_catalog_onion,
+    InjectedBoundWrapper,
+    InjectedWrapper,
+    PendingBlueprint,
+    update_blueprint,
+)
 
 if TYPE_CHECKING:
+    from .. import CacheStore
     from .._catalog import CatalogOnion
     from .._injection import InjectionBlueprint
 
@@ -24,6 +34,7 @@ __all__ = [
     "compiled",
     "is_catalog_onion",
     "NotFoundSentinel",
+    "build_pending_blueprints",
 ]
 
 P = ParamSpec("P")
@@ -35,10 +46,17 @@ compiled = False
 
 @API.private
 def create_public_private(
-    *, public_name: str, private_name: str
+    *,
+    public_name: str,
+    private_name: str,
+    thread_safe: bool = True,
+    cache_store: Callable[[], CacheStore] = dict,
 ) -> tuple[CatalogOnion, CatalogOnion]:
     return CatalogOnionImpl.create_public_private(
-        public_name=public_name, private_name=private_name
+        public_name=public_name,
+        private_name=private_name,
+        thread_safe=thread_safe,
+        cache_store=cache_store,
     )
 
 
@@ -46,19 +64,31 @@ def create_public_private(
 def wrap(
     wrapped: F,
     *,
-    blueprint: InjectionBlueprint,
+    blueprint: InjectionBlueprint | Callable[[], InjectionBlueprint],
     maybe_app_catalog_onion: CatalogOnion | None,
     hardwired: bool,
 ) -> F:
+    """
+    If a callable is given as blueprint, it'll only be called the first time the blueprint is
+    needed or when calling :py:func:`.build_pending_blueprints`.
+    """
+    from .._injection import InjectionBlueprint
     from .wrapper import AsyncInjectedWrapper, SyncInjectedWrapper
 
     assert maybe_app_catalog_onion is None or isinstance(maybe_app_catalog_onion, CatalogOnionImpl)
+    should_specialize = config.specialize_injections and inspect.isfunction(wrapped)
+    initial: InjectionBlueprint | PendingBlueprint
+    if isinstance(blueprint, InjectionBlueprint):
+        initial = blueprint
+    else:
+        initial = PendingBlueprint(factory=blueprint, specialize=should_specialize, updates=())
+        should_specialize = False
 
     if inspect.iscoroutinefunction(wrapped):
-        out: object = AsyncInjectedWrapper(
+        out: InjectedWrapper = AsyncInjectedWrapper(
             __wrapped__=wrapped,
             maybe_app_catalog_onion=maybe_app_catalog_onion,
-            blueprint=blueprint,
+            blueprint=initial,
             wrapped=cast(Callable[..., Awaitable[object]], wrapped),
             hardwired=hardwired,
         )
@@ -66,11 +96,14 @@ def wrap(
         out = SyncInjectedWrapper(
             __wrapped__=wrapped,
             maybe_app_catalog_onion=maybe_app_catalog_onion,
-            blueprint=blueprint,
+            blueprint=initial,
             wrapped=wrapped,
             hardwired=hardwired,
         )
 
+    if should_specialize:
+        specialize(out)
+
     return cast(F, out)
 
 
@@ -104,20 +137,20 @@ def rewrap(
         if not wrapper.__antidote_hardwired__:
             wrapper.__antidote_maybe_app_catalog_onion__ = maybe_app_catalog_onion
         if inject_self is not Default.sentinel:
-            if wrapper.__antidote_blueprint__.inject_self != inject_self:
-                wrapper.__antidote_blueprint__ = dataclasses.replace(
-                    wrapper.__antidote_blueprint__, inject_self=inject_self
-                )
+
+            def update(blueprint: InjectionBlueprint) -> InjectionBlueprint:
+                if blueprint.inject_self != inject_self:
+                    return dataclasses.replace(blueprint, inject_self=inject_self)
+                return blueprint
+
+            update_blueprint(wrapper, update)
 
 
 @API.private
 def is_wrapper(x: object) -> TypeGuard[InjectedWrapper]:
-    # Cannot use isinstance as we're overriding __class__. It doesn't work in Python 3.7 but did
-    # work in 3.10.
-    from .._injection import InjectionBlueprint
-
-    maybe_blueprint = getattr(x, "__antidote_blueprint__", None)
-    return maybe_blueprint is not None and isinstance(maybe_blueprint, InjectionBlueprint)
+    # Cannot use isinstance as we're overriding __class__, but type() still returns the real class.
+    # The blueprint must not be accessed, it would force the creation of deferred ones.
+    return issubclass(type(x), (InjectedWrapper, InjectedBoundWrapper))
 
 
 @API.private
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import functools
+import inspect
+import keyword
+from typing import Any, Callable, TYPE_CHECKING
+
+from ..._internal import API
+from .onion import (
+    ContextRequiredSentinel,
+    current_context,
+    NotFoundSentinel,
+    ProvideContext,
+    release_after,
+)
+
+if TYPE_CHECKING:
+    from .._injection import InjectionBlueprint
+    from .wrapper import InjectedWrapper
+
+__all__ = ["create_trampoline", "specialize", "MissingArgument"]
+
+# Default value of all injected arguments in the generated function. When provided explicitly for
+# the first argument, it also means that self must be injected.
+MissingArgument = object()
+_PREFIX = "__antidote_"
+
+
+@API.private
+def create_trampoline(
+    wrapper: InjectedWrapper, wrapped: Callable[..., Any]
+) -> Callable[..., Any] | None:
+    """
+    Generates, similarly to :py:mod:`dataclasses`, a function specialized for the blueprint of the
+    wrapper. It has the same signature as the wrapped function with the injected arguments
+    defaulting to :py:obj:`MissingArgument`. Dependencies are only retrieved if any of those is
+    missing, so calls specifying all arguments explicitly add close to no overhead.
+
+    The dependencies and their defaults are baked into the generated function, so it must be
+    re-generated whenever the blueprint changes. The app catalog is read from the wrapper on each
+    call as it may change with :py:meth:`.Inject.rewire`.
+
+    Returns :py:obj:`None` if the function cannot be specialized, the generic injection being used
+    instead.
+    """
+    from .wrapper import current_catalog_onion
+
+    blueprint: InjectionBlueprint = wrapper.__antidote_blueprint__
+    try:
+        signature = inspect.signature(inspect.unwrap(wrapped), follow_wrapped=False)
+    except (TypeError, ValueError):  # pragma: no cover
+        return None
+
+    parameters = list(signature.parameters.values())
+    if any(p.name.startswith(_PREFIX) for p in parameters):
+        return None
+    if blueprint.inject_self and (
+        not parameters or parameters[0].kind is not inspect.Parameter.POSITIONAL_OR_KEYWORD
+    ):
+        return None  # pragma: no cover
+
+    injections = {
+        injection.arg_name: (i, injection)
+        for i, injection in enumerate(blueprint.injections)
+        if injection.dependency is not None or (blueprint.inject_self and i == 0)
+    }
+    namespace: dict[str, object] = {
+        f"{_PREFIX}wrapper": wrapper,
+        f"{_PREFIX}wrapped": wrapped,
+        f"{_PREFIX}missing": MissingArgument,
+        f"{_PREFIX}not_found": NotFoundSentinel,
+        f"{_PREFIX}injections": blueprint.injections,
+        f"{_PREFIX}context_required": ContextRequiredSentinel,
+        f"{_PREFIX}current_catalog_onion": current_catalog_onion,
+        f"{_PREFIX}current_context": current_context,
+        f"{_PREFIX}new_context": functools.partial(
+            ProvideContext, blocking=not wrapper.__antidote_async__, restartable=True
+        ),
+        f"{_PREFIX}release_after": release_after,
+    }
+
+    args: list[str] = []
+    call_args: list[str] = []
+    injected: list[str] = []
+    previous_kind: Any = None
+    has_default = False
+    for parameter in parameters:
+        name = parameter.name
+        kind = parameter.kind
+        if previous_kind is inspect.Parameter.POSITIONAL_ONLY and kind is not previous_kind:
+            args.append("/")
+        previous_kind = kind
+
+        if kind is inspect.Parameter.VAR_POSITIONAL:
+            args.append(f"*{name}")
+            call_args.append(f"*{name}")
+            continue
+        if kind is inspect.Parameter.VAR_KEYWORD:
+            args.append(f"**{name}")
+            call_args.append(f"**{name}")
+            continue
+        if kind is inspect.Parameter.KEYWORD_ONLY:
+            if not any(a.startswith("*") for a in args):
+                args.append("*")
+            call_args.append(f"{name}={name}")
+        else:
+            call_args.append(name)
+
+        if name in injections:
+            injected.append(name)
+            if blueprint.inject_self and len(args) == 0:
+                # self is always provided, possibly with MissingArgument.
+                args.append(name)
+            else:
+                args.append(f"{name}={_PREFIX}missing")
+                has_default = True
+        elif parameter.default is not inspect.Parameter.empty:
+            namespace[f"{_PREFIX}default_{name}"] = parameter.default
+            args.append(f"{name}={_PREFIX}default_{name}")
+            has_default = True
+        elif has_default and kind is not inspect.Parameter.KEYWORD_ONLY:
+            # An injected argument followed by a mandatory positional one cannot be expressed.
+            return None
+        else:
+            args.append(name)
+    if previous_kind is inspect.Parameter.POSITIONAL_ONLY:
+        args.append("/")
+
+    # Every injected argument must be part of the signature, otherwise something's wrong.
+    if len(injected) != len(injections):  # pragma: no cover
+        return None
+
+    func_name = wrapped.__name__
+    if not func_name.isidentifier() or keyword.iskeyword(func_name):
+        func_name = f"{_PREFIX}trampoline"
+    call = f"return {_PREFIX}wrapped({', '.join(call_args)})"
+    if wrapper.__antidote_async__:
+        # Pooled values borrowed by the call are given back once the coroutine is finished.
+        injected_call = [
+            f"            {_PREFIX}result = {_PREFIX}wrapped({', '.join(call_args)})",
+            f"            if {_PREFIX}context_token is not None and {_PREFIX}context.leases:",
+            f"                return {_PREFIX}release_after({_PREFIX}result, "
+            f"{_PREFIX}context.take_leases())",
+            f"            return {_PREFIX}result",
+        ]
+    else:
+        injected_call = [
+            f"            if {_PREFIX}context_token is not None:",
+            f"                {_PREFIX}context.restartable = False",
+            f"            {call}",
+        ]
+    lines = [f"def {func_name}({', '.join(args)}):"]
+    if injected:
+        lines += [
+            f"    if {' or '.join(f'{name} is {_PREFIX}missing' for name in injected)}:",
+            f"        {_PREFIX}onion_token = None",
+            f"        {_PREFIX}context_token = None",
+            f"        {_PREFIX}onion = {_PREFIX}wrapper.__antidote_maybe_app_catalog_onion__",
+            f"        if {_PREFIX}onion is None:",
+            f"            {_PREFIX}layer = {_PREFIX}current_catalog_onion.get().layer",
+            "        else:",
+            f"            if {_PREFIX}current_catalog_onion.get(None) is not {_PREFIX}onion:",
+            f"                {_PREFIX}onion_token = {_PREFIX}current_catalog_onion.set("
+            f"{_PREFIX}onion)",
+            f"            {_PREFIX}layer = {_PREFIX}onion.layer",
+            f"        {_PREFIX}values = None",
+            f"        if {_PREFIX}layer.frozen:",
+            f"            {_PREFIX}previous = {_PREFIX}wrapper.__antidote_prebound__",
+            f"            {_PREFIX}prebound = {_PREFIX}layer.prebind({_PREFIX}injections, "
+            f"{_PREFIX}previous)",
+            f"            if {_PREFIX}prebound is not {_PREFIX}previous:",
+            f"                {_PREFIX}wrapper.__antidote_prebound__ = {_PREFIX}prebound",
+            f"            if {_PREFIX}prebound is not None:",
+            f"                {_PREFIX}values = {_PREFIX}prebound.values",
+            f"        {_PREFIX}context = {_PREFIX}current_context.get(None)",
+            "        try:",
+        ]
+        for name in injected:
+            i, injection = injections[name]
+            namespace[f"{_PREFIX}dependency_{i}"] = injection.dependency
+            namespace[f"{_PREFIX}default_{i}"] = injection.default
+            provide = (
+                f"{_PREFIX}layer.provide({_PREFIX}dependency_{i}, {_PREFIX}default_{i}, "
+                f"{_PREFIX}context)"
+            )
+            lines += [
+                f"            if {name} is {_PREFIX}missing:",
+                f"                {name} = {_PREFIX}not_found if {_PREFIX}values is None "
+                f"else {_PREFIX}values[{i}]",
+                f"                if {name} is {_PREFIX}not_found:",
+                f"                    {name} = {provide}",
+                f"                    if {name} is {_PREFIX}context_required:",
+                f"                        {_PREFIX}context = {_PREFIX}new_context()",
+                f"                        {_PREFIX}context_token = {_PREFIX}current_context.set("
+                f"{_PREFIX}context)",
+                f"                        {name} = {provide}",
+            ]
+        lines += injected_call
+        lines += [
+            "        finally:",
+            f"            if {_PREFIX}onion_token is not None:",
+            f"                {_PREFIX}current_catalog_onion.reset({_PREFIX}onion_token)",
+            f"            if {_PREFIX}context_token is not None:",
+            f"                {_PREFIX}current_context.reset({_PREFIX}context_token)",
+            f"                {_PREFIX}context.release()",
+        ]
+    lines.append(f"    {call}")
+
+    exec("\n".join(lines), namespace)
+    trampoline: Callable[..., Any] = namespace[func_name]  # type: ignore
+    trampoline.__qualname__ = wrapped.__qualname__
+    return trampoline
+
+
+@API.private
+def specialize(wrapper: InjectedWrapper) -> None:
+    """
+    (Re-)generates the specialized functions of the wrapper, one for direct calls and one for
+    bound methods which expects the instance as first argument.
+    """
+    trampoline = create_trampoline(wrapper, wrapper.__antidote_wrapped__)
+    wrapper.__antidote_method_trampoline__ = trampoline
+    if trampoline is not None and wrapper.__antidote_blueprint__.inject_self:
+        trampoline = functools.partial(trampoline, MissingArgument)
+    wrapper.__antidote_trampoline__ = trampoline
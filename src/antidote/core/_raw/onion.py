@@ -1,84 +1,488 @@
 from __future__ import annotations
 
+import inspect
 import threading
+import time
 import weakref
+from abc import abstractmethod
+from collections import OrderedDict
 from contextlib import ExitStack
-from contextvars import ContextVar, copy_context
+from contextvars import ContextVar
 from dataclasses import dataclass, field
-from typing import Callable, Sequence, TYPE_CHECKING, TypeVar
+from itertools import repeat
+from typing import (
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    cast,
+    Collection,
+    Coroutine,
+    Iterable,
+    Sequence,
+    TYPE_CHECKING,
+    TypeVar,
+)
 
 from typing_extensions import final
 
-from ..._internal import API, debug_repr, Default
+from ..._internal import API, debug_repr, Default, validate_ttl
+from ..._internal.config import config
 from ..._internal.typing import Function
-from ..data import CatalogId, DependencyDebug, LifeTime, TestContextId
+from ..data import (
+    CacheLimit,
+    CatalogId,
+    DependencyDebug,
+    LifeTime,
+    PoolLimit,
+    ProviderRouting,
+    TestContextId,
+)
 from ..exceptions import (
     DependencyDefinitionError,
     DependencyNotFoundError,
     DuplicateDependencyError,
     FrozenCatalogError,
+    PoolTimeoutError,
     UndefinedScopeVarError,
 )
 
 if TYPE_CHECKING:
+    import asyncio
+
+    from .. import CacheStore
     from .._catalog import CatalogOnion, CatalogOnionLayer
+    from .._injection import Injection
     from .._test import TestContext
     from ..provider import Provider, ProviderCatalog
 
-__all__ = ["CatalogOnionImpl", "current_context", "NotFoundSentinel", "ProvideContext"]
+__all__ = [
+    "CatalogOnionImpl",
+    "ContextRequiredSentinel",
+    "current_context",
+    "give_back",
+    "NotFoundSentinel",
+    "PoolUnavailable",
+    "PreboundValues",
+    "ProvideContext",
+    "release_after",
+    "RestartResolution",
+]
 
 current_context: ContextVar[ProvideContext] = ContextVar("current_context")
 
 T = TypeVar("T")
 NotFoundSentinel = object()
 ChildNotFoundSentinel = object()
+# Returned by provide() when no context was given and the value cannot be retrieved without one.
+ContextRequiredSentinel = object()
+# Lifetimes for which the catalog doesn't decide when the value is discarded.
+_UNBOUNDED_LIFETIMES = frozenset(
+    {
+        LifeTime.TRANSIENT,
+        LifeTime.WEAK,
+        LifeTime.THREAD,
+        LifeTime.POOLED,
+        LifeTime.RESOLUTION,
+        LifeTime.LOOP,
+    }
+)
+_POOLED_OUTSIDE_INJECTION = (
+    "Pooled dependencies can only be retrieved within an injected call, "
+    "which returns the value to its pool once finished."
+)
+
+
+# Incremented whenever a layer is added to or removed from any onion. Negative caches are only
+# valid as long as it doesn't change, as the layers of the children or public onion may change.
+_layers_epoch = 0
+# Maximum number of dependencies remembered as missing by each layer. Dynamic keys, such as lazy
+# calls, would otherwise grow the negative cache without any bound.
+_MAX_MISSING = 1024
+# Only used to detect deadlocks, protected by _waits_lock: what each waiting thread is blocked on,
+# a Flight or a layer lock, and which thread holds each layer lock acquired through a
+# ProvideContext. Each thread checks for a deadlock before blocking, so the last one closing a
+# cycle always detects it.
+_waits_lock = threading.Lock()
+_blocked_on: dict[int, object] = {}
+_lock_owners: dict[object, int] = {}
+_DEADLOCK = (
+    "Retrieving {} would deadlock: another thread needs, directly or not, a dependency being "
+    "created or a lock held by the current one. It cannot be retried once the injected function "
+    "is running."
+)
+
+
+@API.private
+@final
+class Flight:
+    """
+    Construction of a dependency value by a single thread, the owner. Other threads needing the
+    same dependency wait for it to finish instead of creating it concurrently.
+    """
+
+    __slots__ = ("owner", "done")
+    owner: int
+    done: threading.Event
+
+    def __init__(self) -> None:
+        self.owner = threading.get_ident()
+        self.done = threading.Event()
+
+    def wait(self, dependency: object, context: ProvideContext) -> None:
+        """
+        Waits for the construction to finish. Raises if it never would, typically because the
+        owner needs a lock held by the current thread.
+        """
+        _block_on(self, dependency, context)
+        try:
+            self.done.wait()
+        finally:
+            _unblock()
+
+
+@API.private
+@final
+class SingleThreadLock:
+    """
+    Replaces the locks of the layers of catalogs created with :code:`thread_safe=False`, see
+    :py:class:`.LayerLocks`. Nothing is locked, but when assertions are enabled it checks that the
+    catalog is only used by a single thread.
+    """
+
+    __slots__ = ("__owner",)
+    __owner: int | None
+
+    def __init__(self) -> None:
+        self.__owner = None
+
+    def check(self) -> None:
+        if __debug__:
+            me = threading.get_ident()
+            owner = self.__owner
+            if owner is None:
+                self.__owner = me
+            elif owner != me:
+                raise RuntimeError(
+                    "Catalog created with thread_safe=False used by multiple threads. "
+                    f"Owner {owner}, current {me}."
+                )
+
+    def __enter__(self) -> None:
+        self.check()
+
+    def __exit__(self, *args: object) -> None:
+        pass
+
+    def acquire(self, dependency: object, context: ProvideContext) -> None:
+        self.check()
+
+    def start_flight(
+        self, cache: CacheStore, dependency: object, context: ProvideContext
+    ) -> tuple[object, Flight | None]:
+        self.check()
+        return NotFoundSentinel, None
+
+    def end_flight(self, dependency: object, flight: Flight | None) -> None:
+        pass
+
+
+@API.private
+@final
+class LayerLocks:
+    """
+    Locks of the layers of thread-safe catalogs, sharing the interface of
+    :py:class:`.SingleThreadLock`. The layer lock is held by resolutions relying on mutable
+    state, such as scoped dependencies, until they're finished. The single-flight ensures that
+    only one thread creates the value of a given dependency, the others waiting for it. Unrelated
+    dependencies are created concurrently.
+    """
+
+    __slots__ = ("lock", "flights_lock", "__flights")
+    lock: threading.RLock
+    flights_lock: threading.Lock
+    __flights: dict[object, Flight]
+
+    def __init__(self, lock: threading.RLock) -> None:
+        self.lock = lock
+        self.flights_lock = threading.Lock()
+        self.__flights = {}
+
+    def acquire(self, dependency: object, context: ProvideContext) -> None:
+        context.acquire(self.lock, dependency)
+
+    def start_flight(
+        self, cache: CacheStore, dependency: object, context: ProvideContext
+    ) -> tuple[object, Flight | None]:
+        """
+        Returns either the value or cache entry created in the meantime, or NotFoundSentinel with
+        the flight to end once the value is created. There is no flight for a recursive resolution
+        of the same dependency.
+        """
+        me = threading.get_ident()
+        while True:
+            with self.flights_lock:
+                cached = cache.get(dependency, NotFoundSentinel)
+                if isinstance(cached, LocalCache):
+                    cached = cached.get()
+                if cached is not NotFoundSentinel:
+                    return cached, None
+                other = self.__flights.get(dependency)
+                if other is None:
+                    flight = self.__flights[dependency] = Flight()
+                    return NotFoundSentinel, flight
+                if other.owner == me:
+                    return NotFoundSentinel, None
+            other.wait(dependency, context)
+
+    def end_flight(self, dependency: object, flight: Flight | None) -> None:
+        if flight is not None:
+            with self.flights_lock:
+                del self.__flights[dependency]
+            flight.done.set()
+
+
+@API.private
+def _block_on(
+    blocker: Flight | threading.RLock, dependency: object, context: ProvideContext
+) -> None:
+    """
+    Registers the current thread as blocked on a Flight or a layer lock. If it would deadlock,
+    the resolution is started again once everything is released, or fails if it's not possible.
+    """
+    me = threading.get_ident()
+    with _waits_lock:
+        if not _would_deadlock(blocker, me):
+            _blocked_on[me] = blocker
+            return
+    if context.restartable:
+        raise Deadlock(blocker)
+    raise RuntimeError(_DEADLOCK.format(debug_repr(dependency)))
+
+
+@API.private
+def _unblock() -> None:
+    with _waits_lock:
+        del _blocked_on[threading.get_ident()]
+
+
+@API.private
+def _would_deadlock(blocker: object, me: int) -> bool:
+    """
+    Must be called with _waits_lock.
+    """
+    seen: set[int] = set()
+    while True:
+        owner = blocker.owner if isinstance(blocker, Flight) else _lock_owners.get(blocker)
+        if owner is None:
+            return False
+        if owner == me:
+            return True
+        if owner in seen:  # deadlock not involving the current thread
+            return False
+        seen.add(owner)
+        next_blocker = _blocked_on.get(owner)
+        if next_blocker is None:
+            return False
+        blocker = next_blocker
+
+
+@API.private
+@final
+class ProviderRouter:
+    """
+    Index of the providers of a layer based on their :py:meth:`.Provider.routing`, used to only
+    call those which may provide a dependency. Providers without any routing are always
+    candidates. Keys are only enumerated once frozen, before they're checked one provider at a
+    time.
+    """
+
+    __slots__ = ("providers", "frozen", "__routings", "__keyed", "__by_type", "__by_key")
+    providers: tuple[Provider, ...]
+    frozen: bool
+    __routings: tuple[tuple[Provider, ProviderRouting | None], ...]
+    __keyed: tuple[tuple[Provider, Collection[object]], ...]
+    __by_type: dict[type, tuple[Provider, ...]]
+    __by_key: dict[object, tuple[Provider, ...]] | None
+
+    def __init__(self, providers: tuple[Provider, ...], *, frozen: bool) -> None:
+        self.providers = providers
+        self.frozen = frozen
+        routings = []
+        for provider in providers:
+            routing = provider.routing()
+            if routing is not None and not isinstance(routing, ProviderRouting):
+                raise TypeError(
+                    f"{type(provider)!r}.routing() must return a ProviderRouting or None, "
+                    f"not a {type(routing)!r}"
+                )
+            routings.append((provider, routing))
+        self.__routings = tuple(routings)
+        self.__keyed = tuple(
+            (provider, routing.keys) for provider, routing in routings if routing is not None
+        )
+        self.__by_type = {}
+        self.__by_key = None
+        if frozen:
+            by_key: dict[object, tuple[Provider, ...]] = {}
+            for provider, keys in self.__keyed:
+                for key in keys:
+                    by_key[key] = by_key.get(key, ()) + (provider,)
+            self.__by_key = by_key
+
+    def candidates(self, dependency: object) -> tuple[Provider, ...]:
+        cls = type(dependency)
+        typed = self.__by_type.get(cls)
+        if typed is None:
+            typed = tuple(
+                provider
+                for provider, routing in self.__routings
+                if routing is None or issubclass(cls, routing.types)
+            )
+            self.__by_type[cls] = typed
+
+        by_key = self.__by_key
+        if by_key is not None:
+            keyed = by_key.get(dependency)
+            if keyed is None:
+                return typed
+        else:
+            keyed = ()
+            for provider, keys in self.__keyed:
+                if dependency in keys:
+                    keyed += (provider,)
+            if not keyed:
+                return typed
+        return typed + tuple(provider for provider in keyed if provider not in typed)
+
+    def routing(self) -> ProviderRouting | None:
+        """
+        Combined routing of all the providers once frozen, :py:obj:`None` if any of them may
+        provide anything.
+        """
+        assert self.__by_key is not None
+        if any(routing is None for _, routing in self.__routings):
+            return None
+        types = [t for _, routing in self.__routings if routing is not None for t in routing.types]
+        return ProviderRouting(types=tuple(dict.fromkeys(types)), keys=self.__by_key.keys())
+
+
+@API.private
+@final
+class ChildrenRouter:
+    """
+    Index of the children of a frozen layer, used to only look into those which may provide a
+    dependency. Children whose dependencies aren't known in advance, because they're not frozen,
+    have a test context or a provider without routing, are always candidates. It's bound to the
+    layers epoch as any child may get a new layer.
+    """
+
+    __slots__ = ("children", "epoch", "__routings", "__by_type", "__by_key")
+    children: tuple[CatalogOnionImpl, ...]
+    epoch: int
+    __routings: tuple[tuple[CatalogOnionImpl, ProviderRouting | None], ...]
+    __by_type: dict[type, tuple[CatalogOnionImpl, ...]]
+    __by_key: dict[object, tuple[CatalogOnionImpl, ...]]
+
+    def __init__(
+        self,
+        routings: Sequence[tuple[CatalogOnionImpl, ProviderRouting | None]],
+        *,
+        epoch: int,
+    ) -> None:
+        self.children = tuple(child for child, _ in routings)
+        self.epoch = epoch
+        self.__routings = tuple(routings)
+        self.__by_type = {}
+        self.__by_key = {}
+        for child, routing in routings:
+            if routing is not None:
+                for key in routing.keys:
+                    self.__by_key[key] = self.__by_key.get(key, ()) + (child,)
+
+    def candidates(self, dependency: object) -> tuple[CatalogOnionImpl, ...]:
+        cls = type(dependency)
+        typed = self.__by_type.get(cls)
+        if typed is None:
+            typed = tuple(
+                child
+                for child, routing in self.__routings
+                if routing is None or issubclass(cls, routing.types)
+            )
+            self.__by_type[cls] = typed
+
+        keyed = self.__by_key.get(dependency)
+        if keyed is None:
+            return typed
+        # Preserving the order of the children
+        return tuple(child for child in self.children if child in typed or child in keyed)
 
 
 @dataclass(frozen=True)
 class CacheOverrideBuilder:
-    original: dict[object, object]
+    original: CacheStore
+    original_scope_vars: dict[object, ScopeVarCache]
     keep_values: bool
     old_to_override: dict[ScopeVarCache, ScopeVarCache] = field(default_factory=dict)
     finalizers: list[Callable[[], None]] = field(default_factory=list)
 
     @classmethod
-    def copy(cls, original: dict[object, object], keep_values: bool) -> dict[object, object]:
+    def copy(
+        cls,
+        original: CacheStore,
+        original_scope_vars: dict[object, ScopeVarCache],
+        keep_values: bool,
+        store: CacheStore,
+    ) -> dict[object, ScopeVarCache]:
+        """
+        Fills the store with the copied values and returns the copied scope vars.
+        """
         return CacheOverrideBuilder(
             original=original,
+            original_scope_vars=original_scope_vars,
             keep_values=keep_values,
-        ).build()
+        ).build(store)
 
-    def build(self) -> dict[object, object]:
-        result: dict[object, object] = {}
+    def build(self, store: CacheStore) -> dict[object, ScopeVarCache]:
         copy_scope_var = self.__copy_var
+        scope_vars = {
+            dependency: copy_scope_var(scope_var)
+            for dependency, scope_var in self.original_scope_vars.items()
+        }
+        for dependency, scope_var in scope_vars.items():
+            store.setdefault(dependency, scope_var)
 
         if self.keep_values:
-            for dependency, value in self.original.items():
-                if not isinstance(value, Cache):
-                    result[dependency] = value
+            for dependency, value in list(self.original.items()):
+                if not isinstance(value, Cache) or isinstance(
+                    value, (TransientCache, ResolutionCache, BoundedCache, WeakCache)
+                ):
+                    store.setdefault(dependency, value)
                 elif isinstance(value, ScopedCache):
-                    result[dependency] = ScopedCache(
-                        value=value.value,
-                        callback=value.callback,
-                        scope_vars_vtime=[
-                            (copy_scope_var(scope_var), vtime)
-                            for scope_var, vtime in value.scope_vars_vtime
-                        ],
+                    store.setdefault(
+                        dependency,
+                        ScopedCache(
+                            value=value.value,
+                            callback=value.callback,
+                            scope_vars_vtime=[
+                                (copy_scope_var(scope_var), vtime)
+                                for scope_var, vtime in value.scope_vars_vtime
+                            ],
+                            expiry=None
+                            if value.expiry is None
+                            else cast(ExpiryCache, copy_scope_var(value.expiry)),
+                            version=copy_scope_var(value.version),
+                            limit=value.limit,
+                        ),
                     )
-                else:
-                    assert isinstance(value, ScopeVarCache)
-                    result[dependency] = copy_scope_var(value)
-        else:
-            for dependency, value in self.original.items():
-                if isinstance(value, ScopeVarCache):
-                    result[dependency] = copy_scope_var(value)
 
-        return result
+        return scope_vars
 
     def __copy_var(self, scope_var: ScopeVarCache) -> ScopeVarCache:
         try:
             return self.old_to_override[scope_var]
         except KeyError:
+            if isinstance(scope_var, (ExpiryCache, VersionCache)):
+                return self.old_to_override.setdefault(scope_var, scope_var.copy())
             assert isinstance(scope_var, ScopeGlobalVarCache)
             copy = ScopeGlobalVarCache(default=scope_var.default)
             if self.keep_values:
@@ -93,28 +497,87 @@ class CacheOverrideBuilder:
 class ProvideContext:
     __slots__ = (
         "scope_vars_stack",
-        "release_stack",
+        "locks",
         "current_value",
         "current_cache",
+        "leasing",
+        "blocking",
+        "restartable",
+        "leases",
+        "resolved",
     )
     scope_vars_stack: list[list[ScopeVarCache]]
-    release_stack: list[Callable[[], None]]
+    locks: list[threading.RLock]
     current_value: object
     current_cache: object
+    # Whether pooled values can be borrowed, only possible if they're returned by the injected call
+    # which created this context once it's finished.
+    leasing: bool
+    # Whether borrowing a pooled value may block, otherwise PoolUnavailable is raised.
+    blocking: bool
+    # Whether the resolution can be started again by whoever created this context after releasing
+    # it, until the injected function itself is called. Rather than waiting with layer locks held
+    # for a pooled value, PoolUnavailable is then raised, as threads holding the pooled values may
+    # need them. Deadlocks are also solved by restarting the resolution, failing otherwise.
+    restartable: bool
+    leases: list[tuple[PooledCache, object]] | None
+    # Values of the resolution dependencies, shared until the context is released.
+    resolved: dict[ResolutionCache, object] | None
 
-    def __init__(self) -> None:
+    def __init__(
+        self, *, leasing: bool = True, blocking: bool = True, restartable: bool = False
+    ) -> None:
         self.scope_vars_stack = []
-        self.release_stack = []
+        self.locks = []
         self.current_value = NotFoundSentinel
         self.current_cache = NotFoundSentinel
-
-    def acquire(self, lock: threading.RLock) -> None:
-        lock.acquire()
-        self.release_stack.append(lock.release)
+        self.leasing = leasing
+        self.blocking = blocking
+        self.restartable = restartable
+        self.leases = None
+        self.resolved = None
+
+    def acquire(self, lock: threading.RLock, dependency: object) -> None:
+        if not lock.acquire(blocking=False):
+            _block_on(lock, dependency, self)
+            try:
+                lock.acquire()
+            finally:
+                _unblock()
+        with _waits_lock:
+            _lock_owners[lock] = threading.get_ident()
+        self.locks.append(lock)
 
     def release(self) -> None:
-        for release in reversed(self.release_stack):
-            release()
+        locks = self.locks
+        if locks:
+            with _waits_lock:
+                for lock in locks:
+                    _lock_owners.pop(lock, None)
+            for lock in reversed(locks):
+                lock.release()
+        self.resolved = None
+        leases = self.leases
+        if leases is not None:
+            self.leases = None
+            give_back(leases)
+
+    def take_leases(self) -> list[tuple[PooledCache, object]]:
+        leases = self.leases or []
+        self.leases = None
+        return leases
+
+    def share(self, resolution: ResolutionCache, value: object) -> object:
+        resolved = self.resolved
+        if resolved is None:
+            resolved = self.resolved = {}
+        return resolved.setdefault(resolution, value)
+
+    def lease(self, pool: PooledCache, value: object) -> None:
+        if self.leases is None:
+            self.leases = [(pool, value)]
+        else:
+            self.leases.append((pool, value))
 
     def stack_push(self) -> None:
         assert (
@@ -135,9 +598,63 @@ class ProvideContext:
         *,
         lifetime: LifeTime,
         callback: Callable[[], T] | None = None,
+        ttl: float | None = None,
+        serve_stale: bool = False,
+        limit: CacheLimit | None = None,
+        finalizer: Callable[[T], object] | None = None,
+        pool: PoolLimit | None = None,
     ) -> None:
         if self.current_value is not NotFoundSentinel or self.current_cache is not NotFoundSentinel:
             raise DependencyDefinitionError("Cannot define twice a dependency value")
+        if pool is not None:
+            if not isinstance(pool, PoolLimit):
+                raise TypeError(f"pool must be a PoolLimit or None, not a {type(pool)!r}")
+            if lifetime is not LifeTime.POOLED:
+                raise DependencyDefinitionError("Only pooled dependencies can have a pool")
+        if finalizer is not None:
+            if not callable(finalizer):
+                raise TypeError(f"finalizer must be callable, not a {type(finalizer)!r}")
+            if lifetime is not LifeTime.THREAD and lifetime is not LifeTime.LOOP:
+                raise DependencyDefinitionError(
+                    "Only thread and loop dependencies can have a finalizer"
+                )
+        if limit is not None:
+            if not isinstance(limit, CacheLimit):
+                raise TypeError(f"limit must be a CacheLimit or None, not a {type(limit)!r}")
+            if lifetime in _UNBOUNDED_LIFETIMES:
+                raise DependencyDefinitionError(
+                    f"{lifetime.name.title()} dependencies cannot have a limit"
+                )
+
+        ttl = validate_ttl(ttl, serve_stale)
+        if ttl is not None:
+            if lifetime in _UNBOUNDED_LIFETIMES:
+                raise DependencyDefinitionError(
+                    f"{lifetime.name.title()} dependencies cannot have a ttl"
+                )
+            if not callable(callback):
+                raise DependencyDefinitionError(
+                    "Callback must be provided for a dependency with a ttl"
+                )
+            if lifetime is LifeTime.SINGLETON and self.scope_vars_stack[-1]:
+                raise DependencyDefinitionError(
+                    "Singletons cannot depend on any scope var or scoped dependency, "
+                    "directly or not."
+                )
+            # Expiring values are handled like scoped ones, the expiry being an additional scope
+            # var so that scoped dependencies relying on it are also computed again.
+            expiry = ExpiryCache(ttl=ttl, serve_stale=serve_stale)
+            self.scope_vars_stack[-1].append(expiry)
+            self.current_value = value
+            self.current_cache = ScopedCache(
+                value=value,
+                callback=callback,
+                scope_vars_vtime=[(dep, dep.vtime) for dep in self.scope_vars_stack[-1]],
+                expiry=expiry,
+                version=expiry,
+                limit=limit,
+            )
+            return
 
         self.current_value = value
         if lifetime is LifeTime.TRANSIENT:
@@ -151,10 +668,15 @@ class ProvideContext:
                     "No scope vars were detected. "
                     "Consider defining a singleton or transient dependency instead."
                 )
+            version = VersionCache()
+            self.scope_vars_stack[-1].append(version)
             self.current_cache = ScopedCache(
                 value=value,
                 callback=callback,
                 scope_vars_vtime=[(dep, dep.vtime) for dep in self.scope_vars_stack[-1]],
+                expiry=None,
+                version=version,
+                limit=limit,
             )
         elif lifetime is LifeTime.SINGLETON:
             if self.scope_vars_stack[-1]:
@@ -162,7 +684,64 @@ class ProvideContext:
                     "Singletons cannot depend on any scope var or scoped dependency, "
                     "directly or not."
                 )
-            self.current_cache = value
+            self.current_cache = value if limit is None else BoundedCache(value=value, limit=limit)
+        elif lifetime is LifeTime.WEAK:
+            if self.scope_vars_stack[-1]:
+                raise DependencyDefinitionError(
+                    "Weak dependencies cannot depend on any scope var or scoped dependency, "
+                    "directly or not."
+                )
+            try:
+                ref: weakref.ReferenceType[object] = weakref.ref(cast(object, value))
+            except TypeError:
+                raise DependencyDefinitionError(
+                    f"Weak dependency values must support weak references, not {type(value)!r}"
+                ) from None
+            self.current_cache = WeakCache(ref=ref)
+        elif lifetime is LifeTime.THREAD:
+            if self.scope_vars_stack[-1]:
+                raise DependencyDefinitionError(
+                    "Thread dependencies cannot depend on any scope var or scoped dependency, "
+                    "directly or not."
+                )
+            # The value is only stored once the cache entry of the layer is known.
+            self.current_cache = ThreadLocalCache(
+                local=threading.local(),
+                finalizer=cast(Callable[[object], object], finalizer),
+            )
+        elif lifetime is LifeTime.POOLED:
+            if pool is None:
+                raise DependencyDefinitionError("Pooled dependencies require a pool")
+            if not callable(callback):
+                raise DependencyDefinitionError("Callback must be provided for a pooled dependency")
+            if self.scope_vars_stack[-1]:
+                raise DependencyDefinitionError(
+                    "Pooled dependencies cannot depend on any scope var or scoped dependency, "
+                    "directly or not."
+                )
+            # The value is only leased once the pool of the layer is known.
+            self.current_cache = PooledCache(limit=pool, callback=callback)
+        elif lifetime is LifeTime.RESOLUTION:
+            if not callable(callback):
+                raise DependencyDefinitionError(
+                    "Callback must be provided for a resolution dependency"
+                )
+            if self.scope_vars_stack[-1]:
+                raise DependencyDefinitionError(
+                    "Resolution dependencies cannot depend on any scope var or scoped dependency, "
+                    "directly or not."
+                )
+            # The value is only shared once the cache entry of the layer is known.
+            self.current_cache = ResolutionCache(callback=callback)
+        elif lifetime is LifeTime.LOOP:
+            if self.scope_vars_stack[-1]:
+                raise DependencyDefinitionError(
+                    "Loop dependencies cannot depend on any scope var or scoped dependency, "
+                    "directly or not."
+                )
+            _running_loop()
+            # The value is only stored once the cache entry of the layer is known.
+            self.current_cache = LoopCache(finalizer=cast(Callable[[object], object], finalizer))
         else:
             raise TypeError(f"lifetime must be a Scope instance, not a {type(lifetime)!r}")
 
@@ -219,13 +798,30 @@ class CatalogOnionImpl:
 
     @classmethod
     def create_public_private(
-        cls, *, public_name: str, private_name: str
+        cls,
+        *,
+        public_name: str,
+        private_name: str,
+        thread_safe: bool = True,
+        cache_store: Callable[[], CacheStore] = dict,
     ) -> tuple[CatalogOnion, CatalogOnion]:
         private = CatalogOnionImpl(name=private_name)
         public = CatalogOnionImpl(name=public_name, private=private)
-        public.__layers.append(CatalogOnionLayerImpl(onion_ref=weakref.ref(public), public=None))
+        public.__layers.append(
+            CatalogOnionLayerImpl(
+                onion_ref=weakref.ref(public),
+                public=None,
+                lock=None if thread_safe else SingleThreadLock(),
+                cache_store=cache_store,
+            )
+        )
         private.__layers.append(
-            CatalogOnionLayerImpl(onion_ref=weakref.ref(private), public=public.__layers[-1])
+            CatalogOnionLayerImpl(
+                onion_ref=weakref.ref(private),
+                public=public.__layers[-1],
+                lock=None if thread_safe else SingleThreadLock(),
+                cache_store=cache_store,
+            )
         )
         return public, private
 
@@ -259,8 +855,10 @@ class CatalogOnionImpl:
         exit_stack: ExitStack,
     ) -> None:
         assert self.private is not None, "Cannot be called on private CatalogOnion"
+        global _layers_epoch
         # Ensuring no other thread modifies the layers now.
         exit_stack.enter_context(self.__layers_lock)
+        _layers_epoch += 1
         previous = self.__layers[-1]
         self.__layers.append(
             previous.clone(
@@ -283,6 +881,8 @@ class CatalogOnionImpl:
         exit_stack.callback(self.__peel_layer)
 
     def __peel_layer(self) -> None:
+        global _layers_epoch
+        _layers_epoch += 1
         self.__layers.pop()
         assert self.__layers
 
@@ -306,8 +906,21 @@ class CatalogOnionLayerImpl:
         "__children",
         "__public",
         "__cache",
+        "__cache_store",
+        "__scope_vars",
         "__vtime",
         "__lock",
+        "__locks",
+        "__flights_lock",
+        "__missing",
+        "__missing_epoch",
+        "__router",
+        "__children_router",
+        "__flat",
+        "__flat_epoch",
+        "__flat_version",
+        "__flatteners",
+        "__lru",
     )
     frozen: bool
     providers: tuple[Provider, ...]
@@ -318,9 +931,24 @@ class CatalogOnionLayerImpl:
     __public: CatalogOnionLayerImpl | None
     __children: tuple[CatalogOnionImpl, ...]
     __test_context: TestContext | None
-    __cache: dict[object, object]
+    __cache: CacheStore
+    __cache_store: Callable[[], CacheStore]
+    __scope_vars: dict[object, ScopeVarCache]
     __vtime: int
-    __lock: threading.RLock
+    __lock: threading.RLock | SingleThreadLock
+    __locks: LayerLocks | SingleThreadLock
+    __flights_lock: threading.Lock | SingleThreadLock
+    __missing: OrderedDict[object, None]
+    __missing_epoch: int
+    __router: ProviderRouter | None
+    __children_router: ChildrenRouter | None
+    __flat: dict[object, object] | None
+    __flat_epoch: int
+    __flat_version: int
+    # Layers which flattened singletons of this one, by id as layers aren't hashable.
+    __flatteners: weakref.WeakValueDictionary[int, CatalogOnionLayerImpl]
+    # Dependencies with a limit, the least recently used first.
+    __lru: dict[CacheLimit, OrderedDict[object, None]]
 
     def clone(
         self,
@@ -330,19 +958,31 @@ class CatalogOnionLayerImpl:
         test_context: TestContext,
         public: CatalogOnionLayerImpl | None,
     ) -> CatalogOnionLayerImpl:
+        cache = self.__cache_store()
         if keep_scope_vars:
-            cache: dict[object, object] = CacheOverrideBuilder.copy(
+            scope_vars = CacheOverrideBuilder.copy(
                 original=self.__cache,
+                original_scope_vars=self.__scope_vars,
                 keep_values=keep_values,
+                store=cache,
             )
         else:
-            cache = {}
+            scope_vars = {}
+
+        lru: dict[CacheLimit, OrderedDict[object, None]] = {}
+        if keep_values:
+            with self.__flights_lock:
+                for limit, order in self.__lru.items():
+                    lru[limit] = OrderedDict((d, None) for d in order if d in cache)
 
         return CatalogOnionLayerImpl(
             onion_ref=self.__onion_ref,
             lock=self.__lock,
             test_context=test_context,
             cache=cache,
+            cache_store=self.__cache_store,
+            scope_vars=scope_vars,
+            lru=lru,
             public=public,
         )
 
@@ -351,9 +991,12 @@ class CatalogOnionLayerImpl:
         *,
         onion_ref: Callable[[], CatalogOnionImpl | None],
         public: CatalogOnionLayerImpl | None,
-        lock: threading.RLock | None = None,
+        lock: threading.RLock | SingleThreadLock | None = None,
         test_context: TestContext | None = None,
-        cache: dict[object, object] | None = None,
+        cache: CacheStore | None = None,
+        cache_store: Callable[[], CacheStore] = dict,
+        scope_vars: dict[object, ScopeVarCache] | None = None,
+        lru: dict[CacheLimit, OrderedDict[object, None]] | None = None,
     ) -> None:
         self.providers = ()
         self.frozen = False
@@ -361,8 +1004,25 @@ class CatalogOnionLayerImpl:
         self.__parent_ref = lambda: None
         self.__children = ()
         self.__vtime = 0
-        self.__cache = cache if cache is not None else {}
-        self.__lock = lock or threading.RLock()
+        self.__cache = cache if cache is not None else cache_store()
+        self.__cache_store = cache_store
+        # Scope vars are also kept outside of the cache store, which may drop them.
+        self.__scope_vars = scope_vars if scope_vars is not None else {}
+        if isinstance(lock, SingleThreadLock):
+            self.__lock = self.__locks = self.__flights_lock = lock
+        else:
+            self.__lock = lock or threading.RLock()
+            self.__locks = LayerLocks(self.__lock)
+            self.__flights_lock = self.__locks.flights_lock
+        self.__missing = OrderedDict()
+        self.__missing_epoch = _layers_epoch
+        self.__router = None
+        self.__children_router = None
+        self.__flat = None
+        self.__flat_epoch = _layers_epoch
+        self.__flat_version = 0
+        self.__flatteners = weakref.WeakValueDictionary()
+        self.__lru = lru if lru is not None else {}
         self.__test_context = test_context
         self.__onion_ref = onion_ref
         self.__public = public
@@ -425,12 +1085,12 @@ class CatalogOnionLayerImpl:
             if out is not None:
                 return out
 
-        for provider in self.providers:
+        for provider in self.__candidates(dependency):
             out = provider.maybe_debug(dependency)
             if isinstance(out, DependencyDebug):
                 return out
 
-        if isinstance(self.__cache.get(dependency, NotFoundSentinel), ScopeVarCache):
+        if dependency in self.__scope_vars:
             return DependencyDebug(description=debug_repr(dependency), lifetime=None)
 
         if self.__public is not None:
@@ -438,7 +1098,7 @@ class CatalogOnionLayerImpl:
             if out is not None:
                 return out
 
-        for child_onion in self.__children:
+        for child_onion in self.__children_candidates(dependency):
             out = child_onion.layer.maybe_debug(dependency)
             if out is not None:
                 return out
@@ -453,32 +1113,119 @@ class CatalogOnionLayerImpl:
             if dependency in test_context:
                 return True
 
+        if self.__is_missing(dependency):
+            return False
+
         public = self.__public
-        return (
+        found = (
             dependency in self.__cache
-            or any(p.can_provide(dependency) for p in self.providers)
+            or dependency in self.__scope_vars
+            or any(p.can_provide(dependency) for p in self.__candidates(dependency))
             or (public is not None and dependency in public)
-            or any(dependency in child.layer for child in self.__children)
+            or any(dependency in child.layer for child in self.__children_candidates(dependency))
         )
+        if not found:
+            self.__add_missing(dependency)
+        return found
 
     def get(self, dependency: object, default: object) -> object:
-        return copy_context().run(self._get, dependency, default)
-
-    def _get(self, dependency: object, default: object) -> object:
         context: ProvideContext | None = current_context.get(None)
-        if context is None:
-            context = ProvideContext()
+        if context is not None:
+            return self.provide(dependency, default, context)
+        value = self.provide(dependency, default, None)
+        if value is not ContextRequiredSentinel:
+            return value
+        while True:
+            context = ProvideContext(leasing=False, restartable=True)
             token = current_context.set(context)
             try:
-                value = self.provide(dependency, default, context)
+                return self.provide(dependency, default, context)
+            except RestartResolution as e:
+                restart = e
             finally:
                 current_context.reset(token)
                 context.release()
-        else:
-            value = self.provide(dependency, default, context)
-        return value
+            restart.wait(None)
+
+    def get_many(
+        self, dependencies: Sequence[object], defaults: Sequence[object]
+    ) -> tuple[object, ...]:
+        """
+        Equivalent to :py:meth:`.get` for each dependency, but a single context is created and all
+        layer locks acquired are only released at the end.
+        """
+        provide = self.provide
+        context: ProvideContext | None = current_context.get(None)
+        if context is not None:
+            return tuple(map(provide, dependencies, defaults, repeat(context)))
 
-    def provide(self, dependency: object, default: object, context: ProvideContext) -> object:
+        while True:
+            values: list[object] = []
+            token = None
+            try:
+                for dependency, default in zip(dependencies, defaults):
+                    if context is None:
+                        value = provide(dependency, default, None)
+                        if value is ContextRequiredSentinel:
+                            context = ProvideContext(leasing=False, restartable=True)
+                            token = current_context.set(context)
+                            value = provide(dependency, default, context)
+                    else:
+                        value = provide(dependency, default, context)
+                    values.append(value)
+                return tuple(values)
+            except RestartResolution as e:
+                restart = e
+            finally:
+                if context is not None:
+                    assert token is not None
+                    current_context.reset(token)
+                    context.release()
+                    context = None
+            restart.wait(None)
+
+    def prebind(
+        self, injections: Sequence[Injection], previous: PreboundValues | None
+    ) -> PreboundValues | None:
+        """
+        Retrieves once the singletons among the injected dependencies, which can then be used
+        directly instead of calling :py:meth:`.provide` each time. Only frozen layers without any
+        test context are supported, as singletons can't change afterwards. The result is bound to
+        the layer and the vtime of its cache, and the public one if any, so new values or a new
+        layer invalidate it. Dependencies which aren't singletons have :code:`NotFoundSentinel` as
+        value.
+        """
+        public = self.__public
+        vtime = self.__vtime if public is None else self.__vtime + public.__vtime
+        if previous is not None and previous.layer is self and previous.vtime == vtime:
+            return previous
+        if not self.frozen or self.__test_context is not None:
+            return None
+
+        cache = self.__cache
+        values = []
+        for injection in injections:
+            cached = cache.get(injection.dependency, NotFoundSentinel)
+            if (
+                cached is NotFoundSentinel
+                and public is not None
+                and not any(
+                    p.can_provide(injection.dependency)
+                    for p in self.__candidates(injection.dependency)
+                )
+            ):
+                cached = public.__cache.get(injection.dependency, NotFoundSentinel)
+            values.append(NotFoundSentinel if isinstance(cached, Cache) else cached)
+        return PreboundValues(layer=self, vtime=vtime, values=tuple(values))
+
+    def provide(
+        self, dependency: object, default: object, context: ProvideContext | None
+    ) -> object:
+        """
+        Without any context, only values which do not require any bookkeeping, such as singletons,
+        are returned. Otherwise :code:`ContextRequiredSentinel` is returned and the caller is
+        expected to retry with a context. This avoids creating a context for the most common case.
+        """
         test_context = self.__test_context
         if test_context is not None:
             if dependency in test_context.tombstones:
@@ -486,56 +1233,83 @@ class CatalogOnionLayerImpl:
             value = test_context.singletons.get(dependency, NotFoundSentinel)
             if value is not NotFoundSentinel:
                 return value
-            with self.__lock:
-                value = test_context.unsafe_factory_get(dependency, NotFoundSentinel)
+            if dependency in test_context.factories:
+                if context is None:
+                    return ContextRequiredSentinel
+                self.__locks.acquire(dependency, context)
+                return test_context.unsafe_factory_get(dependency, default)
+
+        cached = self.__cache.get(dependency, NotFoundSentinel)
+        if cached is NotFoundSentinel:
+            flat = self.__flat
+            if flat is not None and self.__flat_epoch == _layers_epoch:
+                cached = flat.get(dependency, NotFoundSentinel)
+                if cached is not NotFoundSentinel:
+                    return cached  # singleton
+            cached = self.__scope_vars.get(dependency, NotFoundSentinel)
+            if cached is NotFoundSentinel and self.__is_missing(dependency):
+                if default is NotFoundSentinel:
+                    raise DependencyNotFoundError(dependency, catalog=self)
+                return default
+
+        if context is None:
+            if cached is NotFoundSentinel or isinstance(cached, Cache):
+                return ContextRequiredSentinel
+            return cached  # singleton
+
+        if isinstance(cached, LocalCache):
+            value = cached.get()
             if value is not NotFoundSentinel:
                 return value
+            # Created for the current thread or event loop, or again if garbage collected.
+            cached = NotFoundSentinel
 
-        vtime = self.__vtime
-        cached = self.__cache.get(dependency, NotFoundSentinel)
         if cached is NotFoundSentinel:
-            context.acquire(self.__lock)
-            if vtime != self.__vtime:
-                cached = self.__cache.get(dependency, NotFoundSentinel)
+            locks = self.__locks
+            cached, flight = locks.start_flight(self.__cache, dependency, context)
             if cached is NotFoundSentinel:
-                context.stack_push()
                 try:
-                    for provider in self.providers:
-                        provider.unsafe_maybe_provide(dependency, context)
-                        if context.current_value is not NotFoundSentinel:
-                            if context.current_cache is not NotFoundSentinel:
-                                self.__cache[dependency] = context.current_cache
-                                self.__vtime += 1
-                                context.current_cache = NotFoundSentinel
-                            return context.current_value
+                    return self.__create(dependency, default, context)
                 finally:
-                    context.stack_pop()
-
-                public = self.__public
-                if public is not None:
-                    value = public.provide(dependency, ChildNotFoundSentinel, context)
-                    if value is not ChildNotFoundSentinel:
-                        return value
-
-                for child_onion in self.__children:
-                    value = child_onion.layer.provide(dependency, ChildNotFoundSentinel, context)
-                    if value is not ChildNotFoundSentinel:
-                        return value
+                    locks.end_flight(dependency, flight)
 
-                if default is NotFoundSentinel:
-                    raise DependencyNotFoundError(dependency, catalog=self)
-
-                return default
+        # Cache entries are final classes, so they're dispatched on their exact type.
+        if type(cached) is PooledCache:
+            return cached.borrow(dependency, context)
 
         if isinstance(cached, Cache):
             context.stack_push()
             try:
-                if isinstance(cached, TransientCache):
+                if type(cached) is TransientCache:
                     return cached.callback()
-                elif isinstance(cached, ScopedCache):
-                    context.acquire(self.__lock)
-                    if any(dep.vtime > vtime for dep, vtime in cached.scope_vars_vtime):
-                        object.__setattr__(cached, "value", cached.callback())
+                elif type(cached) is ScopedCache:
+                    if cached.limit is not None:
+                        self.__touch(dependency, cached.limit)
+                    expiry = cached.expiry
+                    if expiry is not None and expiry.refreshing:
+                        # Another thread computes the new value, the stale one is served.
+                        context.scope_vars_stack[-1].extend(
+                            [dep for dep, _ in cached.scope_vars_vtime]
+                        )
+                        return cached.value
+                    self.__locks.acquire(dependency, context)
+                    outdated = False
+                    for dep, vtime in cached.scope_vars_vtime:
+                        if dep.vtime > vtime:
+                            outdated = True
+                            break
+                    if outdated:
+                        if expiry is None:
+                            object.__setattr__(cached, "value", cached.callback())
+                        else:
+                            expiry.refreshing = expiry.serve_stale
+                            try:
+                                value = cached.callback()
+                            finally:
+                                expiry.refreshing = False
+                            expiry.renew()
+                            object.__setattr__(cached, "value", value)
+                        context.scope_vars_stack[-1].append(cached.version)
                         object.__setattr__(
                             cached,
                             "scope_vars_vtime",
@@ -543,12 +1317,22 @@ class CatalogOnionLayerImpl:
                         )
                     else:
                         context.scope_vars_stack[-1].extend(
-                            dep for dep, _ in cached.scope_vars_vtime
+                            [dep for dep, _ in cached.scope_vars_vtime]
                         )
                     return cached.value
+                elif type(cached) is ResolutionCache:
+                    resolved = context.resolved
+                    if resolved is not None:
+                        value = resolved.get(cached, NotFoundSentinel)
+                        if value is not NotFoundSentinel:
+                            return value
+                    return context.share(cached, cached.callback())
+                elif type(cached) is BoundedCache:
+                    self.__touch(dependency, cached.limit)
+                    return cached.value
                 else:
                     assert isinstance(cached, ScopeGlobalVarCache)
-                    context.acquire(self.__lock)
+                    self.__locks.acquire(dependency, context)
                     if cached.value is NotFoundSentinel:
                         raise UndefinedScopeVarError(dependency)
                     context.scope_vars_stack[-1].append(cached)
@@ -558,6 +1342,272 @@ class CatalogOnionLayerImpl:
 
         return cached  # Either a singleton or NotFoundSentinel
 
+    def __create(self, dependency: object, default: object, context: ProvideContext) -> object:
+        context.stack_push()
+        try:
+            for provider in self.__candidates(dependency):
+                provider.unsafe_maybe_provide(dependency, context)
+                if context.current_value is not NotFoundSentinel:
+                    value = context.current_value
+                    if context.current_cache is not NotFoundSentinel:
+                        with self.__flights_lock:
+                            cached = self.__cache.setdefault(dependency, context.current_cache)
+                            if isinstance(cached, WeakCache) and cached.ref() is None:
+                                self.__cache.pop(dependency, None)
+                                cached = self.__cache.setdefault(dependency, context.current_cache)
+                            if cached is context.current_cache:
+                                self.__vtime += 1
+                                limit = _limit_of(cached)
+                                if limit is not None:
+                                    self.__track(dependency, limit)
+                        current_cache = context.current_cache
+                        context.current_cache = NotFoundSentinel
+                        if isinstance(cached, (ThreadLocalCache, LoopCache)):
+                            return cached.setdefault(value)
+                        if isinstance(cached, ResolutionCache):
+                            return context.share(cached, value)
+                        if isinstance(cached, PooledCache):
+                            if cached is current_cache:
+                                return cached.adopt(value, context)
+                            return cached.borrow(dependency, context)
+                        # Only happens on a recursive resolution of the same dependency.
+                        if not isinstance(cached, Cache):
+                            return cached
+                    return value
+        finally:
+            context.stack_pop()
+
+        epoch = _layers_epoch
+        public = self.__public
+        if public is not None:
+            value = public.provide(dependency, ChildNotFoundSentinel, context)
+            if value is not ChildNotFoundSentinel:
+                self.__maybe_flatten(public, dependency, value, epoch)
+                return value
+
+        for child_onion in self.__children_candidates(dependency):
+            value = child_onion.layer.provide(dependency, ChildNotFoundSentinel, context)
+            if value is not ChildNotFoundSentinel:
+                self.__maybe_flatten(child_onion.layer, dependency, value, epoch)
+                return value
+
+        self.__add_missing(dependency)
+        if default is NotFoundSentinel:
+            raise DependencyNotFoundError(dependency, catalog=self)
+
+        return default
+
+    def optimize(self) -> None:
+        """
+        Used by :code:`freeze(optimize=True)`. Builds the routing of the providers and children
+        right away and flattens the singletons provided by the public layer or the children: once
+        retrieved, they're kept in this layer and returned directly without any context or lock.
+        They're discarded whenever a layer is added to or removed from any catalog as children may
+        be overridden in test environments.
+        """
+        assert self.frozen and self.__test_context is None
+        self.__get_provider_router()
+        if self.__children:
+            self.__get_children_router()
+        if self.__flat is None:
+            with self.__flights_lock:
+                self.__flat = {}
+                self.__flat_epoch = _layers_epoch
+
+    def __maybe_flatten(
+        self, layer: CatalogOnionLayerImpl, dependency: object, value: object, epoch: int
+    ) -> None:
+        if self.__flat is None or epoch != _layers_epoch:
+            return
+        holder = layer.__holder(dependency)
+        if holder is None:
+            return
+        # Registered before checking the value, so any eviction afterwards updates the version.
+        with holder.__flights_lock:
+            holder.__flatteners[id(self)] = self
+        version = self.__flat_version
+        # Only singletons can be returned without any context.
+        if holder.__cache.get(dependency, NotFoundSentinel) is not value:
+            return
+        with self.__flights_lock:
+            if epoch != _layers_epoch or version != self.__flat_version:
+                return
+            if self.__flat_epoch != epoch:
+                self.__flat = {}
+                self.__flat_epoch = epoch
+            self.__flat[dependency] = value
+
+    def __holder(self, dependency: object) -> CatalogOnionLayerImpl | None:
+        """
+        Layer whose cache holds the value of the dependency, following the same order as
+        :py:meth:`.provide` but ignoring flattened values. Test contexts aren't supported.
+        """
+        if self.__test_context is not None:
+            return None
+        if dependency in self.__cache:
+            return self
+        if self.__public is not None:
+            holder = self.__public.__holder(dependency)
+            if holder is not None:
+                return holder
+        for child_onion in self.__children_candidates(dependency):
+            holder = child_onion.layer.__holder(dependency)
+            if holder is not None:
+                return holder
+        return None
+
+    def __unflatten(self, dependencies: list[object]) -> None:
+        with self.__flights_lock:
+            self.__flat_version += 1
+            flat = self.__flat
+            if flat is not None:
+                for dependency in dependencies:
+                    flat.pop(dependency, None)
+
+    def __candidates(self, dependency: object) -> tuple[Provider, ...]:
+        return self.__get_provider_router().candidates(dependency)
+
+    def __get_provider_router(self) -> ProviderRouter:
+        router = self.__router
+        if router is None or router.providers is not self.providers or router.frozen != self.frozen:
+            router = self.__router = ProviderRouter(self.providers, frozen=self.frozen)
+        return router
+
+    def __children_candidates(self, dependency: object) -> tuple[CatalogOnionImpl, ...]:
+        if not self.frozen or not self.__children:
+            return self.__children
+        return self.__get_children_router().candidates(dependency)
+
+    def __get_children_router(self) -> ChildrenRouter:
+        router = self.__children_router
+        if router is None or router.epoch != _layers_epoch:
+            epoch = _layers_epoch
+            router = self.__children_router = ChildrenRouter(
+                [(child, child.layer.__routing()) for child in self.__children], epoch=epoch
+            )
+        return router
+
+    def __routing(self) -> ProviderRouting | None:
+        """
+        All the dependencies that may be provided by this layer, including its children.
+        :py:obj:`None` is returned if it cannot be known in advance.
+        """
+        if not self.frozen or self.__test_context is not None:
+            return None
+        routing = self.__get_provider_router().routing()
+        if routing is None:
+            return None
+        keys = set(routing.keys)
+        types = list(routing.types)
+        keys.update(self.__scope_vars)
+        for child in self.__children:
+            child_routing = child.layer.__routing()
+            if child_routing is None:
+                return None
+            keys.update(child_routing.keys)
+            types.extend(child_routing.types)
+        return ProviderRouting(types=tuple(dict.fromkeys(types)), keys=keys)
+
+    def __is_missing(self, dependency: object) -> bool:
+        return self.__missing_epoch == _layers_epoch and dependency in self.__missing
+
+    def __add_missing(self, dependency: object) -> None:
+        """
+        Remembers dependencies that cannot be provided by frozen layers, as nothing can be added to
+        them anymore. Layers with a test context are excluded, as overrides can always be added.
+        Only the last :code:`_MAX_MISSING` ones are kept, lookups being done without any lock.
+        """
+        if self.frozen and self.__test_context is None:
+            with self.__flights_lock:
+                if self.__missing_epoch != _layers_epoch:
+                    self.__missing = OrderedDict()
+                    self.__missing_epoch = _layers_epoch
+                missing = self.__missing
+                missing[dependency] = None
+                if len(missing) > _MAX_MISSING:
+                    missing.popitem(last=False)
+
+    def evict(self, dependency: object) -> bool:
+        return self.__evict((dependency,)) > 0
+
+    def evict_where(self, predicate: Callable[[object], bool]) -> int:
+        # Predicate is called without any lock, only the snapshot of the cache is taken with it.
+        with self.__flights_lock:
+            entries = list(self.__cache.items())
+        return self.__evict(
+            [
+                dependency
+                for dependency, value in entries
+                if not isinstance(value, ScopeVarCache) and predicate(dependency)
+            ]
+        )
+
+    def __evict(self, dependencies: Iterable[object]) -> int:
+        """
+        Removes the cached values of the dependencies, scope vars excluded. Updating the version of
+        an evicted scoped dependency ensures that all scoped dependencies relying on it are computed
+        again. Evicted singletons invalidate the prebound values through the vtime and are removed
+        from the layers which flattened them.
+        """
+        with self.__lock, self.__flights_lock:
+            return self.__remove(dependencies)
+
+    def __remove(self, dependencies: Iterable[object]) -> int:
+        """
+        Must be called with the single-flight lock.
+        """
+        cache = self.__cache
+        evicted = 0
+        singletons = []
+        for dependency in dependencies:
+            value = cache.get(dependency, NotFoundSentinel)
+            if value is NotFoundSentinel or isinstance(value, ScopeVarCache):
+                continue
+            cache.pop(dependency, None)
+            self.__missing.pop(dependency, None)
+            evicted += 1
+            if isinstance(value, ScopedCache):
+                value.version.vtime += 1
+            elif not isinstance(value, Cache):
+                singletons.append(dependency)
+            limit = _limit_of(value)
+            if limit is not None:
+                order = self.__lru.get(limit)
+                if order is not None:
+                    order.pop(dependency, None)
+        if evicted:
+            self.__vtime += 1
+        if singletons:
+            for layer in list(self.__flatteners.values()):
+                layer.__unflatten(singletons)
+        return evicted
+
+    def __track(self, dependency: object, limit: CacheLimit) -> None:
+        """
+        Must be called with the single-flight lock. Records a new value with a limit, removing the
+        least recently used ones beyond it.
+        """
+        order = self.__lru.get(limit)
+        if order is None:
+            order = self.__lru[limit] = OrderedDict()
+        order[dependency] = None
+        victims = []
+        while len(order) > limit.maxsize:
+            victims.append(order.popitem(last=False)[0])
+        with limit._lock:
+            limit._misses += 1
+            limit._evictions += len(victims)
+        if victims:
+            self.__remove(victims)
+
+    def __touch(self, dependency: object, limit: CacheLimit) -> None:
+        with self.__flights_lock:
+            order = self.__lru.get(limit)
+            if order is not None and dependency in order:
+                order.move_to_end(dependency)
+            with limit._lock:
+                limit._hits += 1
+
     def register_scope_var(
         self,
         dependency: object,
@@ -566,11 +1616,12 @@ class CatalogOnionLayerImpl:
     ) -> None:
         assert not self.frozen
         cache = ScopeGlobalVarCache(default=default)
-        if self.__cache.setdefault(dependency, cache) is not cache:
+        if self.__scope_vars.setdefault(dependency, cache) is not cache:
             raise DuplicateDependencyError(dependency)
+        self.__cache.setdefault(dependency, cache)
 
     def update_scope_var(self, dependency: object, value: object) -> object:
-        cache = self.__cache.get(dependency, NotFoundSentinel)
+        cache = self.__scope_vars.get(dependency, NotFoundSentinel)
         if cache is NotFoundSentinel:  # can happen with world.test.empty()
             raise DependencyNotFoundError(dependency, catalog=self)
 
@@ -582,10 +1633,35 @@ class CatalogOnionLayerImpl:
         return old_value
 
 
+@API.private
+@final
+@dataclass(frozen=True, eq=False)
+class PreboundValues:
+    __slots__ = ("layer", "vtime", "values")
+    layer: CatalogOnionLayerImpl
+    vtime: int
+    values: tuple[object, ...]
+
+
 @API.private
 class Cache:
     __slots__ = ()
 
+    def __init_subclass__(cls, abstract: bool = False, **kwargs: object) -> None:
+        """
+        Abstract methods are checked when the class is defined rather than with ABCMeta, which
+        would slow down the isinstance checks of the cache entries on each resolution.
+        """
+        super().__init_subclass__(**kwargs)
+        if not abstract:
+            missing = [
+                name
+                for name in dir(cls)
+                if getattr(getattr(cls, name, None), "__isabstractmethod__", False)
+            ]
+            if missing:
+                raise TypeError(f"{cls!r} must implement {', '.join(missing)}")
+
 
 @API.private
 @final
@@ -596,16 +1672,502 @@ class TransientCache(Cache):
 
 
 @API.private
-class ScopeVarCache(Cache):
-    __slots__ = ("vtime",)
-    vtime: int
+@final
+@dataclass(frozen=True, eq=False)
+class ResolutionCache(Cache):
+    """
+    Resolution dependency, its values are kept by the context of the outermost lookup or injected
+    call and shared by all dependencies retrieved with it.
+    """
+
+    __slots__ = ("callback",)
+    callback: Callable[[], object]
+
+
+@API.private
+class LocalCache(Cache, abstract=True):
+    """
+    Cache of a value which may not be available to the caller, for example because it was garbage
+    collected or it belongs to another thread. It must be created again in this case.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def get(self) -> object:
+        """
+        Returns the value for the caller or :code:`NotFoundSentinel` if it must be created.
+        """
+
+
+@API.private
+@final
+@dataclass(frozen=True, eq=False)
+class WeakCache(LocalCache):
+    """
+    Weak dependency, its value is only kept while referenced elsewhere and created again once
+    garbage collected. As a :code:`Cache`, it's never prebound nor flattened which would keep it
+    alive.
+    """
+
+    __slots__ = ("ref",)
+    ref: weakref.ReferenceType[object]
+
+    def get(self) -> object:
+        value = self.ref()
+        return NotFoundSentinel if value is None else value
+
+
+@API.private
+@final
+@dataclass(frozen=True, eq=False)
+class ThreadLocalCache(LocalCache):
+    """
+    Thread dependency, each thread has its own value. Like weak ones, it's never prebound nor
+    flattened as it would be shared by all threads. The finalizer is called once the value is
+    discarded by the thread, when it exits, or by the layer.
+    """
+
+    __slots__ = ("local", "finalizer")
+    local: threading.local
+    finalizer: Callable[[object], object] | None
+
+    def get(self) -> object:
+        return getattr(self.local, "value", NotFoundSentinel)
+
+    def setdefault(self, value: object) -> object:
+        local = self.local
+        current = getattr(local, "value", NotFoundSentinel)
+        if current is not NotFoundSentinel:
+            return current
+        local.value = value
+        if self.finalizer is not None:
+            local.finalization = finalization = ThreadLocalFinalization()
+            weakref.finalize(finalization, self.finalizer, value)
+        return value
+
+
+@API.private
+@final
+class ThreadLocalFinalization:
+    """
+    Only used to detect when the thread-local data is discarded.
+    """
+
+    __slots__ = ("__weakref__",)
+
+
+@API.private
+@final
+@dataclass(eq=False)
+class PooledCache(Cache):
+    """
+    Pool of a pooled dependency, each layer having its own. Values are borrowed by the context of
+    an injected call and given back once it's released. The pool state is protected by the
+    condition of its limit, shared by all pools relying on it. Like thread ones, it's never
+    prebound nor flattened, nor copied in test environments.
+    """
+
+    __slots__ = ("limit", "callback", "idle", "size", "async_waiters", "__weakref__")
+    limit: PoolLimit
+    callback: Callable[[], object]
+    idle: list[object]
+    # Number of values created by this pool, in use or idle.
+    size: int
+    async_waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]]
+
+    def __init__(self, *, limit: PoolLimit, callback: Callable[[], object]) -> None:
+        self.limit = limit
+        self.callback = callback
+        self.idle = []
+        self.size = 0
+        self.async_waiters = []
+
+    def adopt(self, value: object, context: ProvideContext) -> object:
+        """
+        Leases the first value, created by the provider, and creates the remaining ones up to the
+        minimum size. Outside an injected call, the value is kept idle for the next one.
+        """
+        limit = self.limit
+        with limit._condition:
+            limit._pools.add(self)
+            self.size += 1
+            limit._created += 1
+            if context.leasing:
+                limit._in_use += 1
+            else:
+                self.idle.append(value)
+        if not context.leasing:
+            raise RuntimeError(_POOLED_OUTSIDE_INJECTION)
+        context.lease(self, value)
+        for _ in range(limit.min_size - 1):
+            with limit._condition:
+                if self.size >= limit.max_size:
+                    break
+                self.size += 1
+                limit._in_use += 1
+            self.give_back(self.__create())
+        return value
+
+    def borrow(self, dependency: object, context: ProvideContext) -> object:
+        if not context.leasing:
+            raise RuntimeError(_POOLED_OUTSIDE_INJECTION)
+        limit = self.limit
+        condition = limit._condition
+        with condition:
+            if not self.idle and self.size >= limit.max_size:
+                if not context.blocking or (context.restartable and context.locks):
+                    raise PoolUnavailable(self, dependency)
+                timeout = limit.timeout
+                self.__wait(dependency, None if timeout is None else time.monotonic() + timeout)
+            if self.idle:
+                value = self.idle.pop()
+                limit._in_use += 1
+                context.lease(self, value)
+                return value
+            self.size += 1
+            limit._in_use += 1
+        value = self.__create()
+        context.lease(self, value)
+        return value
+
+    def give_back(self, value: object) -> None:
+        limit = self.limit
+        with limit._condition:
+            self.idle.append(value)
+            limit._in_use -= 1
+            waiters = self.__notify()
+        _wake(waiters)
+
+    def wait(self, dependency: object, deadline: float | None) -> None:
+        """
+        Waits until a value can be borrowed, at most until the deadline. Must not be called while
+        holding any layer lock, as the values may be held by threads needing them.
+        """
+        with self.limit._condition:
+            self.__wait(dependency, deadline)
+
+    async def wait_async(self, dependency: object, deadline: float | None) -> None:
+        """
+        Waits until a value can be borrowed without blocking the event loop, at most until the
+        deadline.
+        """
+        import asyncio
+
+        limit = self.limit
+        loop = asyncio.get_running_loop()
+        waiter = (loop, loop.create_future())
+        with limit._condition:
+            if self.idle or self.size < limit.max_size:
+                return
+            self.async_waiters.append(waiter)
+            limit._waiting += 1
+        try:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            await asyncio.wait_for(waiter[1], timeout)
+        except asyncio.TimeoutError:
+            raise PoolTimeoutError(dependency, cast(float, limit.timeout)) from None
+        finally:
+            with limit._condition:
+                limit._waiting -= 1
+                if waiter in self.async_waiters:
+                    self.async_waiters.remove(waiter)
+
+    def __create(self) -> object:
+        """
+        Must be called after reserving a slot, released if the value cannot be created.
+        """
+        limit = self.limit
+        try:
+            value = self.callback()
+        except BaseException:
+            with limit._condition:
+                self.size -= 1
+                limit._in_use -= 1
+                waiters = self.__notify()
+            _wake(waiters)
+            raise
+        with limit._condition:
+            limit._created += 1
+        return value
+
+    def __wait(self, dependency: object, deadline: float | None) -> None:
+        """
+        Must be called with the condition of the limit.
+        """
+        limit = self.limit
+        limit._waiting += 1
+        try:
+            while not self.idle and self.size >= limit.max_size:
+                if deadline is None:
+                    limit._condition.wait()
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise PoolTimeoutError(dependency, cast(float, limit.timeout))
+                    limit._condition.wait(remaining)
+        finally:
+            limit._waiting -= 1
+
+    def __notify(self) -> list[tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]]:
+        """
+        Must be called with the condition of the limit. Coroutines waiting for a value must be
+        woken up afterwards from their own event loop.
+        """
+        self.limit._condition.notify_all()
+        waiters = self.async_waiters
+        self.async_waiters = []
+        return waiters
+
+
+def _wake(waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]]) -> None:
+    for loop, future in waiters:
+        try:
+            loop.call_soon_threadsafe(_resolve, future)
+        except RuntimeError:  # event loop closed
+            pass
+
+
+def _resolve(future: asyncio.Future[None]) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+def give_back(leases: list[tuple[PooledCache, object]]) -> None:
+    for pool, value in reversed(leases):
+        pool.give_back(value)
+
+
+async def release_after(result: Awaitable[T], leases: list[tuple[PooledCache, object]]) -> T:
+    try:
+        return await result
+    finally:
+        give_back(leases)
+
+
+@API.private
+class RestartResolution(Exception):
+    """
+    Raised instead of blocking when it could deadlock or block the event loop. Whoever created
+    the context, the injected wrapper or the catalog, releases it and waits for the cause to be
+    gone before starting the resolution again.
+    """
+
+    def deadline(self) -> float | None:
+        return None
+
+    def wait(self, deadline: float | None) -> None:
+        pass
+
+    async def wait_async(self, deadline: float | None) -> None:
+        pass
+
+
+@API.private
+class PoolUnavailable(RestartResolution):
+    """
+    A pooled value cannot be borrowed right away by a coroutine, or while holding layer locks
+    during the injection. The whole resolution fails once the timeout of the first pool expires.
+    """
+
+    def __init__(self, pool: PooledCache, dependency: object) -> None:
+        super().__init__(dependency)
+        self.pool = pool
+        self.dependency = dependency
+
+    def deadline(self) -> float | None:
+        timeout = self.pool.limit.timeout
+        return None if timeout is None else time.monotonic() + timeout
+
+    def wait(self, deadline: float | None) -> None:
+        self.__check(deadline)
+        self.pool.wait(self.dependency, deadline)
+
+    async def wait_async(self, deadline: float | None) -> None:
+        self.__check(deadline)
+        await self.pool.wait_async(self.dependency, deadline)
+
+    def __check(self, deadline: float | None) -> None:
+        # The call itself may have borrowed the values it could not borrow again.
+        if deadline is not None and time.monotonic() >= deadline:
+            raise PoolTimeoutError(self.dependency, cast(float, self.pool.limit.timeout))
+
+
+@API.private
+class Deadlock(RestartResolution):
+    """
+    Another thread needs, directly or not, a Flight or a layer lock held by the current one,
+    while the current one needs the blocker. The current resolution releases everything and waits
+    for the blocker before starting again, so values are never created twice.
+    """
+
+    def __init__(self, blocker: Flight | threading.RLock) -> None:
+        super().__init__(blocker)
+        self.blocker = blocker
+
+    def wait(self, deadline: float | None) -> None:
+        blocker = self.blocker
+        if isinstance(blocker, Flight):
+            blocker.done.wait()
+        else:
+            with blocker:
+                pass
+
+    async def wait_async(self, deadline: float | None) -> None:
+        import asyncio
+
+        await asyncio.get_running_loop().run_in_executor(None, self.wait, deadline)
+
+
+@API.private
+@final
+@dataclass(eq=False)
+class LoopCache(LocalCache):
+    """
+    Loop dependency, each running event loop has its own value. Like thread ones, it's never
+    prebound nor flattened, nor copied in test environments. Values are weakly keyed on their
+    loop, but clients often reference their loop themselves, so values of closed loops are also
+    discarded whenever a new one is stored.
+
+    The finalizer is called when the loop shuts down its asynchronous generators, as done by
+    :py:func:`asyncio.run`, awaiting its result if necessary. It relies on a suspended
+    asynchronous generator registered to the loop, closed by it. Loops closed without shutting
+    them down have it closed once garbage collected or whenever a new value is stored, so loops
+    are only weakly referenced.
+    """
+
+    __slots__ = ("values", "finalizer", "finalizations", "lock")
+    values: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, object]
+    finalizer: Callable[[object], object] | None
+    finalizations: list[tuple[weakref.ref[asyncio.AbstractEventLoop], AsyncGenerator[None, None]]]
+    lock: threading.Lock
+
+    def __init__(self, *, finalizer: Callable[[object], object] | None) -> None:
+        self.values = weakref.WeakKeyDictionary()
+        self.finalizer = finalizer
+        self.finalizations = []
+        self.lock = threading.Lock()
+
+    def get(self) -> object:
+        return self.values.get(_running_loop(), NotFoundSentinel)
+
+    def setdefault(self, value: object) -> object:
+        loop = _running_loop()
+        with self.lock:
+            current = self.values.get(loop, NotFoundSentinel)
+            if current is not NotFoundSentinel:
+                return current
+            for closed in [other for other in self.values if other.is_closed()]:
+                del self.values[closed]
+            self.values[loop] = value
+            if self.finalizer is not None:
+                finalizations = []
+                for ref, finalization in self.finalizations:
+                    other = ref()
+                    if other is None or finalization.ag_frame is None:
+                        continue
+                    if other.is_closed():  # never shut down, the value cannot be awaited anymore
+                        _close_finalization(finalization)
+                    else:
+                        finalizations.append((ref, finalization))
+                ref = weakref.ref(loop)
+                finalization = _finalize_on_shutdown(ref, value, self.finalizer)
+                _register_finalization(finalization)
+                weakref.finalize(loop, _close_finalization, finalization).atexit = False
+                finalizations.append((ref, finalization))
+                self.finalizations = finalizations
+        return value
+
+
+def _running_loop() -> asyncio.AbstractEventLoop:
+    import asyncio
+
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        raise RuntimeError(
+            "Loop dependencies can only be retrieved while an event loop is running."
+        ) from None
+
+
+async def _finalize_on_shutdown(
+    loop: weakref.ref[asyncio.AbstractEventLoop],
+    value: object,
+    finalizer: Callable[[object], object],
+) -> AsyncGenerator[None, None]:
+    try:
+        yield
+    finally:
+        result = finalizer(value)
+        if inspect.isawaitable(result):
+            current = loop()
+            if current is None or current.is_closed():
+                close = getattr(result, "close", None)
+                if close is not None:
+                    close()
+            else:
+                await result
+
+
+def _register_finalization(finalization: AsyncGenerator[None, None]) -> None:
+    """
+    Registers the generator to the running loop through its first iteration hook. The finalizer
+    hook is left out, as the generator would then reference the loop.
+    """
+    import sys
+
+    hooks = sys.get_asyncgen_hooks()
+    sys.set_asyncgen_hooks(firstiter=hooks.firstiter, finalizer=None)
+    try:
+        _run_until_suspended(finalization.asend(None))
+    finally:
+        sys.set_asyncgen_hooks(*hooks)
+
+
+def _close_finalization(finalization: AsyncGenerator[None, None]) -> None:
+    if finalization.ag_frame is not None:
+        _run_until_suspended(finalization.aclose())
+
+
+def _run_until_suspended(step: Awaitable[object]) -> None:
+    try:
+        cast(Coroutine[object, None, object], step).send(None)
+    except StopIteration:
+        pass
+
+
+@API.private
+class ScopeVarCache(Cache, abstract=True):
+    """
+    Subclasses define how the vtime is kept, either as a simple attribute or computed.
+    """
+
+    __slots__ = ()
+
+    # Mypy doesn't support abstract property setters.
+    if TYPE_CHECKING:
+
+        @property
+        def vtime(self) -> int:
+            ...
+
+        @vtime.setter
+        def vtime(self, value: int) -> None:
+            ...
+
+    else:
+
+        @property
+        @abstractmethod
+        def vtime(self) -> int:
+            ...
 
 
 @API.private
 @final
 @dataclass(eq=False)
 class ScopeGlobalVarCache(ScopeVarCache):
-    __slots__ = ("default", "value")
+    __slots__ = ("vtime", "default", "value")
     vtime: int
     default: object
     value: object
@@ -619,11 +2181,104 @@ class ScopeGlobalVarCache(ScopeVarCache):
             self.value = default
 
 
+@API.private
+@final
+class ExpiryCache(ScopeVarCache):
+    """
+    Expiry of the value of a dependency with a ttl, behaving like a scope var updated once the
+    time elapsed. Renewing it skips a vtime, so values computed with the expired one while it was
+    being refreshed are outdated as well.
+    """
+
+    __slots__ = ("ttl", "serve_stale", "refreshing", "expires_at", "__vtime")
+    ttl: float
+    serve_stale: bool
+    refreshing: bool
+    expires_at: float
+    __vtime: int
+
+    def __init__(self, *, ttl: float, serve_stale: bool) -> None:
+        self.ttl = ttl
+        self.serve_stale = serve_stale
+        self.refreshing = False
+        self.expires_at = config.clock() + ttl
+        self.__vtime = 0
+
+    @property
+    def vtime(self) -> int:
+        if config.clock() < self.expires_at:
+            return self.__vtime
+        return self.__vtime + 1
+
+    @vtime.setter
+    def vtime(self, value: int) -> None:
+        self.__vtime = value
+
+    def renew(self) -> None:
+        self.expires_at = config.clock() + self.ttl
+        self.__vtime += 2
+
+    def copy(self) -> ExpiryCache:
+        copy = ExpiryCache(ttl=self.ttl, serve_stale=self.serve_stale)
+        copy.expires_at = self.expires_at
+        copy.__vtime = self.__vtime
+        return copy
+
+
+@API.private
+@final
+class VersionCache(ScopeVarCache):
+    """
+    Version of the value of a scoped dependency, behaving like a scope var only updated when the
+    value is evicted.
+    """
+
+    __slots__ = ("vtime",)
+    vtime: int
+
+    def __init__(self) -> None:
+        self.vtime = 0
+
+    def copy(self) -> VersionCache:
+        copy = VersionCache()
+        copy.vtime = self.vtime
+        return copy
+
+
 @API.private
 @final
 @dataclass(frozen=True, eq=False)
 class ScopedCache(Cache):
-    __slots__ = ("value", "scope_vars_vtime", "callback")
+    """
+    The version, which is the expiry for values with a ttl, is part of the scope vars of the value.
+    So scoped dependencies relying on it are computed again once it's evicted, without affecting
+    the other dependencies sharing its scope vars.
+    """
+
+    __slots__ = ("value", "scope_vars_vtime", "callback", "expiry", "version", "limit")
     value: object
     scope_vars_vtime: Sequence[tuple[ScopeVarCache, int]]
     callback: Callable[[], object]
+    expiry: ExpiryCache | None
+    version: ScopeVarCache
+    limit: CacheLimit | None
+
+
+@API.private
+@final
+@dataclass(frozen=True, eq=False)
+class BoundedCache(Cache):
+    """
+    Singleton with a limit, only retrieved with a context to track its usage.
+    """
+
+    __slots__ = ("value", "limit")
+    value: object
+    limit: CacheLimit
+
+
+@API.private
+def _limit_of(cache: object) -> CacheLimit | None:
+    if isinstance(cache, (BoundedCache, ScopedCache)):
+        return cache.limit
+    return None
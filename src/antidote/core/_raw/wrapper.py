@@ -1,24 +1,63 @@
 from __future__ import annotations
 
 import dataclasses
-from contextvars import ContextVar, copy_context, Token
-from typing import Any, Awaitable, Callable, TYPE_CHECKING
+import functools
+import threading
+import weakref
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Collection, TYPE_CHECKING
+
+from typing_extensions import final
 
 from ..._internal import API, wraps_frozen
 from ..._internal.typing import Function
-from .onion import CatalogOnionImpl, current_context, ProvideContext
+from .codegen import specialize
+from .onion import (
+    CatalogOnionImpl,
+    ContextRequiredSentinel,
+    current_context,
+    NotFoundSentinel,
+    PreboundValues,
+    ProvideContext,
+    release_after,
+    RestartResolution,
+)
 
 if TYPE_CHECKING:
     from .._injection import Injection, InjectionBlueprint
 
 __all__ = [
     "InjectedWrapper",
+    "InjectedBoundWrapper",
     "AsyncInjectedWrapper",
     "SyncInjectedWrapper",
+    "PendingBlueprint",
     "current_catalog_onion",
+    "update_blueprint",
+    "build_pending_blueprints",
 ]
 
 current_catalog_onion = ContextVar[CatalogOnionImpl]("current_catalog")
+# Wrappers whose blueprint was deferred and not yet built.
+_pending_wrappers: weakref.WeakSet[InjectedWrapper] = weakref.WeakSet()
+_pending_lock = threading.RLock()
+
+
+@API.private
+@final
+@dataclass(frozen=True)
+class PendingBlueprint:
+    """
+    Blueprint of a wrapper which will only be created when first needed. Changes that must be
+    applied to it, such as the ones from :code:`__set_name__` or :py:meth:`.Inject.rewire`, are
+    kept in :code:`updates`.
+    """
+
+    __slots__ = ("factory", "specialize", "updates")
+    factory: Callable[[], InjectionBlueprint]
+    specialize: bool
+    updates: tuple[Callable[[InjectionBlueprint], InjectionBlueprint], ...]
 
 
 @API.private
@@ -28,30 +67,48 @@ class InjectedWrapper:
         "__antidote_maybe_app_catalog_onion__",
         "__antidote_hardwired__",
         "__antidote_blueprint__",
-        "__antidote_bound_method__",
+        "__antidote_trampoline__",
+        "__antidote_method_trampoline__",
+        "__antidote_prebound__",
+        "__antidote_pending__",
         "__dict__",
+        "__weakref__",
     )
+    __antidote_bound_method__ = False
+    # Pooled values are given back once the coroutine is finished rather than once it's created.
+    __antidote_async__ = False
     __wrapped__: object
     __antidote_wrapped__: Function[..., Any]
     __antidote_maybe_app_catalog_onion__: CatalogOnionImpl | None
     __antidote_hardwired__: bool
     __antidote_blueprint__: InjectionBlueprint
-    __antidote_bound_method__: bool
+    __antidote_trampoline__: Callable[..., Any] | None
+    __antidote_method_trampoline__: Callable[..., Any] | None
+    __antidote_prebound__: PreboundValues | None
+    __antidote_pending__: PendingBlueprint | None
 
     def __init__(
         self,
         __wrapped__: object,
         maybe_app_catalog_onion: CatalogOnionImpl | None,
         hardwired: bool,
-        blueprint: InjectionBlueprint,
+        blueprint: InjectionBlueprint | PendingBlueprint,
         wrapped: Callable[..., Any],
-        bound_method: bool = False,
     ) -> None:
         self.__antidote_wrapped__ = wrapped
         self.__antidote_maybe_app_catalog_onion__ = maybe_app_catalog_onion
         self.__antidote_hardwired__ = hardwired
-        self.__antidote_blueprint__ = blueprint
-        self.__antidote_bound_method__ = bound_method
+        self.__antidote_trampoline__ = None
+        self.__antidote_method_trampoline__ = None
+        self.__antidote_prebound__ = None
+        if isinstance(blueprint, PendingBlueprint):
+            # __antidote_blueprint__ is left unset, __getattr__ will build it on first access.
+            self.__antidote_pending__ = blueprint
+            with _pending_lock:
+                _pending_wrappers.add(self)
+        else:
+            self.__antidote_pending__ = None
+            self.__antidote_blueprint__ = blueprint
         wraps_frozen(__wrapped__)(self)
 
     @property  # type: ignore
@@ -59,6 +116,8 @@ class InjectedWrapper:
         return self.__antidote_wrapped__.__class__
 
     def __getattr__(self, item: str) -> object:
+        if item == "__antidote_blueprint__" and self.__antidote_pending__ is not None:
+            return _build_blueprint(self)
         return getattr(self.__antidote_wrapped__, item)
 
     def __repr__(self) -> str:
@@ -68,13 +127,14 @@ class InjectedWrapper:
         return str(self.__antidote_wrapped__)
 
     def __set_name__(self, owner: type, name: str) -> None:
-        blueprint = self.__antidote_blueprint__
-        if blueprint.injections and blueprint.inject_self:
-            injections: list[Injection] = list(blueprint.injections)
-            injections[0] = dataclasses.replace(injections[0], dependency=owner)
-            self.__antidote_blueprint__ = dataclasses.replace(
-                blueprint, injections=tuple(injections)
-            )
+        def inject_owner(blueprint: InjectionBlueprint) -> InjectionBlueprint:
+            if blueprint.injections and blueprint.inject_self:
+                injections: list[Injection] = list(blueprint.injections)
+                injections[0] = dataclasses.replace(injections[0], dependency=owner)
+                return dataclasses.replace(blueprint, injections=tuple(injections))
+            return blueprint
+
+        update_blueprint(self, inject_owner)
         try:
             self.__antidote_wrapped__.__set_name__(owner, name)  # type: ignore
         except AttributeError:
@@ -83,75 +143,258 @@ class InjectedWrapper:
 
 @API.private
 class SyncInjectedWrapper(InjectedWrapper):
+    __slots__ = ()
     __antidote_wrapped__: Callable[..., object]
 
     def __call__(self, *args: object, **kwargs: object) -> object:
-        return copy_context().run(
-            _call,
-            self,
-            args,
-            kwargs,
-        )
+        trampoline = self.__antidote_trampoline__
+        try:
+            if trampoline is not None:
+                return trampoline(*args, **kwargs)
+            return _call(self, args, kwargs)
+        except RestartResolution as restart:
+            start = trampoline or (lambda *a, **kw: _call(self, a, kw))
+            return _call_when_available(restart, start, args, kwargs)
 
     def __get__(self, instance: object, owner: type) -> object:
-        return SyncInjectedBoundWrapper(
-            self.__wrapped__,
-            self.__antidote_maybe_app_catalog_onion__,
-            self.__antidote_hardwired__,
-            self.__antidote_blueprint__,
-            self.__antidote_wrapped__.__get__(instance, owner),
-            instance is not None,
-        )
+        if instance is None:
+            return self
+        return SyncInjectedBoundWrapper(self, instance, owner)
 
 
 @API.private
-class SyncInjectedBoundWrapper(SyncInjectedWrapper):
+class AsyncInjectedWrapper(InjectedWrapper):
+    __slots__ = ()
+    __antidote_async__ = True
+    __antidote_wrapped__: Callable[..., Awaitable[object]]
+
+    async def __call__(self, *args: object, **kwargs: object) -> object:
+        trampoline = self.__antidote_trampoline__
+        try:
+            if trampoline is not None:
+                coroutine = trampoline(*args, **kwargs)
+            else:
+                coroutine = _call(self, args, kwargs)
+        except RestartResolution as restart:
+            start = trampoline or (lambda *a, **kw: _call(self, a, kw))
+            coroutine = await _start_when_available(restart, start, args, kwargs)
+        return await coroutine
+
+    def __get__(self, instance: object, owner: type) -> object:
+        if instance is None:
+            return self
+        return AsyncInjectedBoundWrapper(self, instance, owner)
+
+
+@API.private
+@final
+class _ParentAttribute(str):
     """
-    Behaves like Python bound methods. Unsure whether this is really necessary
-    or not.
+    Class attribute of the bound wrappers forwarding to the parent wrapper for instances. Classes
+    keep their own value: :code:`type.__module__` returns the class dictionary entry as is, hence
+    the str subclass, and :code:`type.__doc__` calls :code:`__get__` without any instance.
     """
 
+    name: str
+    class_value: str | None
+
+    def __new__(cls, name: str, class_value: str | None) -> _ParentAttribute:
+        self = super().__new__(cls, class_value or "")
+        self.name = name
+        self.class_value = class_value
+        return self
+
+    def __get__(self, instance: object, owner: type | None = None) -> object:
+        if instance is None:
+            return self.class_value
+        return getattr(getattr(instance, "__antidote_parent__"), self.name)
+
+    def __reduce__(self) -> tuple[type[str], tuple[str]]:
+        # Pickled as a plain string, such as the module when pickling the class itself.
+        return str, (str(self),)
+
+
+_PARENT_DOC = _ParentAttribute("__doc__", None)
+_PARENT_MODULE = _ParentAttribute("__module__", __name__)
+
+
+@API.private
+class InjectedBoundWrapper:
+    # Behaves like Python bound methods. Created on each attribute access, so it only stores the
+    # instance and the owner and relies on the unbound wrapper for everything else, the underlying
+    # bound method being created only when needed.
+    __slots__ = ("__antidote_parent__", "__antidote_instance__", "__antidote_owner__")
+    __antidote_bound_method__ = True
+    __antidote_async__ = False
+    # Every class body defines both of them, so subclasses must set them again.
+    __doc__ = _PARENT_DOC
+    __module__ = _PARENT_MODULE
+
+    def __init__(self, parent: InjectedWrapper, instance: object, owner: type) -> None:
+        self.__antidote_parent__ = parent
+        self.__antidote_instance__ = instance
+        self.__antidote_owner__ = owner
+
+    @property
+    def __antidote_wrapped__(self) -> Any:
+        return self.__antidote_parent__.__antidote_wrapped__.__get__(  # type: ignore
+            self.__antidote_instance__, self.__antidote_owner__
+        )
+
+    @property
+    def __antidote_maybe_app_catalog_onion__(self) -> CatalogOnionImpl | None:
+        return self.__antidote_parent__.__antidote_maybe_app_catalog_onion__
+
+    @property
+    def __antidote_hardwired__(self) -> bool:
+        return self.__antidote_parent__.__antidote_hardwired__
+
+    @property
+    def __antidote_blueprint__(self) -> InjectionBlueprint:
+        return self.__antidote_parent__.__antidote_blueprint__
+
+    @property
+    def __antidote_prebound__(self) -> PreboundValues | None:
+        return self.__antidote_parent__.__antidote_prebound__
+
+    @__antidote_prebound__.setter
+    def __antidote_prebound__(self, prebound: PreboundValues | None) -> None:
+        self.__antidote_parent__.__antidote_prebound__ = prebound
+
+    @property
+    def __wrapped__(self) -> object:
+        return self.__antidote_parent__.__wrapped__
+
+    @property  # type: ignore
+    def __class__(self) -> Any:
+        return self.__antidote_wrapped__.__class__
+
+    def __getattr__(self, item: str) -> object:
+        return getattr(self.__antidote_wrapped__, item)
+
+    def __repr__(self) -> str:
+        return f"<injected {self.__antidote_wrapped__!r}>"
+
+    def __str__(self) -> str:
+        return str(self.__antidote_wrapped__)
+
     def __get__(self, instance: object, owner: type) -> object:
         return self  # pragma: no cover
 
 
 @API.private
-class AsyncInjectedWrapper(InjectedWrapper):
-    __antidote_wrapped__: Callable[..., Awaitable[object]]
+class SyncInjectedBoundWrapper(InjectedBoundWrapper):
+    __slots__ = ()
+    __doc__ = _PARENT_DOC
+    __module__ = _PARENT_MODULE
+
+    def __call__(self, *args: object, **kwargs: object) -> object:
+        trampoline = self.__antidote_parent__.__antidote_method_trampoline__
+        try:
+            if trampoline is not None:
+                return trampoline(self.__antidote_instance__, *args, **kwargs)
+            return _call(self, args, kwargs)
+        except RestartResolution as restart:
+            start: Callable[..., object]
+            if trampoline is not None:
+                start = functools.partial(trampoline, self.__antidote_instance__)
+            else:
+                start = lambda *a, **kw: _call(self, a, kw)  # noqa: E731
+            return _call_when_available(restart, start, args, kwargs)
+
+
+@API.private
+class AsyncInjectedBoundWrapper(InjectedBoundWrapper):
+    __slots__ = ()
+    __antidote_async__ = True
+    __doc__ = _PARENT_DOC
+    __module__ = _PARENT_MODULE
 
     async def __call__(self, *args: object, **kwargs: object) -> object:
-        return await copy_context().run(
-            _call,
-            self,
-            args,
-            kwargs,
-        )
+        trampoline = self.__antidote_parent__.__antidote_method_trampoline__
+        try:
+            if trampoline is not None:
+                coroutine = trampoline(self.__antidote_instance__, *args, **kwargs)
+            else:
+                coroutine = _call(self, args, kwargs)
+        except RestartResolution as restart:
+            start: Callable[..., Awaitable[object]]
+            if trampoline is not None:
+                start = functools.partial(trampoline, self.__antidote_instance__)
+            else:
+                start = lambda *a, **kw: _call(self, a, kw)  # noqa: E731
+            coroutine = await _start_when_available(restart, start, args, kwargs)
+        return await coroutine
 
-    def __get__(self, instance: object, owner: type) -> object:
-        return AsyncInjectedBoundWrapper(
-            self.__wrapped__,
-            self.__antidote_maybe_app_catalog_onion__,
-            self.__antidote_hardwired__,
-            self.__antidote_blueprint__,
-            self.__antidote_wrapped__.__get__(instance, owner),
-            instance is not None,
-        )
+
+@API.private
+def update_blueprint(
+    wrapper: InjectedWrapper, update: Callable[[InjectionBlueprint], InjectionBlueprint]
+) -> None:
+    with _pending_lock:
+        pending = wrapper.__antidote_pending__
+        if pending is not None:
+            wrapper.__antidote_pending__ = dataclasses.replace(
+                pending, updates=(*pending.updates, update)
+            )
+            return
+
+    blueprint = update(wrapper.__antidote_blueprint__)
+    if blueprint is not wrapper.__antidote_blueprint__:
+        wrapper.__antidote_blueprint__ = blueprint
+        wrapper.__antidote_prebound__ = None
+        if wrapper.__antidote_trampoline__ is not None:
+            specialize(wrapper)
 
 
 @API.private
-class AsyncInjectedBoundWrapper(AsyncInjectedWrapper):
+def build_pending_blueprints(onions: Collection[object]) -> None:
     """
-    Behaves like Python bound methods. Unsure whether this is really necessary
-    or not.
+    Builds the pending blueprints of the wrappers using one of the given onions as app catalog.
+    Wrappers without any use the current catalog. A wrapper which fails is only reported once
+    here and is left pending, so it raises again when called.
     """
+    current_in_onions = current_catalog_onion.get() in onions
+    with _pending_lock:
+        wrappers = [
+            wrapper
+            for wrapper in _pending_wrappers
+            if (
+                current_in_onions
+                if wrapper.__antidote_maybe_app_catalog_onion__ is None
+                else wrapper.__antidote_maybe_app_catalog_onion__ in onions
+            )
+        ]
+    for wrapper in wrappers:
+        try:
+            _build_blueprint(wrapper)
+        except BaseException:
+            with _pending_lock:
+                _pending_wrappers.discard(wrapper)
+            raise
 
-    def __get__(self, instance: object, owner: type) -> object:
-        return self  # pragma: no cover
+
+@API.private
+def _build_blueprint(wrapper: InjectedWrapper) -> InjectionBlueprint:
+    with _pending_lock:
+        pending = wrapper.__antidote_pending__
+        if pending is None:  # built by another thread in the meantime
+            return wrapper.__antidote_blueprint__
+
+        blueprint = pending.factory()
+        for update in pending.updates:
+            blueprint = update(blueprint)
+        wrapper.__antidote_blueprint__ = blueprint
+        wrapper.__antidote_pending__ = None
+        _pending_wrappers.discard(wrapper)
+        if pending.specialize:
+            specialize(wrapper)
+        return blueprint
 
 
 @API.private
 def _call(
-    wrapper: InjectedWrapper,
+    wrapper: InjectedWrapper | InjectedBoundWrapper,
     args: tuple[object, ...],
     kwargs: dict[str, object],
 ) -> Any:
@@ -166,29 +409,111 @@ def _call(
 
     if maybe_app_onion is None:
         layer = current_catalog_onion.get().layer
+    elif current_catalog_onion.get(None) is maybe_app_onion:
+        layer = maybe_app_onion.layer
     else:
         onion_token = current_catalog_onion.set(maybe_app_onion)
         layer = maybe_app_onion.layer
+    # Only frozen layers can prebind singletons, skipping the hook entirely otherwise. Catalogs are
+    # usually frozen after the functions are decorated, so it can't be decided any earlier.
+    values: tuple[object, ...] | None = None
+    if layer.frozen:
+        previous = wrapper.__antidote_prebound__
+        prebound = layer.prebind(blueprint.injections, previous)
+        if prebound is not previous:
+            wrapper.__antidote_prebound__ = prebound
+        if prebound is not None:
+            values = prebound.values
+    # If we're not already within a resolution, a context is only created if necessary. Once
+    # created, it's kept until the end of the call to ensure a consistent injection.
     context: ProvideContext | None = current_context.get(None)
-    if context is None:
-        context = ProvideContext()
-        context_token = current_context.set(context)
     try:
         kwargs = kwargs.copy()
         if blueprint.inject_self and not bound_method:
             self_injection = blueprint.injections[0]
-            self = layer.provide(self_injection.dependency, self_injection.default, context)
+            self = values[0] if values is not None else NotFoundSentinel
+            if self is NotFoundSentinel:
+                self = layer.provide(self_injection.dependency, self_injection.default, context)
+            if self is ContextRequiredSentinel:
+                context = ProvideContext(blocking=not wrapper.__antidote_async__, restartable=True)
+                context_token = current_context.set(context)
+                self = layer.provide(self_injection.dependency, self_injection.default, context)
             args = (self, *args)
             offset += 1
-        for injection in blueprint.injections[offset:]:
+        for i in range(offset, len(blueprint.injections)):
+            injection = blueprint.injections[i]
             if injection.dependency is not None and injection.arg_name not in kwargs:
-                value = layer.provide(injection.dependency, injection.default, context)
+                value = values[i] if values is not None else NotFoundSentinel
+                if value is NotFoundSentinel:
+                    value = layer.provide(injection.dependency, injection.default, context)
+                if value is ContextRequiredSentinel:
+                    context = ProvideContext(
+                        blocking=not wrapper.__antidote_async__, restartable=True
+                    )
+                    context_token = current_context.set(context)
+                    value = layer.provide(injection.dependency, injection.default, context)
                 kwargs[injection.arg_name] = value
 
-        return wrapper.__antidote_wrapped__(*args, **kwargs)
+        if context_token is not None:
+            assert context is not None
+            context.restartable = False
+        result = wrapper.__antidote_wrapped__(*args, **kwargs)
+        if context_token is not None and wrapper.__antidote_async__:
+            assert context is not None
+            if context.leases:
+                # Given back once the coroutine is finished, not when it's created.
+                return release_after(result, context.take_leases())
+        return result
     finally:
         if onion_token is not None:
             current_catalog_onion.reset(onion_token)
         if context_token is not None:
+            assert context is not None
             current_context.reset(context_token)
             context.release()
+
+
+@API.private
+def _call_when_available(
+    restart: RestartResolution,
+    start: Callable[..., object],
+    args: tuple[object, ...],
+    kwargs: dict[str, object],
+) -> object:
+    """
+    Waits, once the context is released, for the cause of the restart such as a pooled value
+    which could not be borrowed, and starts the call again until it succeeds or the timeout of the
+    first pool expires. Nested calls let the one which created the context handle it.
+    """
+    if current_context.get(None) is not None:
+        raise restart
+    deadline = restart.deadline()
+    while True:
+        restart.wait(deadline)
+        try:
+            return start(*args, **kwargs)
+        except RestartResolution as e:
+            restart = e
+            if deadline is None:
+                deadline = restart.deadline()
+
+
+@API.private
+async def _start_when_available(
+    restart: RestartResolution,
+    start: Callable[..., Awaitable[object]],
+    args: tuple[object, ...],
+    kwargs: dict[str, object],
+) -> Awaitable[object]:
+    """
+    Same as :py:func:`._call_when_available` but waits asynchronously.
+    """
+    deadline = restart.deadline()
+    while True:
+        await restart.wait_async(deadline)
+        try:
+            return start(*args, **kwargs)
+        except RestartResolution as e:
+            restart = e
+            if deadline is None:
+                deadline = restart.deadline()
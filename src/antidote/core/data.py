@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import collections.abc
 import enum
+import threading
+import weakref
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Callable, cast, Optional, Sequence, TYPE_CHECKING, TypeVar
+from typing import Any, Callable, cast, Collection, Optional, Sequence, TYPE_CHECKING, TypeVar
 
 from typing_extensions import final, get_args, get_origin, Protocol, runtime_checkable
 
@@ -19,11 +21,16 @@ __all__ = [
     "DependencyDebug",
     "dependencyOf",
     "DebugInfoPrefix",
+    "ProviderRouting",
     "ParameterDependency",
     "LifeTime",
     "TestContextKind",
     "TestContextId",
     "CatalogId",
+    "CacheLimit",
+    "CacheInfo",
+    "PoolLimit",
+    "PoolInfo",
 ]
 
 T = TypeVar("T")
@@ -74,11 +81,29 @@ class LifeTime(Enum):
     - :code:`singleton`: The value is computed at most once.
     - :code:`scoped`: When depending on one or multiple :py:class:`.ScopeGlobalVar`, the value is
       re-computed if any of those change. As long as they do not, the value is cached.
+    - :code:`weak`: The value is kept as long as it's referenced elsewhere and re-computed once
+      garbage collected. It must support weak references and cannot depend on any scope var.
+    - :code:`thread`: Each thread has its own value, computed on its first request. It cannot
+      depend on any scope var.
+    - :code:`pooled`: Values are kept in a pool bounded by a :py:class:`.PoolLimit`. Each injected
+      call borrows one for its whole duration and returns it once finished. It cannot depend on any
+      scope var.
+    - :code:`resolution`: The value is shared by all the dependencies retrieved during the same
+      resolution, from the outermost lookup or injected call until it finishes, and created again
+      for the next one. It cannot depend on any scope var.
+    - :code:`loop`: Each running asyncio event loop has its own value, computed on its first
+      request within it. It can only be retrieved while an event loop is running and cannot depend
+      on any scope var.
     """
 
     TRANSIENT = 1
     SCOPED = 2
     SINGLETON = 3
+    WEAK = 4
+    THREAD = 5
+    POOLED = 6
+    RESOLUTION = 7
+    LOOP = 8
 
     @staticmethod
     def of(__lifetime: LifetimeType) -> LifeTime:
@@ -87,6 +112,11 @@ class LifeTime(Enum):
                 transient=LifeTime.TRANSIENT,
                 scoped=LifeTime.SCOPED,
                 singleton=LifeTime.SINGLETON,
+                weak=LifeTime.WEAK,
+                thread=LifeTime.THREAD,
+                pooled=LifeTime.POOLED,
+                resolution=LifeTime.RESOLUTION,
+                loop=LifeTime.LOOP,
             )[__lifetime]
         elif isinstance(__lifetime, LifeTime):
             return __lifetime
@@ -201,7 +231,8 @@ class dependencyOf(Dependency[T]):
             default = NotFoundSentinel
 
         while True:
-            if isinstance(__dependency, dependencyOf):
+            # dependencyOf is final, avoids the costly isinstance() check of Protocol subclasses.
+            if type(__dependency) is dependencyOf:
                 if __dependency.default is not NotFoundSentinel:
                     default = __dependency.default
                 __dependency = __dependency.wrapped
@@ -277,6 +308,216 @@ class DependencyDebug:
         object.__setattr__(self, "dependencies", dependencies)
 
 
+@API.experimental
+@final
+@dataclass(frozen=True, eq=False)
+class ProviderRouting:
+    """
+    Returned by :py:meth:`.Provider.routing` to declare which dependencies a
+    :py:class:`.Provider` may provide: instances of :code:`types`, including their subclasses, and
+    the :code:`keys`. The catalog will only call the relevant providers for a given dependency.
+    """
+
+    __slots__ = ("types", "keys")
+    types: tuple[type, ...]
+    keys: Collection[object]
+
+    def __init__(
+        self, *, types: tuple[type, ...] = tuple(), keys: Collection[object] = tuple()
+    ) -> None:
+        """
+        Args:
+            types: Types of the dependencies that can be provided.
+            keys: Dependencies that can be provided, such as the registered classes. It may be a
+                live view, such as :py:meth:`dict.keys`, as it's only enumerated by the catalog
+                once frozen. Afterwards it must not change anymore.
+        """
+        if not (isinstance(types, tuple) and all(isinstance(t, type) for t in types)):
+            raise TypeError(f"types must be a tuple of types, not a {type(types)!r}")
+        if not isinstance(keys, collections.abc.Collection):
+            raise TypeError(f"keys must be a Collection, not a {type(keys)!r}")
+        object.__setattr__(self, "types", types)
+        object.__setattr__(self, "keys", keys)
+
+
+@API.experimental
+@final
+@dataclass(frozen=True)
+class CacheInfo:
+    """
+    Statistics of a :py:class:`.CacheLimit` returned by :py:meth:`.CacheLimit.info`. They're
+    shared by all catalogs and test environments.
+    """
+
+    __slots__ = ("maxsize", "hits", "misses", "evictions")
+    maxsize: int
+    hits: int
+    misses: int
+    evictions: int
+
+
+@API.experimental
+@final
+class CacheLimit:
+    """
+    Limits the number of values kept by a catalog for a group of dependencies. Once
+    :code:`maxsize` values are kept, the least recently used one is discarded and will be computed
+    again if needed. It's used with :py:meth:`.ProvidedDependency.set_value` by sharing a single
+    instance among the dependencies of the group. Each catalog and test environment keeps its own
+    values. Values with a limit are retrieved slightly slower than unlimited singletons.
+
+    .. doctest:: core_data_cache_limit
+
+        >>> from antidote.core import CacheLimit
+        >>> limit = CacheLimit(maxsize=2)
+        >>> limit.info()
+        CacheInfo(maxsize=2, hits=0, misses=0, evictions=0)
+
+    """
+
+    __slots__ = ("maxsize", "_lock", "_hits", "_misses", "_evictions")
+    maxsize: int
+    # Shared by all the layers relying on it, so statistics are updated with their own lock.
+    _lock: threading.Lock
+    _hits: int
+    _misses: int
+    _evictions: int
+
+    def __init__(self, *, maxsize: int) -> None:
+        if not isinstance(maxsize, int) or isinstance(maxsize, bool):
+            raise TypeError(f"maxsize must be an integer, not a {type(maxsize)!r}")
+        if maxsize <= 0:
+            raise ValueError(f"maxsize must be strictly positive, not {maxsize!r}")
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __repr__(self) -> str:
+        return f"CacheLimit(maxsize={self.maxsize})"
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                maxsize=self.maxsize,
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+            )
+
+
+@API.experimental
+@final
+@dataclass(frozen=True)
+class PoolInfo:
+    """
+    Statistics of a :py:class:`.PoolLimit` returned by :py:meth:`.PoolLimit.info`. They're the sum
+    over all the pools relying on it, in all catalogs and test environments.
+    """
+
+    __slots__ = ("max_size", "min_size", "in_use", "idle", "waiting", "created")
+    max_size: int
+    min_size: int
+    in_use: int
+    idle: int
+    waiting: int
+    created: int
+
+
+@API.experimental
+@final
+class PoolLimit:
+    """
+    Defines the pools of a :code:`pooled` dependency. Each catalog and test environment has its
+    own pool for each dependency, keeping at most :code:`max_size` values. The first request
+    creates :code:`min_size` values at once, others are created when all are in use. Once the
+    limit is reached, requests wait for a value to be returned to the pool, at most
+    :code:`timeout` seconds if specified, raising a :py:exc:`.PoolTimeoutError` afterwards.
+    Coroutines decorated with :py:obj:`.inject` wait without blocking the event loop.
+
+    A value is borrowed by the injected call which retrieved it and returned once it's finished.
+    So it cannot be retrieved outside an injected call, for example with :code:`world[X]`. If the
+    provider already created the first value, it's kept idle in the pool for the next injected call.
+
+    .. doctest:: core_data_pool_limit
+
+        >>> from antidote import inject, injectable, world
+        >>> from antidote.core import PoolLimit
+        >>> pool = PoolLimit(max_size=2)
+        >>> @injectable(lifetime='pooled', pool=pool)
+        ... class Connection:
+        ...     pass
+        >>> @inject
+        ... def f(connection: Connection = inject.me()) -> Connection:
+        ...     return connection
+        >>> f() is f()  # the same connection was returned to the pool and borrowed again
+        True
+        >>> pool.info()
+        PoolInfo(max_size=2, min_size=1, in_use=0, idle=1, waiting=0, created=1)
+
+    """
+
+    __slots__ = (
+        "max_size",
+        "min_size",
+        "timeout",
+        "_condition",
+        "_in_use",
+        "_waiting",
+        "_created",
+        "_pools",
+    )
+    max_size: int
+    min_size: int
+    timeout: float | None
+    _condition: threading.Condition
+    _in_use: int
+    _waiting: int
+    _created: int
+    # Pools relying on this limit, idle values of discarded pools are not counted anymore.
+    _pools: weakref.WeakSet[Any]
+
+    def __init__(self, *, max_size: int, min_size: int = 1, timeout: float | None = None) -> None:
+        for name, size in [("max_size", max_size), ("min_size", min_size)]:
+            if not isinstance(size, int) or isinstance(size, bool):
+                raise TypeError(f"{name} must be an integer, not a {type(size)!r}")
+        if max_size <= 0:
+            raise ValueError(f"max_size must be strictly positive, not {max_size!r}")
+        if not (1 <= min_size <= max_size):
+            raise ValueError(f"min_size must be between 1 and max_size, not {min_size!r}")
+        if timeout is not None:
+            if not isinstance(timeout, (int, float)) or isinstance(timeout, bool):
+                raise TypeError(f"timeout must be a number or None, not a {type(timeout)!r}")
+            if timeout < 0:
+                raise ValueError(f"timeout must be positive, not {timeout!r}")
+        self.max_size = max_size
+        self.min_size = min_size
+        self.timeout = timeout
+        self._condition = threading.Condition(threading.Lock())
+        self._in_use = 0
+        self._waiting = 0
+        self._created = 0
+        self._pools = weakref.WeakSet()
+
+    def __repr__(self) -> str:
+        return (
+            f"PoolLimit(max_size={self.max_size}, min_size={self.min_size}, "
+            f"timeout={self.timeout})"
+        )
+
+    def info(self) -> PoolInfo:
+        with self._condition:
+            return PoolInfo(
+                max_size=self.max_size,
+                min_size=self.min_size,
+                in_use=self._in_use,
+                idle=sum(len(pool.idle) for pool in self._pools),
+                waiting=self._waiting,
+                created=self._created,
+            )
+
+
 @API.experimental
 @final
 @dataclass(frozen=True, eq=True)
@@ -13,6 +13,7 @@ __all__ = [
     "MissingProviderError",
     "UndefinedScopeVarError",
     "DuplicateProviderError",
+    "PoolTimeoutError",
 ]
 
 
@@ -112,3 +113,17 @@ class UndefinedScopeVarError(AntidoteError, RuntimeError):
             f"ScopeGlobalVar {dependency!r} does not have any value associated."
             f"Use set() to define it first."
         )
+
+
+@API.public
+class PoolTimeoutError(AntidoteError, TimeoutError):
+    """
+    Raised when no value of a :code:`pooled` dependency could be borrowed before the timeout of
+    its :py:class:`.PoolLimit`.
+    """
+
+    @API.private
+    def __init__(self, dependency: object, timeout: float) -> None:
+        super().__init__(
+            f"No value of {debug_repr(dependency)} was returned to its pool within {timeout}s."
+        )
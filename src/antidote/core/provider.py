@@ -6,7 +6,7 @@ from typing import Any, Callable, overload, Type, TypeVar
 from typing_extensions import Protocol
 
 from .._internal import API, debug_repr
-from .data import CatalogId, DependencyDebug, LifeTime
+from .data import CacheLimit, CatalogId, DependencyDebug, LifeTime, PoolLimit, ProviderRouting
 
 __all__ = ["Provider", "ProvidedDependency", "ProviderCatalog"]
 
@@ -23,12 +23,28 @@ class ProvidedDependency(Protocol):
 
     @overload
     def set_value(
-        self, value: Result, *, lifetime: LifeTime, callback: Callable[[], Result]
+        self,
+        value: Result,
+        *,
+        lifetime: LifeTime,
+        callback: Callable[[], Result],
+        ttl: float | None = ...,
+        serve_stale: bool = ...,
+        limit: CacheLimit | None = ...,
+        finalizer: Callable[[Result], object] | None = ...,
+        pool: PoolLimit | None = ...,
     ) -> None:
         ...
 
     @overload
-    def set_value(self, value: object, *, lifetime: LifeTime) -> None:
+    def set_value(
+        self,
+        value: Result,
+        *,
+        lifetime: LifeTime,
+        limit: CacheLimit | None = ...,
+        finalizer: Callable[[Result], object] | None = ...,
+    ) -> None:
         ...
 
     def set_value(
@@ -37,12 +53,37 @@ class ProvidedDependency(Protocol):
         *,
         lifetime: LifeTime,
         callback: Callable[..., Result] | None = None,
+        ttl: float | None = None,
+        serve_stale: bool = False,
+        limit: CacheLimit | None = None,
+        finalizer: Callable[[Result], object] | None = None,
+        pool: PoolLimit | None = None,
     ) -> None:
         """
         Defines the value and the lifetime of a dependency. If a callback function is provided it
         will be used to generate the dependency value next time it's needed. For a singleton, it's
         silently ignored.
 
+        With a :code:`ttl`, in seconds, the value expires once the time elapsed, measured with
+        :py:attr:`.Config.clock`, and is computed again with the callback on the next request.
+        It's only supported for singletons and scoped dependencies and requires a callback. Like
+        scoped dependencies, singletons cannot depend on it. With :code:`serve_stale`, the expired
+        value is returned to all other threads while one of them computes the new one.
+
+        A :py:class:`.CacheLimit` bounds the number of values kept for all the dependencies
+        sharing it, discarding the least recently used ones. It's not supported for transient
+        dependencies.
+
+        A :code:`finalizer` is only supported for thread and loop dependencies. It's called with
+        the value once discarded, when its thread exits or when the catalog doesn't keep it
+        anymore, for example when evicted. It may be called from any thread. For loop
+        dependencies, it's called when the event loop shuts down its asynchronous generators, as
+        done by :py:func:`asyncio.run`, and its result is awaited if necessary.
+
+        A :py:class:`.PoolLimit` is required for pooled dependencies, and only for them. The value
+        is borrowed by the current injected call and the callback creates new ones whenever the
+        pool has no idle value left.
+
         .. warning::
 
             Beware that defining a callback for a transient dependency, will force Antidote to keep
@@ -105,6 +146,8 @@ class Provider(ABC):
       dependency are defined.
     - *ONLY* methods prefixed with :code:`unsafe` are called in a thread-safe manner by the
       :py:class:`.Catalog`. For all others, you must ensure thread-safety yourself.
+      :py:meth:`~.Provider.unsafe_maybe_provide` is never called concurrently for the same
+      dependency, but may be for different ones.
 
     A :py:class:`.Provider` must implement at least two methods:
 
@@ -140,6 +183,7 @@ class Provider(ABC):
     - :py:meth:`~.Provider.copy` used by :py:meth:`~.TestCatalogBuilder.copy` and
       :py:meth:`~.TestCatalogBuilder.clone` test environments.
     - :py:meth:`~.Provider.maybe_debug` used by :py:meth:`.Catalog.debug`.
+    - :py:meth:`~.Provider.routing` used to only call the relevant providers for a dependency.
 
     """
 
@@ -185,6 +229,40 @@ class Provider(ABC):
             )
         return None
 
+    def routing(self) -> ProviderRouting | None:
+        """
+        Optionally declares which dependencies may be provided with a
+        :py:class:`.ProviderRouting`, either their types or the exact dependencies. The catalog
+        uses it to build an index of its providers and only calls the relevant ones in
+        :py:meth:`~.Provider.can_provide`, :py:meth:`~.Provider.unsafe_maybe_provide` and
+        :py:meth:`~.Provider.maybe_debug`. By default, :py:obj:`None` is returned and the provider
+        is tried for every dependency.
+
+        It's called again whenever the providers of the catalog change or it's frozen. Keys are
+        only checked for membership before the catalog is frozen and enumerated afterwards.
+
+        .. doctest:: core_provider_routing
+
+            >>> from antidote.core import LifeTime, Provider, ProvidedDependency, ProviderRouting
+            >>> from antidote import world
+            >>> @world.include
+            ... class HelloProvider(Provider):
+            ...     def routing(self) -> ProviderRouting:
+            ...         return ProviderRouting(keys={"hello"})
+            ...
+            ...     def can_provide(self, dependency: object) -> bool:
+            ...         return dependency == "hello"
+            ...
+            ...     def unsafe_maybe_provide(self, dependency: object, out: ProvidedDependency):
+            ...         if dependency == "hello":
+            ...             out.set_value("world", lifetime=LifeTime.SINGLETON)
+            >>> world["hello"]
+            'world'
+
+        This method *MUST* be implemented in a thread-safe manner.
+        """
+        return None
+
     @abstractmethod
     def can_provide(self, dependency: object) -> bool:
         """
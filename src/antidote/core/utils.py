@@ -8,7 +8,7 @@ from .._internal import API, auto_detect_var_name, Default, enforce_valid_name
 from .provider import Provider
 
 if TYPE_CHECKING:
-    from . import Catalog, PublicCatalog, ReadOnlyCatalog
+    from . import CacheStore, Catalog, PublicCatalog, ReadOnlyCatalog
 
 __all__ = ["is_catalog", "is_compiled", "new_catalog", "is_readonly_catalog"]
 
@@ -29,21 +29,36 @@ def new_catalog(
     name: str | Default = Default.sentinel,
     include: Iterable[Callable[[Catalog], object] | PublicCatalog | Type[Provider]]
     | Default = Default.sentinel,
+    thread_safe: bool = True,
+    cache_store: Callable[[], CacheStore] = dict,
 ) -> PublicCatalog:
     """
     Creates a new :py:class:`.PublicCatalog`. It's recommended to provide a name to the catalog to
     better differentiate it from others. It's possible to provide an iterable of functions or
     public catalogs to :py:class:`~.Catalog.include`.
+
+    With :code:`thread_safe=False`, the catalog doesn't use any lock when retrieving dependencies,
+    reducing the overhead of non-singletons. It must only be used by a single thread, such as an
+    asyncio event loop, which is checked when assertions are enabled. Child catalogs keep their own
+    thread-safety.
+
+    :code:`cache_store` creates the :py:class:`.CacheStore` keeping the values of the catalog, a
+    new one for each of its layers and test environments. It defaults to :py:class:`dict`, the
+    fastest one.
     """
     from ._catalog import CatalogImpl
 
+    if not isinstance(thread_safe, bool):
+        raise TypeError(f"thread_safe must be a boolean, not a {type(thread_safe)!r}")
+    if not callable(cache_store):
+        raise TypeError(f"cache_store must be callable, not a {type(cache_store)!r}")
     if isinstance(name, Default):
         name = auto_detect_var_name()
     else:
         enforce_valid_name(name)
     name += f"#{CatalogImpl.next_id()}"
 
-    catalog = CatalogImpl.create_public(name=name)
+    catalog = CatalogImpl.create_public(name=name, thread_safe=thread_safe, cache_store=cache_store)
     if isinstance(include, Default):
         from ..lib import antidote_lib
 
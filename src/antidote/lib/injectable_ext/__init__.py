@@ -1,12 +1,21 @@
 from __future__ import annotations
 
-from typing import Callable, Mapping, Optional, overload, Union
+from typing import Any, Callable, Mapping, Optional, overload, Union
 
 from typing_extensions import Literal
 
-from ..._internal import API, Default, retrieve_or_validate_injection_locals
+from ..._internal import API, Default, retrieve_or_validate_injection_locals, validate_ttl
 from ..._internal.typing import C
-from ...core import Catalog, is_catalog, LifeTime, LifetimeType, TypeHintsLocals, Wiring, world
+from ...core import (
+    Catalog,
+    is_catalog,
+    LifeTime,
+    LifetimeType,
+    PoolLimit,
+    TypeHintsLocals,
+    Wiring,
+    world,
+)
 from ._internal import register_injectable
 
 __all__ = ["antidote_lib_injectable", "injectable"]
@@ -38,6 +47,10 @@ def injectable(
     __klass: C,
     *,
     lifetime: LifetimeType = ...,
+    ttl: float | None = ...,
+    serve_stale: bool = ...,
+    finalizer: Callable[[Any], object] | None = ...,
+    pool: PoolLimit | None = ...,
     wiring: Wiring | None = ...,
     factory_method: str = ...,
     type_hints_locals: TypeHintsLocals = ...,
@@ -50,6 +63,10 @@ def injectable(
 def injectable(
     *,
     lifetime: LifetimeType = ...,
+    ttl: float | None = ...,
+    serve_stale: bool = ...,
+    finalizer: Callable[[Any], object] | None = ...,
+    pool: PoolLimit | None = ...,
     wiring: Wiring | None = ...,
     factory_method: str = ...,
     type_hints_locals: TypeHintsLocals = ...,
@@ -63,6 +80,10 @@ def injectable(
     __klass: Optional[C] = None,
     *,
     lifetime: LifetimeType = "singleton",
+    ttl: Optional[float] = None,
+    serve_stale: bool = False,
+    finalizer: Optional[Callable[[Any], object]] = None,
+    pool: Optional[PoolLimit] = None,
     wiring: Optional[Wiring] = Wiring(),
     factory_method: Optional[str] = None,
     type_hints_locals: Union[
@@ -144,6 +165,18 @@ def injectable(
             only when necessary.
         lifetime: Defines how long the dependency value will be cached. Defaults to
             :code:`'singleton'`, the class is instantiated at most once.
+        ttl: Number of seconds after which the instance expires and is created again on the
+            next request, as measured by :py:attr:`.Config.clock`. Defaults to :py:obj:`None`,
+            it never expires. Not supported for transient dependencies.
+        serve_stale: Whether the expired instance should be returned to other threads while one
+            of them creates the new one instead of waiting for it. Defaults to :py:obj:`False`.
+        finalizer: Called with the instance once discarded, only supported for the
+            :code:`'thread'` and :code:`'loop'` lifetimes. For example to close a connection when
+            its thread exits. For the latter, it's called when the event loop shuts down and its
+            result is awaited if necessary. Defaults to :py:obj:`None`.
+        pool: :py:class:`.PoolLimit` of the instances, required for the :code:`'pooled'`
+            lifetime and only supported for it. Each injected call borrows an instance from the
+            pool and returns it once finished. Defaults to :py:obj:`None`.
         wiring: Defines how and if methods should be injected. By defaults, all methods will be
             injected. Custom injection for specific methods with with :py:obj:`.inject` will not be
             overridden. Specifying :py:obj:`None` will prevent any wiring.
@@ -169,6 +202,29 @@ def injectable(
         )
     if not is_catalog(catalog):
         raise TypeError(f"catalog must be a Catalog, not a {type(catalog)!r}")
+    ttl = validate_ttl(ttl, serve_stale)
+    lifetime_ = LifeTime.of(lifetime)
+    if ttl is not None and lifetime_ in {
+        LifeTime.TRANSIENT,
+        LifeTime.WEAK,
+        LifeTime.THREAD,
+        LifeTime.POOLED,
+        LifeTime.RESOLUTION,
+        LifeTime.LOOP,
+    }:
+        raise ValueError(f"{lifetime_.name.title()} dependencies cannot have a ttl")
+    if finalizer is not None:
+        if not callable(finalizer):
+            raise TypeError(f"finalizer must be callable, not a {type(finalizer)!r}")
+        if lifetime_ is not LifeTime.THREAD and lifetime_ is not LifeTime.LOOP:
+            raise ValueError("Only thread and loop dependencies can have a finalizer")
+    if pool is not None:
+        if not isinstance(pool, PoolLimit):
+            raise TypeError(f"pool must be a PoolLimit or None, not a {type(pool)!r}")
+        if lifetime_ is not LifeTime.POOLED:
+            raise ValueError("Only pooled dependencies can have a pool")
+    elif lifetime_ is LifeTime.POOLED:
+        raise ValueError("Pooled dependencies require a pool")
 
     def reg(
         cls: C,
@@ -184,6 +240,10 @@ def injectable(
         register_injectable(
             klass=cls,
             lifetime=lifetime,
+            ttl=ttl,
+            serve_stale=serve_stale,
+            finalizer=finalizer,
+            pool=pool,
             wiring=wiring,
             factory_method=factory_method,
             type_hints_locals=type_hints_locals,
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from typing import Callable, cast, Mapping, Optional, TypeVar
+from typing import Any, Callable, cast, Mapping, Optional, TypeVar
 
 from ..._internal import API
-from ...core import Catalog, inject, LifeTime, Wiring
+from ...core import Catalog, inject, LifeTime, PoolLimit, Wiring
 from ._provider import FactoryProvider
 
 C = TypeVar("C", bound=type)
@@ -15,6 +15,10 @@ def register_injectable(
     *,
     klass: type,
     lifetime: LifeTime,
+    ttl: Optional[float],
+    serve_stale: bool,
+    finalizer: Optional[Callable[[Any], object]],
+    pool: Optional[PoolLimit],
     wiring: Optional[Wiring],
     factory_method: Optional[str],
     type_hints_locals: Optional[Mapping[str, object]],
@@ -36,5 +40,11 @@ def register_injectable(
         factory = cast(Callable[[], type], klass)  # for mypy...
 
     catalog.providers[FactoryProvider].register(
-        dependency=klass, factory=factory, lifetime=lifetime
+        dependency=klass,
+        factory=factory,
+        lifetime=lifetime,
+        ttl=ttl,
+        serve_stale=serve_stale,
+        finalizer=finalizer,
+        pool=pool,
     )
@@ -1,36 +1,56 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Callable, TypeVar
+from typing import Any, Callable, TypeVar
+
+from typing_extensions import final
 
 from ..._internal import API, debug_repr
 from ...core import (
     DependencyDebug,
     DuplicateDependencyError,
     LifeTime,
+    PoolLimit,
     ProvidedDependency,
     Provider,
     ProviderCatalog,
+    ProviderRouting,
 )
 
 C = TypeVar("C", bound=type)
 
 
+@API.private
+@final
+@dataclass(frozen=True, eq=False)
+class FactoryRegistration:
+    __slots__ = ("lifetime", "factory", "ttl", "serve_stale", "finalizer", "pool")
+    lifetime: LifeTime
+    factory: Callable[[], object]
+    ttl: float | None
+    serve_stale: bool
+    finalizer: Callable[[Any], object] | None
+    pool: PoolLimit | None
+
+
 @API.private
 @dataclass(frozen=True, eq=False)
 class FactoryProvider(Provider):
     __slots__ = ("__factories",)
-    __factories: dict[object, tuple[LifeTime, Callable[[], object]]]
+    __factories: dict[object, FactoryRegistration]
 
     def __init__(
         self,
         *,
         catalog: ProviderCatalog,
-        factories: dict[object, tuple[LifeTime, Callable[[], object]]] | None = None,
+        factories: dict[object, FactoryRegistration] | None = None,
     ) -> None:
         super().__init__(catalog=catalog)
         object.__setattr__(self, f"_{type(self).__name__}__factories", factories or dict())
 
+    def routing(self) -> ProviderRouting:
+        return ProviderRouting(keys=self.__factories.keys())
+
     def can_provide(self, dependency: object) -> bool:
         return dependency in self.__factories
 
@@ -39,29 +59,55 @@ class FactoryProvider(Provider):
 
     def maybe_debug(self, dependency: object) -> DependencyDebug | None:
         try:
-            lifetime, factory = self.__factories[dependency]
+            registration = self.__factories[dependency]
         except KeyError:
             return None
         return DependencyDebug(
-            description=debug_repr(dependency), lifetime=lifetime, wired=[factory]
+            description=debug_repr(dependency),
+            lifetime=registration.lifetime,
+            wired=[registration.factory],
         )
 
     def unsafe_maybe_provide(self, dependency: object, out: ProvidedDependency) -> None:
         try:
-            lifetime, factory = self.__factories[dependency]
+            registration = self.__factories[dependency]
         except KeyError:
             return
 
-        out.set_value(factory(), lifetime=lifetime, callback=factory)
+        factory = registration.factory
+        out.set_value(
+            factory(),
+            lifetime=registration.lifetime,
+            callback=factory,
+            ttl=registration.ttl,
+            serve_stale=registration.serve_stale,
+            finalizer=registration.finalizer,
+            pool=registration.pool,
+        )
 
     def register(
-        self, *, dependency: object, lifetime: LifeTime, factory: Callable[[], object]
+        self,
+        *,
+        dependency: object,
+        lifetime: LifeTime,
+        factory: Callable[[], object],
+        ttl: float | None = None,
+        serve_stale: bool = False,
+        finalizer: Callable[[Any], object] | None = None,
+        pool: PoolLimit | None = None,
     ) -> None:
         self._catalog.raise_if_frozen()
-        registration = (lifetime, factory)
+        registration = FactoryRegistration(
+            lifetime=lifetime,
+            factory=factory,
+            ttl=ttl,
+            serve_stale=serve_stale,
+            finalizer=finalizer,
+            pool=pool,
+        )
         if self.__factories.setdefault(dependency, registration) is not registration:
             raise DuplicateDependencyError(f"Dependency {dependency!r} was already registered.")
 
-    def pop(self, dependency: object) -> tuple[LifeTime, Callable[[], object]] | None:
+    def pop(self, dependency: object) -> FactoryRegistration | None:
         self._catalog.raise_if_frozen()
         return self.__factories.pop(dependency, None)
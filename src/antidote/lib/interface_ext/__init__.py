@@ -1026,6 +1026,9 @@ class implements:
         def overriding(self, __existing_implementation: In) -> Callable[[C], C]:
             ...
 
+        def switch(self, __current_implementation: In, __new_implementation: In) -> None:
+            ...
+
         def as_default(self, __impl: C) -> C:
             ...
 
@@ -1109,6 +1112,45 @@ class implements:
         """
         ...
 
+    @API.experimental
+    def switch(self, __current_implementation: Any, __new_implementation: Any) -> None:
+        """
+        Replaces at runtime an existing implementation, keeping its predicates, similarly to
+        :py:meth:`~.implements.overriding`. Contrary to the latter it can be used while the
+        catalog is in use, even frozen, to switch between implementations such as a feature
+        flagged client. The new implementation must then already be known by the catalog, for
+        example a class declared with :py:func:`.injectable` or a previous implementation.
+
+        The new implementation is retrieved once, without holding any lock, before being published
+        atomically. Ongoing resolutions keep using the previous implementation and none of them
+        is blocked. Values already injected in singletons are not affected.
+
+        .. doctest:: lib_interface_implements_switch
+
+            >>> from antidote import interface, implements, injectable, world
+            >>> @interface
+            ... class Client:
+            ...     pass
+            >>> @implements(Client)
+            ... class ClientV1(Client):
+            ...     pass
+            >>> @injectable
+            ... class ClientV2(Client):
+            ...     pass
+            >>> world.freeze()
+            >>> world[Client]
+            <ClientV1 object at ...>
+            >>> implements(Client).switch(ClientV1, ClientV2)
+            >>> world[Client]
+            <ClientV2 object at ...>
+
+        Args:
+            __current_implementation: **/positional-only/** Implementation to replace.
+            __new_implementation: **/positional-only/** Implementation to use instead.
+
+        """
+        ...
+
     def as_default(self, __impl: Any) -> Any:
         """
         .. versionadded: 1.4
@@ -1278,6 +1320,9 @@ class ClassImplements(implements, Generic[In], ABC):
     def overriding(self, __existing_implementation: In) -> Callable[[C], C]:
         ...
 
+    def switch(self, __current_implementation: In, __new_implementation: In) -> None:
+        ...
+
     def as_default(self, __impl: C) -> C:
         ...
 
@@ -496,6 +496,18 @@ class ImplementsImpl(Generic[T]):
 
         return register
 
+    def switch(self, __current_implementation: T, __new_implementation: T) -> None:
+        prepared = self.__prepare(__new_implementation)
+        # Retrieved before being published, so no lock is held during its construction.
+        self.__catalog.private[prepared.dependency]
+        switched = self.__catalog[ImplementationsRegistryDependency(self.__interface)].switch(
+            current_identifier=__current_implementation,
+            new_identifier=prepared.out,
+            new_dependency=prepared.dependency,
+        )
+        if not switched:
+            raise ValueError(f"Implementation {__current_implementation!r} does not exist.")
+
     def as_default(self, __impl: T) -> T:
         prepared = self.__prepare(__impl)
         self.__catalog[ImplementationsRegistryDependency(self.__interface)].set_default(
@@ -590,17 +602,23 @@ def register_overridable_class(
     # the ``register_injectable` use with `dependency` is poorly written.
     from ..injectable_ext._provider import FactoryProvider
 
-    lifetime_factory = catalog.providers[FactoryProvider].pop(interface)
-    if lifetime_factory is not None:
+    registration = catalog.providers[FactoryProvider].pop(interface)
+    if registration is not None:
         if not isinstance(wiring, Default):
             raise RuntimeError(
                 f"Class has already exists in the catalog {catalog.private}, and thus "
                 f"@overridable refuses to apply the specified wiring as one was probably "
                 f"already applied."
             )
-        lifetime, factory = lifetime_factory
         dependency: object = lazy.value(
-            factory, lifetime=lifetime, catalog=catalog.private, inject=None
+            registration.factory,
+            lifetime=registration.lifetime,
+            ttl=registration.ttl,
+            serve_stale=registration.serve_stale,
+            finalizer=registration.finalizer,
+            pool=registration.pool,
+            catalog=catalog.private,
+            inject=None,
         )
     else:
         if wiring is not None:
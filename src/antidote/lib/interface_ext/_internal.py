@@ -70,7 +70,7 @@ class Constraint(Generic[Pred]):
 @API.private
 @dataclass(frozen=True)
 class ImplementationQuery(Generic[Out], metaclass=CachedMeta):
-    __slots__ = ("interface", "constraints", "all", "__weakref__")
+    __slots__ = ("interface", "constraints", "all", "__hash", "__weakref__")
     interface: object
     constraints: Sequence[Constraint[Any]]
     all: bool
@@ -82,9 +82,28 @@ class ImplementationQuery(Generic[Out], metaclass=CachedMeta):
         constraints: Iterable[Constraint[Any]] = tuple(),
         all: bool = False,
     ) -> None:
+        constraints = tuple(constraints)
         object.__setattr__(self, "interface", interface)
-        object.__setattr__(self, "constraints", tuple(constraints))
+        object.__setattr__(self, "constraints", constraints)
         object.__setattr__(self, "all", all)
+        # Queries are interned and used as keys of the catalog caches, hashing them once avoids
+        # hashing all the constraints on every lookup. It's declared here and not in the class
+        # body to not be a field of the dataclass.
+        self.__hash: int
+        object.__setattr__(
+            self, f"_{type(self).__name__}__hash", hash((interface, constraints, all))
+        )
+
+    def __hash__(self) -> int:
+        return self.__hash
+
+    def __eq__(self, other: object) -> bool:
+        return self is other or (
+            isinstance(other, ImplementationQuery)
+            and other.all is self.all
+            and other.interface == self.interface
+            and other.constraints == self.constraints
+        )
 
     def __repr__(self) -> str:
         out = "AllOf" if self.all else "SingleOf"
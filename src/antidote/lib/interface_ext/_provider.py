@@ -18,12 +18,13 @@ from ...core import (
     ProvidedDependency,
     Provider,
     ProviderCatalog,
+    ProviderRouting,
 )
 from . import AmbiguousImplementationChoiceError, SingleImplementationNotFoundError
 from ._internal import Constraint, ImplementationQuery, ImplementationsRegistryDependency
 from .predicate import HeterogeneousWeightError, ImplementationWeight, NeutralWeight, Predicate
 
-__all__ = ["InterfaceProvider", "ImplementationsRegistry"]
+__all__ = ["InterfaceProvider", "ImplementationsRegistry", "ImplementationsSnapshot"]
 
 Weight = TypeVar("Weight", bound=ImplementationWeight)
 NewWeight = TypeVar("NewWeight", bound=ImplementationWeight)
@@ -53,6 +54,12 @@ class InterfaceProvider(Provider):
             implementations={key: value.copy() for key, value in self.__implementations.items()},
         )
 
+    def routing(self) -> ProviderRouting:
+        return ProviderRouting(
+            types=(ImplementationQuery, ImplementationsRegistryDependency),
+            keys=self.__implementations.keys(),
+        )
+
     def can_provide(self, dependency: object) -> bool:
         if isinstance(dependency, (ImplementationQuery, ImplementationsRegistryDependency)):
             return dependency.interface in self.__implementations
@@ -62,7 +69,7 @@ class InterfaceProvider(Provider):
         if isinstance(dependency, ImplementationQuery):
             query: ImplementationQuery[object] = dependency
             try:
-                implementations = self.__implementations[query.interface]
+                snapshot = self.__implementations[query.interface].snapshot
             except KeyError:
                 return
         else:
@@ -76,7 +83,7 @@ class InterfaceProvider(Provider):
                 return
 
             try:
-                implementations = self.__implementations[dependency]
+                snapshot = self.__implementations[dependency].snapshot
             except KeyError:
                 return
 
@@ -86,14 +93,14 @@ class InterfaceProvider(Provider):
 
         if query.all:
             values: list[object] = []
-            for candidate in reversed(implementations.candidates_ordered_asc):
+            for candidate in reversed(snapshot.candidates_ordered_asc):
                 if candidate.match(query.constraints):
                     values.append(get(candidate.implementation.dependency))
-            if implementations.default_implementation is not None and not values:
-                values.append(get(implementations.default_implementation.dependency))
+            if snapshot.default_implementation is not None and not values:
+                values.append(get(snapshot.default_implementation.dependency))
             out.set_value(values, lifetime=LifeTime.TRANSIENT)
         else:
-            candidates = reversed(implementations.candidates_ordered_asc)
+            candidates = reversed(snapshot.candidates_ordered_asc)
             for candidate in candidates:
                 if candidate.match(query.constraints):
                     left_impl = candidate
@@ -110,10 +117,10 @@ class InterfaceProvider(Provider):
                         get(candidate.implementation.dependency), lifetime=LifeTime.TRANSIENT
                     )
                     return
-            if implementations.default_implementation is not None:
+            if snapshot.default_implementation is not None:
                 # TODO: can be more efficient by using container.provide() when frozen for caching.
                 out.set_value(
-                    get(implementations.default_implementation.dependency),
+                    get(snapshot.default_implementation.dependency),
                     lifetime=LifeTime.TRANSIENT,
                 )
                 return
@@ -124,13 +131,13 @@ class InterfaceProvider(Provider):
             dependency = ImplementationQuery[object](dependency)
 
         try:
-            implementations = self.__implementations[dependency.interface]
+            snapshot = self.__implementations[dependency.interface].snapshot
         except KeyError:
             return None
 
         values: list[CandidateImplementation[Any]] = [
             impl
-            for impl in reversed(implementations.candidates_ordered_asc)
+            for impl in reversed(snapshot.candidates_ordered_asc)
             if impl.match(dependency.constraints)
         ]
 
@@ -143,11 +150,11 @@ class InterfaceProvider(Provider):
                 )
             )
 
-        if not dependencies and implementations.default_implementation is not None:
+        if not dependencies and snapshot.default_implementation is not None:
             dependencies.append(
                 DebugInfoPrefix(
                     prefix="[Default] ",
-                    dependency=implementations.default_implementation.dependency,
+                    dependency=snapshot.default_implementation.dependency,
                 )
             )
 
@@ -165,74 +172,108 @@ class InterfaceProvider(Provider):
         return implementations
 
 
+@API.private
+@final
+@dataclass(frozen=True, eq=False)
+class ImplementationsSnapshot:
+    """
+    Immutable state of an :py:class:`.ImplementationsRegistry`. Changes publish a new snapshot, so
+    resolutions only read it once and never see a partial change.
+    """
+
+    __slots__ = ("candidates_ordered_asc", "default_implementation")
+    candidates_ordered_asc: tuple[CandidateImplementation[Any], ...]
+    default_implementation: Implementation | None
+
+    def replace(
+        self, *, current_identifier: object, new: Implementation
+    ) -> ImplementationsSnapshot | None:
+        for pos, candidate in enumerate(self.candidates_ordered_asc):
+            if candidate.implementation.identifier == current_identifier:
+                candidates = list(self.candidates_ordered_asc)
+                candidates[pos] = dataclasses.replace(candidate, implementation=new)
+                return dataclasses.replace(self, candidates_ordered_asc=tuple(candidates))
+        if (
+            self.default_implementation is not None
+            and self.default_implementation.identifier == current_identifier
+        ):
+            return dataclasses.replace(self, default_implementation=new)
+        return None
+
+
 @API.private
 @final
 @dataclass(frozen=True, eq=False)
 class ImplementationsRegistry:
-    __slots__ = ("catalog", "lock", "candidates_ordered_asc", "default_implementation")
+    __slots__ = ("catalog", "lock", "snapshot")
     catalog: ProviderCatalog
     lock: threading.RLock
-    candidates_ordered_asc: tuple[CandidateImplementation[Any]]
-    default_implementation: Implementation | None
+    snapshot: ImplementationsSnapshot
 
     def __init__(
         self,
         *,
         catalog: ProviderCatalog,
-        candidates_ordered_asc: tuple[CandidateImplementation[Any]] = cast(Any, tuple()),
-        default_implementation: Implementation | None = None,
+        snapshot: ImplementationsSnapshot | None = None,
         lock: threading.RLock | None = None,
     ) -> None:
         object.__setattr__(self, "catalog", catalog)
         object.__setattr__(self, "lock", lock or threading.RLock())
-        object.__setattr__(self, "candidates_ordered_asc", candidates_ordered_asc)
-        object.__setattr__(self, "default_implementation", default_implementation)
+        object.__setattr__(
+            self,
+            "snapshot",
+            snapshot
+            or ImplementationsSnapshot(candidates_ordered_asc=(), default_implementation=None),
+        )
 
     def copy(self) -> ImplementationsRegistry:
-        return ImplementationsRegistry(
-            catalog=self.catalog,
-            candidates_ordered_asc=self.candidates_ordered_asc,
-            default_implementation=self.default_implementation,
-            lock=self.lock,
-        )
+        return ImplementationsRegistry(catalog=self.catalog, snapshot=self.snapshot, lock=self.lock)
 
     def set_default(self, *, identifier: object, dependency: object) -> None:
         self.catalog.raise_if_frozen()
         with self.lock:
-            if self.default_implementation is not None:
+            if self.snapshot.default_implementation is not None:
                 raise RuntimeError(
                     f"Default dependency already defined as "
-                    f"{self.default_implementation.identifier!r}"
+                    f"{self.snapshot.default_implementation.identifier!r}"
+                )
+            self.__publish(
+                dataclasses.replace(
+                    self.snapshot,
+                    default_implementation=Implementation(
+                        identifier=identifier, dependency=dependencyOf(dependency).wrapped
+                    ),
                 )
-            object.__setattr__(
-                self,
-                "default_implementation",
-                Implementation(identifier=identifier, dependency=dependencyOf(dependency).wrapped),
             )
 
     def replace(
         self, *, current_identifier: object, new_identifier: object, new_dependency: object
     ) -> bool:
         self.catalog.raise_if_frozen()
+        return self.switch(
+            current_identifier=current_identifier,
+            new_identifier=new_identifier,
+            new_dependency=new_dependency,
+        )
+
+    def switch(
+        self, *, current_identifier: object, new_identifier: object, new_dependency: object
+    ) -> bool:
+        """
+        Same as :py:meth:`.replace`, but also allowed once the catalog is frozen. Ongoing
+        resolutions keep using the previous snapshot.
+        """
+        new_implementation = Implementation(
+            identifier=new_identifier, dependency=dependencyOf(new_dependency).wrapped
+        )
         with self.lock:
-            new_implementation = Implementation(
-                identifier=new_identifier, dependency=dependencyOf(new_dependency).wrapped
+            snapshot = self.snapshot.replace(
+                current_identifier=current_identifier, new=new_implementation
             )
-            for pos, candidate in enumerate(self.candidates_ordered_asc):
-                if candidate.implementation.identifier == current_identifier:
-                    candidates = list(self.candidates_ordered_asc)
-                    candidates[pos] = dataclasses.replace(
-                        candidate, implementation=new_implementation
-                    )
-                    object.__setattr__(self, "candidates_ordered_asc", tuple(candidates))
-                    return True
-            if (
-                self.default_implementation is not None
-                and self.default_implementation.identifier == current_identifier
-            ):
-                object.__setattr__(self, "default_implementation", new_implementation)
-                return True
-        return False
+            if snapshot is None:
+                return False
+            self.__publish(snapshot)
+        return True
 
     def add(
         self,
@@ -255,21 +296,20 @@ class ImplementationsRegistry:
                 self.__unsafe_add_candidate(maybe_candidate)
 
     def __unsafe_add_candidate(self, candidate: CandidateImplementation[Any]) -> None:
-        if not self.candidates_ordered_asc:
-            object.__setattr__(self, "candidates_ordered_asc", (candidate,))
+        current = self.snapshot.candidates_ordered_asc
+        if not current:
+            self.__publish(dataclasses.replace(self.snapshot, candidates_ordered_asc=(candidate,)))
             return
 
-        first = self.candidates_ordered_asc[0]
+        first = current[0]
         if isinstance(first.weight, NeutralWeight) and not isinstance(
             candidate.weight, NeutralWeight
         ):
             # Fix all weights at once.
             w_type: Type[ImplementationWeight] = type(candidate.weight)
-            candidates = [
-                c.with_weight_type(weight_type=w_type) for c in self.candidates_ordered_asc
-            ]
+            candidates = [c.with_weight_type(weight_type=w_type) for c in current]
         else:
-            candidates = list(self.candidates_ordered_asc)
+            candidates = list(current)
             if not isinstance(first.weight, NeutralWeight) and isinstance(
                 candidate.weight, NeutralWeight
             ):
@@ -281,7 +321,11 @@ class ImplementationsRegistry:
         if pos > 0 and not (candidates[pos - 1] < candidate):
             candidate = dataclasses.replace(candidate, same_weight_as_left=True)
         candidates.insert(pos, candidate)
-        object.__setattr__(self, "candidates_ordered_asc", tuple(candidates))
+        self.__publish(dataclasses.replace(self.snapshot, candidates_ordered_asc=tuple(candidates)))
+
+    def __publish(self, snapshot: ImplementationsSnapshot) -> None:
+        # A single attribute assignment, readers don't need any lock.
+        object.__setattr__(self, "snapshot", snapshot)
 
 
 @API.private
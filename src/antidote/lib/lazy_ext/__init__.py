@@ -6,7 +6,7 @@ from typing_extensions import Concatenate, ParamSpec, Protocol
 
 from ..._internal import API, Default
 from ..._internal.typing import Out, T
-from ...core import Catalog, Dependency, LifetimeType, TypeHintsLocals, world
+from ...core import CacheInfo, Catalog, Dependency, LifetimeType, PoolLimit, TypeHintsLocals, world
 from ._const import ConstImpl
 from ._lazy import LazyImpl
 
@@ -198,6 +198,11 @@ class Lazy(Protocol):
         self,
         *,
         lifetime: LifetimeType = ...,
+        ttl: float | None = ...,
+        serve_stale: bool = ...,
+        finalizer: Callable[[Any], object] | None = ...,
+        pool: PoolLimit | None = ...,
+        maxsize: int | None = ...,
         inject: None | Default = ...,
         type_hints_locals: TypeHintsLocals = ...,
         catalog: Catalog = ...,
@@ -210,6 +215,11 @@ class Lazy(Protocol):
         __func: staticmethod[Callable[P, T]],
         *,
         lifetime: LifetimeType = ...,
+        ttl: float | None = ...,
+        serve_stale: bool = ...,
+        finalizer: Callable[[Any], object] | None = ...,
+        pool: PoolLimit | None = ...,
+        maxsize: int | None = ...,
         inject: None | Default = ...,
         type_hints_locals: TypeHintsLocals = ...,
         catalog: Catalog = ...,
@@ -222,6 +232,11 @@ class Lazy(Protocol):
         __func: Callable[P, T],
         *,
         lifetime: LifetimeType = ...,
+        ttl: float | None = ...,
+        serve_stale: bool = ...,
+        finalizer: Callable[[Any], object] | None = ...,
+        pool: PoolLimit | None = ...,
+        maxsize: int | None = ...,
         inject: None | Default = ...,
         type_hints_locals: TypeHintsLocals = ...,
         catalog: Catalog = ...,
@@ -233,6 +248,11 @@ class Lazy(Protocol):
         __func: object = None,
         *,
         lifetime: LifetimeType = "singleton",
+        ttl: float | None = None,
+        serve_stale: bool = False,
+        finalizer: Callable[[Any], object] | None = None,
+        pool: PoolLimit | None = None,
+        maxsize: int | None = None,
         inject: None | Default = Default.sentinel,
         type_hints_locals: TypeHintsLocals = Default.sentinel,
         catalog: Catalog = world,
@@ -279,6 +299,23 @@ class Lazy(Protocol):
                 dependencies.
             lifetime: Defines how long the dependency value will be cached. Defaults to
                 :code:`'singleton'`, the function is called at most once per group of arguments.
+            ttl: Number of seconds after which the dependency value expires and is computed
+                again on the next request, as measured by :py:attr:`.Config.clock`. Defaults to
+                :py:obj:`None`, it never expires. Not supported for transient dependencies.
+            serve_stale: Whether the expired value should be returned to other threads while one
+                of them computes the new one instead of waiting for it. Defaults to
+                :py:obj:`False`.
+            finalizer: Called with the dependency value once discarded, only supported for the
+                :code:`'thread'` and :code:`'loop'` lifetimes. For example to close a connection
+                when its thread exits. For the latter, it's called when the event loop shuts down
+                and its result is awaited if necessary. Defaults to :py:obj:`None`.
+            pool: :py:class:`.PoolLimit` of the dependency values, required for the
+                :code:`'pooled'` lifetime and only supported for it. Each injected call borrows a
+                value from the pool and returns it once finished. Defaults to :py:obj:`None`.
+            maxsize: Maximum number of dependency values kept for the different groups of
+                arguments. When exceeded, the least recently used one is discarded. Hits, misses
+                and evictions are available through :py:meth:`~.LazyFunction.cache_info`.
+                Defaults to :py:obj:`None`, unbounded. Not supported for transient dependencies.
             inject: Specifying :py:obj:`None` will prevent the use of py:obj:`.inject` on the
                 function.
             type_hints_locals: Local variables to use for :py:func:`typing.get_type_hints`. They
@@ -301,6 +338,11 @@ class Lazy(Protocol):
         self,
         *,
         lifetime: LifetimeType = ...,
+        ttl: float | None = ...,
+        serve_stale: bool = ...,
+        finalizer: Callable[[Any], object] | None = ...,
+        pool: PoolLimit | None = ...,
+        maxsize: int | None = ...,
         inject: None = ...,
         type_hints_locals: TypeHintsLocals = ...,
         catalog: Catalog = ...,
@@ -313,6 +355,11 @@ class Lazy(Protocol):
         __func: Callable[Concatenate[Any, P], T],
         *,
         lifetime: LifetimeType = ...,
+        ttl: float | None = ...,
+        serve_stale: bool = ...,
+        finalizer: Callable[[Any], object] | None = ...,
+        pool: PoolLimit | None = ...,
+        maxsize: int | None = ...,
         inject: None = ...,
         type_hints_locals: TypeHintsLocals = ...,
         catalog: Catalog = ...,
@@ -324,6 +371,11 @@ class Lazy(Protocol):
         __func: object = None,
         *,
         lifetime: LifetimeType = "transient",
+        ttl: float | None = None,
+        serve_stale: bool = False,
+        finalizer: Callable[[Any], object] | None = None,
+        pool: PoolLimit | None = None,
+        maxsize: int | None = None,
         inject: None | Default = Default.sentinel,
         type_hints_locals: TypeHintsLocals = Default.sentinel,
         catalog: Catalog = world,
@@ -374,6 +426,23 @@ class Lazy(Protocol):
                 dependencies.
             lifetime: Defines how long the dependency value will be cached. Defaults to
                 :code:`'singleton'`, the method is called at most once per group of arguments.
+            ttl: Number of seconds after which the dependency value expires and is computed
+                again on the next request, as measured by :py:attr:`.Config.clock`. Defaults to
+                :py:obj:`None`, it never expires. Not supported for transient dependencies.
+            serve_stale: Whether the expired value should be returned to other threads while one
+                of them computes the new one instead of waiting for it. Defaults to
+                :py:obj:`False`.
+            finalizer: Called with the dependency value once discarded, only supported for the
+                :code:`'thread'` and :code:`'loop'` lifetimes. For example to close a connection
+                when its thread exits. For the latter, it's called when the event loop shuts down
+                and its result is awaited if necessary. Defaults to :py:obj:`None`.
+            pool: :py:class:`.PoolLimit` of the dependency values, required for the
+                :code:`'pooled'` lifetime and only supported for it. Each injected call borrows a
+                value from the pool and returns it once finished. Defaults to :py:obj:`None`.
+            maxsize: Maximum number of dependency values kept for the different groups of
+                arguments. When exceeded, the least recently used one is discarded. Hits, misses
+                and evictions are available through :py:meth:`~.LazyMethod.cache_info`.
+                Defaults to :py:obj:`None`, unbounded. Not supported for transient dependencies.
             inject: Specifying :py:obj:`None` will prevent the use of py:obj:`.inject` on the
                 function.
             type_hints_locals: Local variables to use for :py:func:`typing.get_type_hints`. They
@@ -396,6 +465,10 @@ class Lazy(Protocol):
         self,
         *,
         lifetime: LifetimeType = ...,
+        ttl: float | None = ...,
+        serve_stale: bool = ...,
+        finalizer: Callable[[Any], object] | None = ...,
+        pool: PoolLimit | None = ...,
         inject: None = ...,
         type_hints_locals: TypeHintsLocals = ...,
         catalog: Catalog = ...,
@@ -408,6 +481,10 @@ class Lazy(Protocol):
         __func: Callable[[Any], T],
         *,
         lifetime: LifetimeType = ...,
+        ttl: float | None = ...,
+        serve_stale: bool = ...,
+        finalizer: Callable[[Any], object] | None = ...,
+        pool: PoolLimit | None = ...,
         inject: None = ...,
         type_hints_locals: TypeHintsLocals = ...,
         catalog: Catalog = ...,
@@ -419,6 +496,10 @@ class Lazy(Protocol):
         __func: object = None,
         *,
         lifetime: LifetimeType = "transient",
+        ttl: float | None = None,
+        serve_stale: bool = False,
+        finalizer: Callable[[Any], object] | None = None,
+        pool: PoolLimit | None = None,
         inject: None | Default = Default.sentinel,
         type_hints_locals: TypeHintsLocals = Default.sentinel,
         catalog: Catalog = world,
@@ -471,6 +552,19 @@ class Lazy(Protocol):
                 dependencies.
             lifetime: Defines how long the dependency value will be cached. Defaults to
                 :code:`'singleton'`, the method is called at most once.
+            ttl: Number of seconds after which the dependency value expires and is computed
+                again on the next request, as measured by :py:attr:`.Config.clock`. Defaults to
+                :py:obj:`None`, it never expires. Not supported for transient dependencies.
+            serve_stale: Whether the expired value should be returned to other threads while one
+                of them computes the new one instead of waiting for it. Defaults to
+                :py:obj:`False`.
+            finalizer: Called with the dependency value once discarded, only supported for the
+                :code:`'thread'` and :code:`'loop'` lifetimes. For example to close a connection
+                when its thread exits. For the latter, it's called when the event loop shuts down
+                and its result is awaited if necessary. Defaults to :py:obj:`None`.
+            pool: :py:class:`.PoolLimit` of the dependency values, required for the
+                :code:`'pooled'` lifetime and only supported for it. Each injected call borrows a
+                value from the pool and returns it once finished. Defaults to :py:obj:`None`.
             inject: Specifying :py:obj:`None` will prevent the use of py:obj:`.inject` on the
                 function.
             type_hints_locals: Local variables to use for :py:func:`typing.get_type_hints`. They
@@ -493,6 +587,10 @@ class Lazy(Protocol):
         self,
         *,
         lifetime: LifetimeType = ...,
+        ttl: float | None = ...,
+        serve_stale: bool = ...,
+        finalizer: Callable[[Any], object] | None = ...,
+        pool: PoolLimit | None = ...,
         inject: None = ...,
         type_hints_locals: TypeHintsLocals = ...,
         catalog: Catalog = ...,
@@ -505,6 +603,10 @@ class Lazy(Protocol):
         __func: Callable[[], T] | staticmethod[Callable[[], T]],
         *,
         lifetime: LifetimeType = ...,
+        ttl: float | None = ...,
+        serve_stale: bool = ...,
+        finalizer: Callable[[Any], object] | None = ...,
+        pool: PoolLimit | None = ...,
         inject: None = ...,
         type_hints_locals: TypeHintsLocals = ...,
         catalog: Catalog = ...,
@@ -516,6 +618,10 @@ class Lazy(Protocol):
         __func: object = None,
         *,
         lifetime: LifetimeType = "transient",
+        ttl: float | None = None,
+        serve_stale: bool = False,
+        finalizer: Callable[[Any], object] | None = None,
+        pool: PoolLimit | None = None,
         inject: None | Default = Default.sentinel,
         type_hints_locals: TypeHintsLocals = Default.sentinel,
         catalog: Catalog = world,
@@ -560,6 +666,19 @@ class Lazy(Protocol):
                 dependencies.
             lifetime: Defines how long the dependency value will be cached. Defaults to
                 :code:`'singleton'`, the function is called at most once.
+            ttl: Number of seconds after which the dependency value expires and is computed
+                again on the next request, as measured by :py:attr:`.Config.clock`. Defaults to
+                :py:obj:`None`, it never expires. Not supported for transient dependencies.
+            serve_stale: Whether the expired value should be returned to other threads while one
+                of them computes the new one instead of waiting for it. Defaults to
+                :py:obj:`False`.
+            finalizer: Called with the dependency value once discarded, only supported for the
+                :code:`'thread'` and :code:`'loop'` lifetimes. For example to close a connection
+                when its thread exits. For the latter, it's called when the event loop shuts down
+                and its result is awaited if necessary. Defaults to :py:obj:`None`.
+            pool: :py:class:`.PoolLimit` of the dependency values, required for the
+                :code:`'pooled'` lifetime and only supported for it. Each injected call borrows a
+                value from the pool and returns it once finished. Defaults to :py:obj:`None`.
             inject: Specifying :py:obj:`None` will prevent the use of py:obj:`.inject` on the
                 function.
             type_hints_locals: Local variables to use for :py:func:`typing.get_type_hints`. They
@@ -590,6 +709,20 @@ class LazyFunction(Protocol[P, Out]):
     def __call__(self, *args: P.args, **kwargs: P.kwargs) -> Dependency[Out]:
         ...
 
+    def is_call(self, __dependency: object) -> bool:
+        """
+        Whether the dependency was created by calling this lazy function. Typically used to
+        remove all of their values with :py:meth:`.Catalog.evict_where`.
+        """
+        ...
+
+    def cache_info(self) -> CacheInfo | None:
+        """
+        Statistics of the cache when the lazy function was defined with a :code:`maxsize`,
+        :py:obj:`None` otherwise.
+        """
+        ...
+
 
 @API.public
 class LazyMethod(Protocol[P, Out]):
@@ -604,6 +737,20 @@ class LazyMethod(Protocol[P, Out]):
     def __call__(self, *args: P.args, **kwargs: P.kwargs) -> Dependency[Out]:
         ...
 
+    def is_call(self, __dependency: object) -> bool:
+        """
+        Whether the dependency was created by calling this lazy method. Typically used to
+        remove all of their values with :py:meth:`.Catalog.evict_where`.
+        """
+        ...
+
+    def cache_info(self) -> CacheInfo | None:
+        """
+        Statistics of the cache when the lazy method was defined with a :code:`maxsize`,
+        :py:obj:`None` otherwise.
+        """
+        ...
+
     def __get__(self, instance: object, owner: type) -> LazyMethod[P, Out]:
         ...
 
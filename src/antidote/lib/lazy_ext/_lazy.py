@@ -17,10 +17,13 @@ from ..._internal import (
     retrieve_or_validate_injection_locals,
     short_id,
     Singleton,
+    validate_ttl,
     wraps_frozen,
 )
 from ..._internal.typing import Function, Out, P, T
 from ...core import (
+    CacheInfo,
+    CacheLimit,
     Catalog,
     CatalogId,
     Dependency,
@@ -29,6 +32,7 @@ from ...core import (
     is_catalog,
     LifeTime,
     LifetimeType,
+    PoolLimit,
     TypeHintsLocals,
     world,
 )
@@ -42,6 +46,18 @@ __all__ = [
     "LazyWrapper",
 ]
 
+# Lifetimes which support neither a ttl nor a maxsize.
+_UNBOUNDED_LIFETIMES = frozenset(
+    {
+        LifeTime.TRANSIENT,
+        LifeTime.WEAK,
+        LifeTime.THREAD,
+        LifeTime.POOLED,
+        LifeTime.RESOLUTION,
+        LifeTime.LOOP,
+    }
+)
+
 
 @API.private
 @final
@@ -92,6 +108,11 @@ class LazyImpl(Singleton):
         self,
         *,
         lifetime: LifetimeType = ...,
+        ttl: float | None = ...,
+        serve_stale: bool = ...,
+        finalizer: Callable[[Any], object] | None = ...,
+        pool: PoolLimit | None = ...,
+        maxsize: int | None = ...,
         inject: None | Default = ...,
         type_hints_locals: TypeHintsLocals = ...,
         catalog: Catalog = ...,
@@ -104,6 +125,11 @@ class LazyImpl(Singleton):
         __func: staticmethod[Callable[P, T]],
         *,
         lifetime: LifetimeType = ...,
+        ttl: float | None = ...,
+        serve_stale: bool = ...,
+        finalizer: Callable[[Any], object] | None = ...,
+        pool: PoolLimit | None = ...,
+        maxsize: int | None = ...,
         inject: None | Default = ...,
         type_hints_locals: TypeHintsLocals = ...,
         catalog: Catalog = ...,
@@ -116,6 +142,11 @@ class LazyImpl(Singleton):
         __func: Callable[P, T],
         *,
         lifetime: LifetimeType = ...,
+        ttl: float | None = ...,
+        serve_stale: bool = ...,
+        finalizer: Callable[[Any], object] | None = ...,
+        pool: PoolLimit | None = ...,
+        maxsize: int | None = ...,
         inject: None | Default = ...,
         type_hints_locals: TypeHintsLocals = ...,
         catalog: Catalog = ...,
@@ -127,6 +158,11 @@ class LazyImpl(Singleton):
         __func: object = None,
         *,
         lifetime: LifetimeType = "singleton",
+        ttl: float | None = None,
+        serve_stale: bool = False,
+        finalizer: Callable[[Any], object] | None = None,
+        pool: PoolLimit | None = None,
+        maxsize: int | None = None,
         inject: None | Default = Default.sentinel,
         type_hints_locals: TypeHintsLocals = Default.sentinel,
         catalog: Catalog = world,
@@ -135,6 +171,29 @@ class LazyImpl(Singleton):
         if not is_catalog(catalog):
             raise TypeError(f"catalog must be a Catalog, not a {type(catalog)!r}")
         catalog.raise_if_frozen()
+        ttl = validate_ttl(ttl, serve_stale)
+        lifetime_ = LifeTime.of(lifetime)
+        if ttl is not None and lifetime_ in _UNBOUNDED_LIFETIMES:
+            raise ValueError(f"{lifetime_.name.title()} dependencies cannot have a ttl")
+        limit: CacheLimit | None = None
+        if maxsize is not None:
+            if _kind in {FunctionKind.PROPERTY, FunctionKind.VALUE}:
+                raise TypeError("maxsize is only supported by lazy functions and methods.")
+            if lifetime_ in _UNBOUNDED_LIFETIMES:
+                raise ValueError(f"{lifetime_.name.title()} dependencies cannot have a maxsize")
+            limit = CacheLimit(maxsize=maxsize)
+        if finalizer is not None:
+            if not callable(finalizer):
+                raise TypeError(f"finalizer must be callable, not a {type(finalizer)!r}")
+            if lifetime_ is not LifeTime.THREAD and lifetime_ is not LifeTime.LOOP:
+                raise ValueError("Only thread and loop dependencies can have a finalizer")
+        if pool is not None:
+            if not isinstance(pool, PoolLimit):
+                raise TypeError(f"pool must be a PoolLimit or None, not a {type(pool)!r}")
+            if lifetime_ is not LifeTime.POOLED:
+                raise ValueError("Only pooled dependencies can have a pool")
+        elif lifetime_ is LifeTime.POOLED:
+            raise ValueError("Pooled dependencies require a pool")
 
         inject_ = prepare_injection(
             inject=inject,
@@ -173,6 +232,11 @@ class LazyImpl(Singleton):
                     wrapped=wrapped,
                     injected_method=injected,  # type: ignore
                     lifetime=lifetime,
+                    ttl=ttl,
+                    serve_stale=serve_stale,
+                    finalizer=finalizer,
+                    pool=pool,
+                    limit=limit,
                     catalog_id=catalog.id,
                 )
             elif _kind is FunctionKind.PROPERTY:
@@ -180,6 +244,10 @@ class LazyImpl(Singleton):
                     wrapped=wrapped,
                     injected_method=injected,  # type: ignore
                     lifetime=lifetime,
+                    ttl=ttl,
+                    serve_stale=serve_stale,
+                    finalizer=finalizer,
+                    pool=pool,
                     catalog_id=catalog.id,
                 )
             elif _kind is FunctionKind.FUNCTION:
@@ -187,6 +255,11 @@ class LazyImpl(Singleton):
                     wrapped=wrapped,
                     injected=injected,
                     lifetime=lifetime,
+                    ttl=ttl,
+                    serve_stale=serve_stale,
+                    finalizer=finalizer,
+                    pool=pool,
+                    limit=limit,
                     catalog_id=catalog.id,
                 )
             else:
@@ -195,6 +268,10 @@ class LazyImpl(Singleton):
                     wrapped=wrapped,
                     injected=injected,
                     lifetime=lifetime,
+                    ttl=ttl,
+                    serve_stale=serve_stale,
+                    finalizer=finalizer,
+                    pool=pool,
                     catalog_id=catalog.id,
                 )
 
@@ -226,6 +303,10 @@ class LazyValue(LazyWrapper, Generic[Out]):
         injected: Callable[[], Out],
         catalog_id: CatalogId,
         lifetime: LifeTime,
+        ttl: float | None,
+        serve_stale: bool,
+        finalizer: Callable[[Any], object] | None,
+        pool: PoolLimit | None,
     ) -> None:
         object.__setattr__(self, f"_{type(self).__name__}__injected", injected)
         object.__setattr__(self, f"_{type(self).__name__}__catalog_id", catalog_id)
@@ -238,6 +319,10 @@ class LazyValue(LazyWrapper, Generic[Out]):
                 kwargs=EMPTY_DICT,
                 lifetime=lifetime,
                 catalog_id=catalog_id,
+                ttl=ttl,
+                serve_stale=serve_stale,
+                finalizer=finalizer,
+                pool=pool,
             ),
         )
         if not isinstance(wrapped, type):
@@ -260,12 +345,20 @@ class LazyPropertyImpl(LazyWrapper, Generic[P, Out]):
     __slots__ = (
         "__catalog_id",
         "__lifetime",
+        "__ttl",
+        "__serve_stale",
+        "__finalizer",
+        "__pool",
         "__injected_method",
         "__auto_self_dependency",
         "__dict__",
     )
     __catalog_id: CatalogId
     __lifetime: LifeTime
+    __ttl: float | None
+    __serve_stale: bool
+    __finalizer: Callable[[Any], object] | None
+    __pool: PoolLimit | None
     __injected_method: InjectedMethod[[], Out]
     __auto_self_dependency: Dependency[Out]
 
@@ -275,9 +368,17 @@ class LazyPropertyImpl(LazyWrapper, Generic[P, Out]):
         wrapped: Callable[..., object],
         injected_method: InjectedMethod[[], Out],
         lifetime: LifeTime,
+        ttl: float | None,
+        serve_stale: bool,
+        finalizer: Callable[[Any], object] | None,
+        pool: PoolLimit | None,
         catalog_id: CatalogId,
     ) -> None:
         object.__setattr__(self, f"_{type(self).__name__}__lifetime", lifetime)
+        object.__setattr__(self, f"_{type(self).__name__}__ttl", ttl)
+        object.__setattr__(self, f"_{type(self).__name__}__serve_stale", serve_stale)
+        object.__setattr__(self, f"_{type(self).__name__}__finalizer", finalizer)
+        object.__setattr__(self, f"_{type(self).__name__}__pool", pool)
         object.__setattr__(self, f"_{type(self).__name__}__injected_method", injected_method)
         object.__setattr__(self, f"_{type(self).__name__}__catalog_id", catalog_id)
         wraps_frozen(wrapped)(self)
@@ -295,6 +396,10 @@ class LazyPropertyImpl(LazyWrapper, Generic[P, Out]):
                 kwargs=EMPTY_DICT,
                 lifetime=self.__lifetime,
                 catalog_id=self.__catalog_id,
+                ttl=self.__ttl,
+                serve_stale=self.__serve_stale,
+                finalizer=self.__finalizer,
+                pool=self.__pool,
             ),
         )
 
@@ -317,6 +422,11 @@ class LazyMethodImpl(LazyWrapper, Generic[P, Out]):
         "__injected_method",
         "__cache",
         "__lifetime",
+        "__ttl",
+        "__serve_stale",
+        "__finalizer",
+        "__pool",
+        "__limit",
         "__signature",
         "__lazy_auto_self",
         "__dict__",
@@ -324,6 +434,11 @@ class LazyMethodImpl(LazyWrapper, Generic[P, Out]):
     __signature: inspect.Signature
     __injected_method: InjectedMethod[P, Out]
     __lifetime: LifeTime
+    __ttl: float | None
+    __serve_stale: bool
+    __finalizer: Callable[[Any], object] | None
+    __pool: PoolLimit | None
+    __limit: CacheLimit | None
     __catalog_id: CatalogId
 
     def __init__(
@@ -332,6 +447,11 @@ class LazyMethodImpl(LazyWrapper, Generic[P, Out]):
         wrapped: Callable[..., object],
         injected_method: InjectedMethod[P, Out],
         lifetime: LifeTime,
+        ttl: float | None,
+        serve_stale: bool,
+        finalizer: Callable[[Any], object] | None,
+        pool: PoolLimit | None,
+        limit: CacheLimit | None,
         catalog_id: CatalogId,
     ) -> None:
         signature: inspect.Signature = inspect.signature(wrapped)
@@ -339,6 +459,11 @@ class LazyMethodImpl(LazyWrapper, Generic[P, Out]):
         object.__setattr__(self, f"_{type(self).__name__}__signature", signature)
         object.__setattr__(self, f"_{type(self).__name__}__injected_method", injected_method)
         object.__setattr__(self, f"_{type(self).__name__}__lifetime", lifetime)
+        object.__setattr__(self, f"_{type(self).__name__}__ttl", ttl)
+        object.__setattr__(self, f"_{type(self).__name__}__serve_stale", serve_stale)
+        object.__setattr__(self, f"_{type(self).__name__}__finalizer", finalizer)
+        object.__setattr__(self, f"_{type(self).__name__}__pool", pool)
+        object.__setattr__(self, f"_{type(self).__name__}__limit", limit)
         object.__setattr__(self, f"_{type(self).__name__}__catalog_id", catalog_id)
         wraps_frozen(wrapped, signature=signature)(self)
 
@@ -357,8 +482,21 @@ class LazyMethodImpl(LazyWrapper, Generic[P, Out]):
             kwargs=bound.kwargs or EMPTY_DICT,
             lifetime=self.__lifetime,
             catalog_id=self.__catalog_id,
+            ttl=self.__ttl,
+            serve_stale=self.__serve_stale,
+            finalizer=self.__finalizer,
+            pool=self.__pool,
+            limit=self.__limit,
+        )
+
+    def is_call(self, __dependency: object) -> bool:
+        return isinstance(__dependency, LazyCall) and __dependency.is_call_of(
+            self.__injected_method
         )
 
+    def cache_info(self) -> CacheInfo | None:
+        return None if self.__limit is None else self.__limit.info()
+
     def __repr__(self) -> str:
         return f"LazyMethod(wrapped={self.__injected_method}, catalog_id={self.__catalog_id})"
 
@@ -372,11 +510,21 @@ class LazyFunctionImpl(LazyWrapper, Generic[P, Out]):
         "__injected",
         "__dependency_cache",
         "__lifetime",
+        "__ttl",
+        "__serve_stale",
+        "__finalizer",
+        "__pool",
+        "__limit",
         "__signature",
         "__dict__",
     )
     __signature: inspect.Signature
     __lifetime: LifeTime
+    __ttl: float | None
+    __serve_stale: bool
+    __finalizer: Callable[[Any], object] | None
+    __pool: PoolLimit | None
+    __limit: CacheLimit | None
     __catalog_id: CatalogId
     __wrapped__: Any
     __injected: Function[P, Out]
@@ -387,11 +535,21 @@ class LazyFunctionImpl(LazyWrapper, Generic[P, Out]):
         wrapped: Callable[..., object],
         injected: Callable[P, Out],
         lifetime: LifeTime,
+        ttl: float | None,
+        serve_stale: bool,
+        finalizer: Callable[[Any], object] | None,
+        pool: PoolLimit | None,
+        limit: CacheLimit | None,
         catalog_id: CatalogId,
     ) -> None:
         object.__setattr__(self, f"_{type(self).__name__}__signature", inspect.signature(wrapped))
         object.__setattr__(self, f"_{type(self).__name__}__injected", injected)
         object.__setattr__(self, f"_{type(self).__name__}__lifetime", lifetime)
+        object.__setattr__(self, f"_{type(self).__name__}__ttl", ttl)
+        object.__setattr__(self, f"_{type(self).__name__}__serve_stale", serve_stale)
+        object.__setattr__(self, f"_{type(self).__name__}__finalizer", finalizer)
+        object.__setattr__(self, f"_{type(self).__name__}__pool", pool)
+        object.__setattr__(self, f"_{type(self).__name__}__limit", limit)
         object.__setattr__(self, f"_{type(self).__name__}__catalog_id", catalog_id)
         wraps_frozen(wrapped, signature=self.__signature)(self)
 
@@ -406,7 +564,18 @@ class LazyFunctionImpl(LazyWrapper, Generic[P, Out]):
             kwargs=bound.kwargs or EMPTY_DICT,
             lifetime=self.__lifetime,
             catalog_id=self.__catalog_id,
+            ttl=self.__ttl,
+            serve_stale=self.__serve_stale,
+            finalizer=self.__finalizer,
+            pool=self.__pool,
+            limit=self.__limit,
         )
 
+    def is_call(self, __dependency: object) -> bool:
+        return isinstance(__dependency, LazyCall) and __dependency.is_call_of(self.__injected)
+
+    def cache_info(self) -> CacheInfo | None:
+        return None if self.__limit is None else self.__limit.info()
+
     def __repr__(self) -> str:
         return f"LazyFunction(wrapped={self.__injected}, catalog_id={self.__catalog_id})"
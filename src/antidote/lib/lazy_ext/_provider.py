@@ -8,12 +8,15 @@ from typing_extensions import final, TypeGuard
 from ..._internal import API, CachedMeta, debug_repr, debug_repr_call
 from ..._internal.typing import T
 from ...core import (
+    CacheLimit,
     CatalogId,
     DependencyDebug,
     LifeTime,
+    PoolLimit,
     ProvidedDependency,
     Provider,
     ProviderCatalog,
+    ProviderRouting,
     TestContextKind,
 )
 
@@ -37,9 +40,26 @@ class LazyDependency:
 @final
 @dataclass(frozen=True)
 class LazyCall(LazyDependency, Generic[T], metaclass=CachedMeta):
-    __slots__ = ("catalog_id", "__func", "__args", "__kwargs", "__lifetime", "__name")
+    __slots__ = (
+        "catalog_id",
+        "__func",
+        "__args",
+        "__kwargs",
+        "__lifetime",
+        "__ttl",
+        "__serve_stale",
+        "__finalizer",
+        "__pool",
+        "__limit",
+        "__name",
+    )
     catalog_id: CatalogId
     __lifetime: LifeTime
+    __ttl: float | None
+    __serve_stale: bool
+    __finalizer: Callable[[Any], object] | None
+    __pool: PoolLimit | None
+    __limit: CacheLimit | None
     __func: Callable[..., T]
     __args: Tuple[Any, ...]
     __kwargs: Dict[str, Any]
@@ -54,7 +74,14 @@ class LazyCall(LazyDependency, Generic[T], metaclass=CachedMeta):
         kwargs: Dict[str, Any],
         lifetime: LifeTime,
         catalog_id: CatalogId,
+        ttl: float | None = None,
+        serve_stale: bool = False,
+        finalizer: Callable[[Any], object] | None = None,
+        pool: PoolLimit | None = None,
+        limit: CacheLimit | None = None,
     ) -> None:
+        # ttl, serve_stale, limit, finalizer & pool are defined by the function, not part of the
+        # identity.
         try:
             _hash = hash((catalog_id, lifetime, func, args, tuple(sorted(kwargs.items()))))
         except TypeError:
@@ -63,6 +90,11 @@ class LazyCall(LazyDependency, Generic[T], metaclass=CachedMeta):
             _hash = object.__hash__(self)
         object.__setattr__(self, "catalog_id", catalog_id)
         object.__setattr__(self, f"_{type(self).__name__}__lifetime", lifetime)
+        object.__setattr__(self, f"_{type(self).__name__}__ttl", ttl)
+        object.__setattr__(self, f"_{type(self).__name__}__serve_stale", serve_stale)
+        object.__setattr__(self, f"_{type(self).__name__}__finalizer", finalizer)
+        object.__setattr__(self, f"_{type(self).__name__}__pool", pool)
+        object.__setattr__(self, f"_{type(self).__name__}__limit", limit)
         object.__setattr__(self, f"_{type(self).__name__}__func", func)
         object.__setattr__(self, f"_{type(self).__name__}__args", args)
         object.__setattr__(self, f"_{type(self).__name__}__kwargs", kwargs)
@@ -89,7 +121,12 @@ class LazyCall(LazyDependency, Generic[T], metaclass=CachedMeta):
     def __antidote_unsafe_provide__(
         self, catalog: ProviderCatalog, out: ProvidedDependency
     ) -> None:
-        if self.__lifetime is LifeTime.SCOPED:
+        if (
+            self.__lifetime is LifeTime.SCOPED
+            or self.__lifetime is LifeTime.POOLED
+            or self.__lifetime is LifeTime.RESOLUTION
+            or self.__ttl is not None
+        ):
             func = self.__func
             args = self.__args
             kwargs = self.__kwargs
@@ -104,6 +141,11 @@ class LazyCall(LazyDependency, Generic[T], metaclass=CachedMeta):
             self.__func(*self.__args, **self.__kwargs),
             lifetime=self.__lifetime,
             callback=callback,
+            ttl=self.__ttl,
+            serve_stale=self.__serve_stale,
+            finalizer=self.__finalizer,
+            pool=self.__pool,
+            limit=self.__limit,
         )
 
     def __hash__(self) -> int:
@@ -122,6 +164,9 @@ class LazyCall(LazyDependency, Generic[T], metaclass=CachedMeta):
     def __set_name__(self, owner: type, name: str) -> None:
         object.__setattr__(self, f"_{type(self).__name__}__name", f"{debug_repr(owner)}.{name}")
 
+    def is_call_of(self, func: object) -> bool:
+        return self.__func is func
+
     def __antidote_dependency_hint__(self) -> T:
         return cast(T, self)
 
@@ -132,6 +177,9 @@ class LazyCall(LazyDependency, Generic[T], metaclass=CachedMeta):
 class LazyProvider(Provider):
     __slots__ = ()
 
+    def routing(self) -> ProviderRouting:
+        return ProviderRouting(types=(LazyDependency,))
+
     def can_provide(self, dependency: object) -> TypeGuard[LazyDependency]:  # pyright: ignore
         return (
             isinstance(dependency, LazyDependency)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import time
 from typing import Any, Callable, ContextManager, Iterator
 
 import pytest
@@ -7,6 +8,7 @@ from typing_extensions import TypeAlias
 
 from antidote import config, world
 from antidote.core import CatalogOverrides, new_catalog, PublicCatalog
+from tests.utils import FakeClock
 
 TestContextOf: TypeAlias = Callable[[PublicCatalog], ContextManager[CatalogOverrides]]
 config.auto_detect_type_hints_locals = True
@@ -25,6 +27,14 @@ def clean_config() -> Iterator[None]:
     config.auto_detect_type_hints_locals = True
 
 
+@pytest.fixture
+def clock() -> Iterator[FakeClock]:
+    fake = FakeClock()
+    config.clock = fake
+    yield fake
+    config.clock = time.monotonic
+
+
 @pytest.fixture(params=["create", "test"])
 def catalog(request: Any) -> Iterator[PublicCatalog]:
     c = new_catalog(include=[])
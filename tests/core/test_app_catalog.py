@@ -32,6 +32,12 @@ def test_current_catalog_world() -> None:
         with pytest.raises(DependencyNotFoundError, match=re.escape(repr(y))):
             app_catalog[y]
 
+        assert app_catalog.handle(x)() is x
+        assert world.handle(x)() is x
+        handle = world.handle(y)
+        with pytest.raises(DependencyNotFoundError, match=re.escape(repr(y))):
+            handle()
+
         assert app_catalog.debug(x) == world.debug(x)
         assert app_catalog.debug(y) == world.debug(y)
 
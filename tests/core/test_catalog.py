@@ -1,32 +1,49 @@
 # pyright: reportUnusedClass=false
 from __future__ import annotations
 
+import asyncio
+import gc
 import re
+import threading
+import time
+import weakref
 from abc import ABC
-from typing import Callable
+from typing import Any, Callable, cast, Tuple
 
 import pytest
 
 from antidote import (
+    antidote_lib,
     Catalog,
     DependencyNotFoundError,
+    dependencyOf,
     FrozenCatalogError,
+    inject,
+    injectable,
+    lazy,
     LifeTime,
     new_catalog,
+    PoolTimeoutError,
     PublicCatalog,
+    ScopeGlobalVar,
 )
 from antidote.core import (
+    CacheLimit,
     CatalogId,
     DependencyDebug,
     DependencyDefinitionError,
     DuplicateProviderError,
     MissingProviderError,
+    PoolInfo,
+    PoolLimit,
     ProvidedDependency,
     Provider,
     ProviderCatalog,
+    ProviderRouting,
 )
+from antidote.core._raw import onion
 from tests.core.dummy_providers import DummyFactoryProvider, DummyProvider
-from tests.utils import Obj
+from tests.utils import Box, Obj
 
 x = Obj()
 y = Obj()
@@ -490,3 +507,1057 @@ def test_invalid_provider() -> None:
 
     with pytest.raises(TypeError, match="lifetime"):
         _ = catalog[unknown_scope]
+
+
+def test_frozen_catalog_remembers_missing_dependencies() -> None:
+    catalog = new_catalog(include=[])
+    child = new_catalog(name="child", include=[])
+    catalog.include(child)
+
+    @catalog.include
+    class CountingProvider(Provider):
+        calls: list[object]
+
+        def __init__(self, *, catalog: ProviderCatalog) -> None:
+            super().__init__(catalog=catalog)
+            self.calls = []
+
+        def can_provide(self, dependency: object) -> bool:
+            self.calls.append(dependency)
+            return dependency is x
+
+        def unsafe_maybe_provide(self, dependency: object, out: ProvidedDependency) -> None:
+            self.calls.append(dependency)
+            if dependency is x:
+                out.set_value(x, lifetime=LifeTime.TRANSIENT)
+
+    provider = catalog.providers[CountingProvider]
+
+    # Not frozen, anything may still be registered.
+    assert catalog.get(y) is None
+    assert catalog.get(y) is None
+    assert provider.calls == [y, y]
+
+    catalog.freeze()
+    provider.calls.clear()
+    assert catalog.get(y) is None
+    assert catalog.get(y, default=z) is z
+    assert y not in catalog
+    with pytest.raises(DependencyNotFoundError):
+        catalog[y]
+    assert z not in catalog
+    assert z not in catalog
+    assert catalog.get(z) is None
+    assert provider.calls == [y, z]
+
+    assert catalog[x] is x
+    assert catalog[x] is x
+    assert provider.calls == [y, z, x, x]
+
+    # Test contexts can always override anything.
+    with catalog.test.clone() as overrides:
+        overrides[y] = "overridden"
+        assert catalog[y] == "overridden"
+    with child.test.empty() as overrides:
+        overrides[y] = "child"
+        assert catalog[y] == "child"
+    assert catalog.get(y) is None
+
+
+def test_frozen_catalog_missing_dependencies_limit(monkeypatch: Any) -> None:
+    monkeypatch.setattr(onion, "_MAX_MISSING", 2)
+    catalog = new_catalog(include=[])
+    calls: list[object] = []
+
+    @catalog.include
+    class CountingProvider(Provider):
+        def can_provide(self, dependency: object) -> bool:
+            return False
+
+        def unsafe_maybe_provide(self, dependency: object, out: ProvidedDependency) -> None:
+            calls.append(dependency)
+
+    catalog.freeze()
+    for dependency in [x, y, z, x, y, z]:
+        assert catalog.get(dependency) is None
+    assert calls == [x, y, z, x, y, z]
+
+    calls.clear()
+    assert catalog.get(z) is None
+    assert calls == []
+
+
+def test_cache_abstract_methods() -> None:
+    with pytest.raises(TypeError, match="get"):
+
+        class MissingGet(onion.LocalCache):
+            __slots__ = ()
+
+    with pytest.raises(TypeError, match="vtime"):
+
+        class MissingVtime(onion.ScopeVarCache):
+            __slots__ = ()
+
+
+def test_frozen_catalog_children_routing() -> None:
+    calls: list[tuple[str, object]] = []
+
+    def keyed_provider(name: str, keys: set[object]) -> type[Provider]:
+        class KeyedProvider(Provider):
+            def routing(self) -> ProviderRouting:
+                return ProviderRouting(keys=keys)
+
+            def can_provide(self, dependency: object) -> bool:
+                calls.append((name, dependency))
+                return dependency in keys
+
+            def unsafe_maybe_provide(self, dependency: object, out: ProvidedDependency) -> None:
+                calls.append((name, dependency))
+                if dependency in keys:
+                    out.set_value(name, lifetime=LifeTime.TRANSIENT)
+
+        return KeyedProvider
+
+    catalog = new_catalog(include=[])
+    first = new_catalog(name="first", include=[keyed_provider("first", {x})])
+    second = new_catalog(name="second", include=[keyed_provider("second", {y})])
+    nested = new_catalog(name="nested", include=[keyed_provider("nested", {z})])
+    second.include(nested)
+    catalog.include(first)
+    catalog.include(second)
+    catalog.freeze()
+
+    assert catalog[x] == "first"
+    assert catalog[y] == "second"
+    assert catalog[z] == "nested"
+    assert calls == [("first", x), ("second", y), ("nested", z)]
+
+    calls.clear()
+    assert catalog.get(object()) is None
+    assert calls == []
+
+    # Test contexts may override anything in any child.
+    assert catalog.get(A) is None
+    with nested.test.empty() as overrides:
+        overrides[A] = "override"
+        assert catalog[A] == "override"  # type: ignore
+        assert catalog.get(z) is None
+    assert catalog[z] == "nested"
+    assert catalog.get(A) is None
+
+    with catalog.test.clone(frozen=False):
+        assert catalog[x] == "first"
+
+
+def test_frozen_catalog_children_without_routing() -> None:
+    catalog = new_catalog(include=[])
+    child = new_catalog(name="child", include=[DummyProvider])
+    child.providers[DummyProvider].data[x] = "child"
+    catalog.include(child)
+    catalog.freeze()
+    assert catalog[x] == "child"
+    assert x in catalog
+    assert catalog.get(y) is None
+
+
+def test_freeze_optimize() -> None:
+    catalog = new_catalog(include=[])
+    child = new_catalog(name="child", include=[DummyProvider])
+    child.providers[DummyProvider].data[x] = Obj()
+    transient = new_catalog(name="transient", include=[DummyFactoryProvider])
+    transient.providers[DummyFactoryProvider].add(y, factory=lambda c: Obj(), lifetime="transient")
+    catalog.include(child)
+    catalog.include(transient)
+
+    with pytest.raises(TypeError, match="optimize"):
+        catalog.freeze(optimize="yes")  # type: ignore
+
+    catalog.freeze(optimize=True)
+    assert catalog.is_frozen and child.is_frozen
+    with pytest.raises(FrozenCatalogError):
+        catalog.freeze(optimize=True)
+
+    singleton = catalog[x]
+    assert catalog[x] is singleton
+    assert catalog[y] is not catalog[y]
+    assert catalog.get(z) is None
+
+    # Test environments may override the children
+    with child.test.empty() as overrides:
+        overrides[x] = "override"
+        assert catalog[x] == "override"
+    assert catalog[x] is singleton
+
+    with catalog.test.clone(frozen=False) as overrides:
+        overrides[x] = "clone"
+        assert catalog[x] == "clone"
+    assert catalog[x] is singleton
+    assert x in catalog
+    assert catalog.debug(x)
+
+
+def test_single_thread_catalog() -> None:
+    with pytest.raises(TypeError, match="thread_safe"):
+        new_catalog(include=[], thread_safe="no")  # type: ignore
+
+    catalog = new_catalog(include=[antidote_lib], thread_safe=False)
+    version = ScopeGlobalVar(default=1, catalog=catalog)
+
+    @injectable(catalog=catalog, lifetime="transient")
+    class Transient:
+        pass
+
+    @lazy.value(catalog=catalog, lifetime="scoped")
+    def scoped(v: int = inject[version]) -> int:
+        return v * 10
+
+    assert catalog[Transient] is not catalog[Transient]
+    assert catalog[scoped] == 10
+    version.set(2)
+    assert catalog[scoped] == 20
+    assert catalog.get(x) is None
+
+    with catalog.test.empty() as overrides:
+
+        @overrides.factory(x)
+        def build() -> Obj:
+            return Obj()
+
+        assert catalog[x] is not catalog[x]
+
+    errors: list[Exception] = []
+
+    def other_thread() -> None:
+        try:
+            catalog[scoped]
+        except RuntimeError as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=other_thread)
+    thread.start()
+    thread.join()
+    assert len(errors) == (1 if __debug__ else 0)
+
+
+def test_handle(catalog: PublicCatalog) -> None:
+    catalog.include(DummyProvider)
+    catalog.providers[DummyProvider].data[A] = x
+
+    a: Callable[[], object] = catalog.handle(A)
+    assert a() is x
+    with catalog.test.empty() as overrides:
+        overrides[A] = y
+        assert a() is y
+    assert a() is x
+
+    missing = catalog.handle(B)
+    with pytest.raises(DependencyNotFoundError, match="B"):
+        missing()
+    assert catalog.handle(dependencyOf(B, default=z))() is z
+
+
+def test_class_dependency_hint(catalog: PublicCatalog) -> None:
+    catalog.include(DummyProvider)
+    catalog.providers[DummyProvider].data[x] = A
+
+    class Hinted:
+        @classmethod
+        def __antidote_dependency_hint__(cls) -> object:
+            return dependencyOf(x, default=y)
+
+    # The dependency hint is only known at runtime, so it cannot be typed.
+    hinted: object = Hinted
+    for _ in range(2):
+        assert catalog[hinted] is A
+        assert catalog.get(hinted) is A
+        assert hinted in catalog
+        assert catalog.handle(hinted)() is A
+
+    with catalog.test.empty():
+        assert catalog[hinted] is y
+        assert catalog.get(Hinted, default=z) is y
+        assert catalog.get(C, default=z) is z
+
+
+def test_get_many(catalog: PublicCatalog) -> None:
+    catalog.include(antidote_lib)
+
+    @injectable(catalog=catalog)
+    class Singleton:
+        pass
+
+    @injectable(catalog=catalog, lifetime="transient")
+    class Transient:
+        pass
+
+    @lazy(catalog=catalog)
+    def nested() -> tuple[object, ...]:
+        return cast(Tuple[object, ...], catalog.get_many([Singleton, Transient]))
+
+    assert catalog.get_many([]) == ()
+    singleton, transient, missing, default = catalog.get_many(
+        iter([Singleton, Transient, x, dependencyOf(y, default=z)])
+    )
+    assert singleton is catalog[Singleton]
+    assert isinstance(transient, Transient) and transient is not catalog[Transient]
+    assert missing is None
+    assert default is z
+    assert catalog.get_many([x, y], default=z) == (z, z)
+
+    singleton, transient = catalog[nested()]
+    assert singleton is catalog[Singleton]
+    assert isinstance(transient, Transient)
+
+    with catalog.test.clone() as overrides:
+        overrides[x] = "x"
+        assert catalog.get_many([x, Singleton]) == ("x", catalog[Singleton])
+
+
+def test_cache_store() -> None:
+    with pytest.raises(TypeError, match="cache_store"):
+        new_catalog(include=[], cache_store=object())  # type: ignore
+
+    stores: list[dict[object, object]] = []
+
+    class DroppingStore(dict):  # type: ignore
+        def __init__(self) -> None:
+            super().__init__()
+            stores.append(self)
+
+        def setdefault(self, key: object, default: object = None) -> object:
+            # drops every value
+            return default
+
+    catalog = new_catalog(include=[antidote_lib], cache_store=DroppingStore)
+    version = ScopeGlobalVar(default=1, catalog=catalog)
+
+    @injectable(catalog=catalog)
+    class Service:
+        pass
+
+    @lazy.value(catalog=catalog, lifetime="scoped")
+    def scoped(v: int = inject[version]) -> int:
+        return v * 10
+
+    # values are created again whenever they're dropped, scope vars are kept.
+    assert catalog[Service] is not catalog[Service]
+    assert catalog[version] == 1
+    assert catalog[scoped] == 10
+    version.set(2)
+    assert catalog[version] == 2
+    assert catalog[scoped] == 20
+    assert len(stores) == 2  # public & private layers
+
+    with catalog.test.clone():
+        assert len(stores) == 4
+        assert catalog[version] == 1
+        version.set(3)
+        assert catalog[scoped] == 30
+    assert catalog[version] == 2
+
+    with catalog.test.copy():
+        assert catalog[version] == 2
+
+
+def test_cache_store_test_environment() -> None:
+    catalog = new_catalog(include=[antidote_lib], cache_store=dict)
+    version = ScopeGlobalVar(default=1, catalog=catalog)
+
+    @injectable(catalog=catalog)
+    class Service:
+        pass
+
+    @injectable(catalog=catalog, lifetime="transient")
+    class Transient:
+        pass
+
+    @lazy.value(catalog=catalog, lifetime="scoped")
+    def scoped(v: int = inject[version]) -> int:
+        return v * 10
+
+    service = catalog[Service]
+    assert catalog[scoped] == 10
+    catalog[Transient]
+
+    with catalog.test.copy():
+        assert catalog[Service] is service
+        assert catalog[scoped] == 10
+        version.set(2)
+        assert catalog[scoped] == 20
+        assert catalog[Transient] is not catalog[Transient]
+    assert catalog[scoped] == 10
+
+
+def test_evict() -> None:
+    child = new_catalog(name="child", include=[antidote_lib])
+    catalog = new_catalog(include=[antidote_lib])
+    catalog.include(child)
+    version = ScopeGlobalVar(default=1, catalog=catalog)
+
+    @injectable(catalog=catalog)
+    class Service:
+        pass
+
+    @injectable(catalog=catalog.private)
+    class PrivateService:
+        pass
+
+    @injectable(catalog=child)
+    class ChildService:
+        pass
+
+    @lazy.value(catalog=catalog, lifetime="scoped")
+    def scoped(v: int = inject[version]) -> object:
+        return object()
+
+    @lazy.value(catalog=catalog, lifetime="scoped")
+    def dependent(s: object = inject[scoped]) -> object:
+        return s
+
+    @lazy.value(catalog=catalog, lifetime="scoped")
+    def unrelated(v: int = inject[version]) -> object:
+        return object()
+
+    @inject(app_catalog=catalog)
+    def f(service: Service = inject.me()) -> Service:
+        return service
+
+    catalog.freeze(optimize=True)
+
+    service = catalog[Service]
+    assert f() is service
+    assert catalog.evict(Service)
+    assert not catalog.evict(Service)
+    assert catalog[Service] is not service
+    assert f() is catalog[Service]
+
+    # scoped dependencies relying on an evicted one are computed again, but not the others
+    # sharing its scope vars.
+    assert catalog[dependent] is catalog[scoped]
+    previous = catalog[scoped]
+    other = catalog[unrelated]
+    assert catalog.evict(scoped)
+    assert catalog[dependent] is catalog[scoped]
+    assert catalog[scoped] is not previous
+    assert catalog[unrelated] is other
+
+    # scope vars are kept
+    assert not catalog.evict(version)
+    assert catalog[version] == 1
+
+    # values of child catalogs are only evicted through them, even if flattened
+    child_service = catalog[ChildService]
+    assert catalog[ChildService] is child_service
+    assert not catalog.evict(ChildService)
+    epoch = onion._layers_epoch
+    assert child.evict(ChildService)
+    assert catalog[ChildService] is not child_service
+    assert catalog[ChildService] is child[ChildService]
+    # Only the layers which flattened it are affected
+    assert onion._layers_epoch == epoch
+
+    private_service = catalog.private[PrivateService]
+    assert not catalog.evict(PrivateService)
+    assert catalog.private.evict(PrivateService)
+    assert catalog.private[PrivateService] is not private_service
+
+    assert not catalog.evict(x)
+    with catalog.test.copy():
+        service = catalog[Service]
+        assert catalog.evict(Service)
+        assert catalog[Service] is not service
+        previous = catalog[scoped]
+        assert catalog.evict(scoped)
+        assert catalog[dependent] is catalog[scoped]
+        assert catalog[scoped] is not previous
+
+
+def test_evict_where() -> None:
+    catalog = new_catalog(include=[antidote_lib])
+
+    @lazy(catalog=catalog)
+    def load(name: str) -> object:
+        return object()
+
+    @lazy(catalog=catalog)
+    def other(name: str) -> object:
+        return object()
+
+    @injectable(catalog=catalog)
+    class Conf:
+        @lazy.method(catalog=catalog)
+        def get(self, key: str) -> object:
+            return object()
+
+    with pytest.raises(TypeError, match="predicate"):
+        catalog.evict_where(object())  # type: ignore
+
+    a, b, c = catalog[load("a")], catalog[load("b")], catalog[other("c")]
+    conf = catalog[Conf.get("x")]
+    assert load.is_call(load("a"))
+    assert not load.is_call(other("a"))
+    assert not load.is_call(object())
+    assert Conf.get.is_call(Conf.get("x"))
+
+    assert catalog.evict_where(load.is_call) == 2
+    assert catalog.evict_where(load.is_call) == 0
+    assert catalog[load("a")] is not a
+    assert catalog[load("b")] is not b
+    assert catalog[other("c")] is c
+    assert catalog.evict_where(Conf.get.is_call) == 1
+    assert catalog[Conf.get("x")] is not conf
+
+
+def test_evict_concurrently() -> None:
+    catalog = new_catalog(include=[antidote_lib])
+
+    @lazy(catalog=catalog)
+    def load(n: int) -> Tuple[int]:
+        return (n,)
+
+    errors: list[Exception] = []
+    done = threading.Event()
+
+    def worker() -> None:
+        try:
+            while not done.is_set():
+                for n in range(20):
+                    assert catalog[load(n)] == (n,)
+        except Exception as e:  # pragma: no cover
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for _ in range(200):
+        catalog.evict_where(load.is_call)
+    done.set()
+    for thread in threads:
+        thread.join()
+    assert not errors
+
+
+@pytest.mark.parametrize("thread_safe", [True, False])
+def test_weak(thread_safe: bool) -> None:
+    child = new_catalog(name="child", include=[antidote_lib], thread_safe=thread_safe)
+    catalog = new_catalog(include=[antidote_lib], thread_safe=thread_safe)
+    catalog.include(child)
+
+    @injectable(catalog=catalog, lifetime="weak")
+    class Model:
+        pass
+
+    @injectable(catalog=child, lifetime="weak")
+    class ChildModel:
+        pass
+
+    @inject(app_catalog=catalog)
+    def f(model: Model = inject.me()) -> Model:
+        return model
+
+    catalog.freeze(optimize=True)
+    for dependency in [Model, ChildModel]:
+        value = catalog[dependency]
+        assert catalog[dependency] is value
+        ref = weakref.ref(value)
+        del value
+        gc.collect()
+        assert ref() is None
+        assert isinstance(catalog[dependency], dependency)
+
+    # injected functions do not keep it either
+    model = f()
+    assert f() is model
+    assert catalog[Model] is model
+    ref = weakref.ref(model)
+    del model
+    gc.collect()
+    assert ref() is None
+    assert f() is catalog[Model]
+
+    model = catalog[Model]
+    with catalog.test.copy():
+        assert catalog[Model] is model
+    with catalog.test.clone():
+        assert catalog[Model] is not model
+    assert catalog.evict(Model)
+    assert catalog[Model] is not model
+
+
+def test_weak_invalid(catalog: PublicCatalog, dummy_factory_provider: DummyFactoryProvider) -> None:
+    version = ScopeGlobalVar(default=1, catalog=catalog)
+
+    @dummy_factory_provider.add_raw()
+    def not_weakrefable(catalog: ProviderCatalog, out: ProvidedDependency) -> None:
+        out.set_value(value=1, lifetime=LifeTime.WEAK)
+
+    @dummy_factory_provider.add_raw()
+    def scoped(catalog: ProviderCatalog, out: ProvidedDependency) -> None:
+        out.set_value(value=Box(catalog[version]), lifetime=LifeTime.WEAK)
+
+    @dummy_factory_provider.add_raw()
+    def ttl(catalog: ProviderCatalog, out: ProvidedDependency) -> None:
+        out.set_value(value=Obj(), lifetime=LifeTime.WEAK, callback=Obj, ttl=1)
+
+    @dummy_factory_provider.add_raw()
+    def limit(catalog: ProviderCatalog, out: ProvidedDependency) -> None:
+        out.set_value(value=Obj(), lifetime=LifeTime.WEAK, limit=CacheLimit(maxsize=1))
+
+    with pytest.raises(DependencyDefinitionError, match="(?i)weak reference"):
+        _ = catalog[not_weakrefable]
+
+    with pytest.raises(DependencyDefinitionError, match="(?i)scope var"):
+        _ = catalog[scoped]
+
+    with pytest.raises(DependencyDefinitionError, match="(?i)weak.*ttl"):
+        _ = catalog[ttl]
+
+    with pytest.raises(DependencyDefinitionError, match="(?i)weak.*limit"):
+        _ = catalog[limit]
+
+
+def test_thread(catalog: PublicCatalog, dummy_factory_provider: DummyFactoryProvider) -> None:
+    finalized: list[object] = []
+
+    @dummy_factory_provider.add_raw()
+    def connection(catalog: ProviderCatalog, out: ProvidedDependency) -> None:
+        out.set_value(value=Obj(), lifetime=LifeTime.THREAD, finalizer=finalized.append)
+
+    main = catalog[connection]
+    assert catalog[connection] is main
+
+    values: list[object] = []
+    barrier = threading.Barrier(3)
+
+    def worker() -> None:
+        value = catalog[connection]
+        barrier.wait()  # all threads alive at the same time
+        values.extend([value, catalog[connection] is value])
+
+    threads = [threading.Thread(target=worker) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    gc.collect()
+
+    instances = values[::2]
+    assert values[1::2] == [True] * 3
+    assert len({id(v) for v in instances}) == 3
+    assert main not in instances
+    # finalized once their thread exited
+    assert sorted(map(id, finalized)) == sorted(map(id, instances))
+    finalized.clear()
+
+    # test environments have their own values
+    with catalog.test.copy():
+        assert catalog[connection] is not main
+    gc.collect()
+    assert len(finalized) == 1
+    assert catalog[connection] is main
+
+    assert catalog.evict(connection)
+    gc.collect()
+    assert finalized[-1] is main
+    assert catalog[connection] is not main
+
+
+def test_thread_invalid(
+    catalog: PublicCatalog, dummy_factory_provider: DummyFactoryProvider
+) -> None:
+    version = ScopeGlobalVar(default=1, catalog=catalog)
+
+    @dummy_factory_provider.add_raw()
+    def scoped(catalog: ProviderCatalog, out: ProvidedDependency) -> None:
+        out.set_value(value=Box(catalog[version]), lifetime=LifeTime.THREAD)
+
+    @dummy_factory_provider.add_raw()
+    def singleton(catalog: ProviderCatalog, out: ProvidedDependency) -> None:
+        out.set_value(value=Obj(), lifetime=LifeTime.SINGLETON, finalizer=print)
+
+    @dummy_factory_provider.add_raw()
+    def invalid_finalizer(catalog: ProviderCatalog, out: ProvidedDependency) -> None:
+        out.set_value(value=Obj(), lifetime=LifeTime.THREAD, finalizer=1)  # type: ignore
+
+    with pytest.raises(DependencyDefinitionError, match="(?i)scope var"):
+        _ = catalog[scoped]
+
+    with pytest.raises(DependencyDefinitionError, match="(?i)finalizer"):
+        _ = catalog[singleton]
+
+    with pytest.raises(TypeError, match="finalizer"):
+        _ = catalog[invalid_finalizer]
+
+
+def test_pooled(catalog: PublicCatalog, dummy_factory_provider: DummyFactoryProvider) -> None:
+    pool = PoolLimit(max_size=2, min_size=2, timeout=0.05)
+
+    @dummy_factory_provider.add_raw()
+    def connection(catalog: ProviderCatalog, out: ProvidedDependency) -> None:
+        out.set_value(value=Obj(), lifetime=LifeTime.POOLED, callback=Obj, pool=pool)
+
+    @inject(app_catalog=catalog)
+    def borrow(c: object = inject[connection]) -> object:
+        return c
+
+    @inject(app_catalog=catalog)
+    def borrow_two(
+        a: object = inject[connection], b: object = inject[connection]
+    ) -> tuple[object, object]:
+        assert pool.info().in_use == 2
+        return a, b
+
+    first = borrow()
+    assert pool.info() == PoolInfo(max_size=2, min_size=2, in_use=0, idle=2, waiting=0, created=2)
+    # values are given back at the end of the call and borrowed again
+    assert borrow() is first
+    a, b = borrow_two()
+    assert a is not b
+    assert pool.info().created == 2
+
+    # all values are borrowed by the current call
+    @inject(app_catalog=catalog)
+    def exhausted(
+        a: object = inject[connection],
+        b: object = inject[connection],
+        c: object = inject[connection],
+    ) -> None:
+        pass  # pragma: no cover
+
+    with pytest.raises(PoolTimeoutError):
+        exhausted()
+    assert pool.info() == PoolInfo(max_size=2, min_size=2, in_use=0, idle=2, waiting=0, created=2)
+
+    # another thread waits for a value to be given back
+    borrowed = threading.Event()
+    release = threading.Event()
+
+    @inject(app_catalog=catalog)
+    def hold(a: object = inject[connection], b: object = inject[connection]) -> None:
+        borrowed.set()
+        release.wait()
+
+    thread = threading.Thread(target=hold)
+    thread.start()
+    borrowed.wait()
+    waiter = threading.Thread(target=borrow)
+    pool.timeout = None
+    waiter.start()
+    while pool.info().waiting == 0:
+        time.sleep(0.001)
+    release.set()
+    thread.join()
+    waiter.join()
+    assert pool.info().in_use == 0
+
+    with pytest.raises(RuntimeError, match="injected call"):
+        _ = catalog[connection]
+
+    # test environments have their own pool
+    with catalog.test.copy():
+        assert borrow() is not first
+        assert pool.info().created == 4
+    gc.collect()
+    assert pool.info().idle == 2
+    assert borrow() is first
+
+
+def test_pooled_layer_locks(
+    catalog: PublicCatalog, dummy_factory_provider: DummyFactoryProvider
+) -> None:
+    version = ScopeGlobalVar(default=1, catalog=catalog)
+    pool = PoolLimit(max_size=1, timeout=2)
+
+    @dummy_factory_provider.add_raw()
+    def scoped(catalog: ProviderCatalog, out: ProvidedDependency) -> None:
+        out.set_value(
+            value=Box(catalog[version]),
+            lifetime=LifeTime.SCOPED,
+            callback=lambda: Box(catalog[version]),
+        )
+
+    @dummy_factory_provider.add_raw()
+    def connection(catalog: ProviderCatalog, out: ProvidedDependency) -> None:
+        out.set_value(value=Obj(), lifetime=LifeTime.POOLED, callback=Obj, pool=pool)
+
+    borrowed = threading.Event()
+
+    @inject(app_catalog=catalog)
+    def hold(c: object = inject[connection]) -> object:
+        borrowed.set()
+        while pool.info().waiting == 0:
+            time.sleep(0.001)
+        # needs the layer lock, which must not be held by the thread waiting for the connection
+        return catalog[scoped]
+
+    @inject(app_catalog=catalog)
+    def query(s: object = inject[scoped], c: object = inject[connection]) -> object:
+        return c
+
+    catalog[scoped]  # cached, later read under the layer lock
+    thread = threading.Thread(target=hold)
+    thread.start()
+    borrowed.wait()
+    start = time.monotonic()
+    query()
+    thread.join()
+    assert time.monotonic() - start < 1
+    assert pool.info() == PoolInfo(max_size=1, min_size=1, in_use=0, idle=1, waiting=0, created=1)
+
+
+def test_pooled_async(catalog: PublicCatalog, dummy_factory_provider: DummyFactoryProvider) -> None:
+    pool = PoolLimit(max_size=1, timeout=0.1)
+
+    @dummy_factory_provider.add_raw()
+    def connection(catalog: ProviderCatalog, out: ProvidedDependency) -> None:
+        out.set_value(value=Obj(), lifetime=LifeTime.POOLED, callback=Obj, pool=pool)
+
+    @inject(app_catalog=catalog)
+    async def query(c: object = inject[connection], delay: float = 0.01) -> object:
+        assert pool.info().in_use == 1
+        await asyncio.sleep(delay)
+        return c
+
+    async def main() -> None:
+        # Coroutines wait for the connection without blocking the event loop.
+        results = await asyncio.gather(query(), query(), query())
+        assert len({id(c) for c in results}) == 1
+        assert pool.info() == PoolInfo(
+            max_size=1, min_size=1, in_use=0, idle=1, waiting=0, created=1
+        )
+        with pytest.raises(PoolTimeoutError):
+            await asyncio.gather(query(delay=0.3), query())
+
+    asyncio.run(main())
+    assert pool.info().waiting == 0
+
+
+def test_pooled_invalid(
+    catalog: PublicCatalog, dummy_factory_provider: DummyFactoryProvider
+) -> None:
+    version = ScopeGlobalVar(default=1, catalog=catalog)
+    pool = PoolLimit(max_size=1)
+
+    @dummy_factory_provider.add_raw()
+    def scoped(catalog: ProviderCatalog, out: ProvidedDependency) -> None:
+        out.set_value(
+            value=Box(catalog[version]),
+            lifetime=LifeTime.POOLED,
+            callback=lambda: Box(1),
+            pool=pool,
+        )
+
+    @dummy_factory_provider.add_raw()
+    def without_pool(catalog: ProviderCatalog, out: ProvidedDependency) -> None:
+        out.set_value(value=Obj(), lifetime=LifeTime.POOLED, callback=Obj)
+
+    @dummy_factory_provider.add_raw()
+    def without_callback(catalog: ProviderCatalog, out: ProvidedDependency) -> None:
+        out.set_value(value=Obj(), lifetime=LifeTime.POOLED, pool=pool)  # type: ignore
+
+    @dummy_factory_provider.add_raw()
+    def singleton(catalog: ProviderCatalog, out: ProvidedDependency) -> None:
+        out.set_value(value=Obj(), lifetime=LifeTime.SINGLETON, callback=Obj, pool=pool)
+
+    @dummy_factory_provider.add_raw()
+    def invalid_pool(catalog: ProviderCatalog, out: ProvidedDependency) -> None:
+        out.set_value(value=Obj(), lifetime=LifeTime.POOLED, callback=Obj, pool=1)  # type: ignore
+
+    @dummy_factory_provider.add_raw()
+    def with_ttl(catalog: ProviderCatalog, out: ProvidedDependency) -> None:
+        out.set_value(value=Obj(), lifetime=LifeTime.POOLED, callback=Obj, pool=pool, ttl=1)
+
+    @inject(app_catalog=catalog)
+    def f(dependency: object) -> None:
+        catalog[dependency]
+
+    with pytest.raises(DependencyDefinitionError, match="(?i)scope var"):
+        f(scoped)
+    with pytest.raises(DependencyDefinitionError, match="(?i)require a pool"):
+        f(without_pool)
+    with pytest.raises(DependencyDefinitionError, match="(?i)callback"):
+        f(without_callback)
+    with pytest.raises(DependencyDefinitionError, match="(?i)pool"):
+        f(singleton)
+    with pytest.raises(TypeError, match="pool"):
+        f(invalid_pool)
+    with pytest.raises(DependencyDefinitionError, match="(?i)ttl"):
+        f(with_ttl)
+
+    for kwargs in [dict(max_size=0), dict(max_size=1, min_size=2), dict(max_size=1, timeout=-1)]:
+        with pytest.raises(ValueError):
+            PoolLimit(**kwargs)  # type: ignore
+    with pytest.raises(TypeError):
+        PoolLimit(max_size="1")  # type: ignore
+
+
+def test_resolution(catalog: PublicCatalog, dummy_factory_provider: DummyFactoryProvider) -> None:
+    @dummy_factory_provider.add_raw()
+    def unit_of_work(catalog: ProviderCatalog, out: ProvidedDependency) -> None:
+        out.set_value(value=Obj(), lifetime=LifeTime.RESOLUTION, callback=Obj)
+
+    @dummy_factory_provider.add_raw()
+    def service(catalog: ProviderCatalog, out: ProvidedDependency) -> None:
+        out.set_value(value=Box(catalog[unit_of_work]), lifetime=LifeTime.TRANSIENT)
+
+    @dummy_factory_provider.add_raw()
+    def handler(catalog: ProviderCatalog, out: ProvidedDependency) -> None:
+        out.set_value(
+            value=(catalog[service], catalog[service], catalog[unit_of_work]),
+            lifetime=LifeTime.TRANSIENT,
+        )
+
+    def resolve() -> Tuple[Box[object], Box[object], object]:
+        return cast(Tuple[Box[object], Box[object], object], catalog[handler])
+
+    # shared within a single resolution, created again for the next one
+    for _ in range(2):
+        a, b, uow = resolve()
+        assert a is not b
+        assert a.value is uow
+        assert b.value is uow
+    assert resolve()[2] is not resolve()[2]
+    assert catalog[unit_of_work] is not catalog[unit_of_work]
+
+    # an injected call is a single resolution
+    @inject(app_catalog=catalog)
+    def f(x: object = inject[unit_of_work], s: object = inject[service]) -> object:
+        assert cast(Box[object], s).value is x
+        return x
+
+    assert f() is not f()
+
+    # test environments share it similarly
+    with catalog.test.copy():
+        a, b, uow = resolve()
+        assert a.value is uow and b.value is uow
+
+
+def test_resolution_invalid(
+    catalog: PublicCatalog, dummy_factory_provider: DummyFactoryProvider
+) -> None:
+    version = ScopeGlobalVar(default=1, catalog=catalog)
+
+    @dummy_factory_provider.add_raw()
+    def scoped(catalog: ProviderCatalog, out: ProvidedDependency) -> None:
+        out.set_value(
+            value=Box(catalog[version]), lifetime=LifeTime.RESOLUTION, callback=lambda: Box(1)
+        )
+
+    @dummy_factory_provider.add_raw()
+    def without_callback(catalog: ProviderCatalog, out: ProvidedDependency) -> None:
+        out.set_value(value=Obj(), lifetime=LifeTime.RESOLUTION)
+
+    @dummy_factory_provider.add_raw()
+    def with_ttl(catalog: ProviderCatalog, out: ProvidedDependency) -> None:
+        out.set_value(value=Obj(), lifetime=LifeTime.RESOLUTION, callback=Obj, ttl=1)
+
+    with pytest.raises(DependencyDefinitionError, match="(?i)scope var"):
+        _ = catalog[scoped]
+    with pytest.raises(DependencyDefinitionError, match="(?i)callback"):
+        _ = catalog[without_callback]
+    with pytest.raises(DependencyDefinitionError, match="(?i)ttl"):
+        _ = catalog[with_ttl]
+
+
+def test_loop(catalog: PublicCatalog, dummy_factory_provider: DummyFactoryProvider) -> None:
+    closed: list[object] = []
+
+    async def close(value: object) -> None:
+        await asyncio.sleep(0)
+        closed.append(value)
+
+    @dummy_factory_provider.add_raw()
+    def client(catalog: ProviderCatalog, out: ProvidedDependency) -> None:
+        out.set_value(value=Obj(), lifetime=LifeTime.LOOP, finalizer=close)
+
+    async def main() -> object:
+        value = catalog[client]
+        assert catalog[client] is value
+
+        async def task() -> object:
+            await asyncio.sleep(0)
+            return catalog[client]
+
+        assert list(await asyncio.gather(task(), task())) == [value, value]
+        return value
+
+    first = asyncio.run(main())
+    # closed on the shutdown of its loop
+    assert closed == [first]
+    second = asyncio.run(main())
+    assert second is not first
+    assert closed == [first, second]
+
+    results: list[object] = []
+    thread = threading.Thread(target=lambda: results.append(asyncio.run(main())))
+    thread.start()
+    thread.join()
+    assert results[0] not in {first, second}
+
+    with pytest.raises(RuntimeError, match="event loop"):
+        _ = catalog[client]
+
+    # values of loops closed without being shut down are finalized whenever a new one is stored,
+    # or once the loop is garbage collected, but never awaited.
+    finalized: list[object] = []
+
+    @dummy_factory_provider.add_raw()
+    def sync_client(catalog: ProviderCatalog, out: ProvidedDependency) -> None:
+        out.set_value(value=Obj(), lifetime=LifeTime.LOOP, finalizer=finalized.append)
+
+    async def get(dependency: object) -> object:
+        return catalog[dependency]
+
+    loop = asyncio.new_event_loop()
+    orphan = loop.run_until_complete(get(sync_client))
+    loop.close()
+    assert finalized == []
+    other = asyncio.run(get(sync_client))
+    assert finalized == [orphan, other]
+
+    loop = asyncio.new_event_loop()
+    orphan = loop.run_until_complete(get(sync_client))
+    async_orphan = loop.run_until_complete(get(client))
+    loop.close()
+    loop_ref = weakref.ref(loop)
+    del loop
+    gc.collect()
+    assert loop_ref() is None
+    assert finalized[-1] is orphan
+    assert async_orphan not in closed
+
+    # test environments have their own values
+    async def in_test_env() -> None:
+        value = catalog[client]
+        with catalog.test.copy():
+            assert catalog[client] is not value
+        assert catalog[client] is value
+
+    asyncio.run(in_test_env())
+
+
+def test_loop_invalid(catalog: PublicCatalog, dummy_factory_provider: DummyFactoryProvider) -> None:
+    version = ScopeGlobalVar(default=1, catalog=catalog)
+
+    @dummy_factory_provider.add_raw()
+    def scoped(catalog: ProviderCatalog, out: ProvidedDependency) -> None:
+        out.set_value(value=Box(catalog[version]), lifetime=LifeTime.LOOP)
+
+    @dummy_factory_provider.add_raw()
+    def with_ttl(catalog: ProviderCatalog, out: ProvidedDependency) -> None:
+        out.set_value(value=Obj(), lifetime=LifeTime.LOOP, callback=Obj, ttl=1)
+
+    @dummy_factory_provider.add_raw()
+    def client(catalog: ProviderCatalog, out: ProvidedDependency) -> None:
+        out.set_value(value=Obj(), lifetime=LifeTime.LOOP)
+
+    async def main() -> None:
+        with pytest.raises(DependencyDefinitionError, match="(?i)scope var"):
+            _ = catalog[scoped]
+        with pytest.raises(DependencyDefinitionError, match="(?i)ttl"):
+            _ = catalog[with_ttl]
+
+    asyncio.run(main())
+    with pytest.raises(RuntimeError, match="event loop"):
+        _ = catalog[client]
@@ -24,6 +24,11 @@ def test_scope() -> None:
     assert LifeTime.of("transient") is LifeTime.TRANSIENT
     assert LifeTime.of("scoped") is LifeTime.SCOPED
     assert LifeTime.of("singleton") is LifeTime.SINGLETON
+    assert LifeTime.of("weak") is LifeTime.WEAK
+    assert LifeTime.of("thread") is LifeTime.THREAD
+    assert LifeTime.of("pooled") is LifeTime.POOLED
+    assert LifeTime.of("resolution") is LifeTime.RESOLUTION
+    assert LifeTime.of("loop") is LifeTime.LOOP
     assert LifeTime.of(LifeTime.TRANSIENT) is LifeTime.TRANSIENT
     assert LifeTime.of(LifeTime.SCOPED) is LifeTime.SCOPED
     assert LifeTime.of(LifeTime.SINGLETON) is LifeTime.SINGLETON
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+from typing import Any, Iterator
+
+import pytest
+
+from antidote import config, DoubleInjectionError, inject, injectable, new_catalog, world
+from tests.utils import Obj
+
+x = Obj()
+
+
+@pytest.fixture(autouse=True)
+def defer_injections() -> Iterator[None]:
+    config.defer_injections = True
+    try:
+        yield
+    finally:
+        config.defer_injections = False
+
+
+@pytest.fixture(autouse=True)
+def setup_world() -> Iterator[None]:
+    with world.test.new() as overrides:
+        overrides[x] = object()
+        yield
+
+
+def is_pending(f: Any) -> bool:
+    return f.__antidote_pending__ is not None
+
+
+def test_build_on_first_call() -> None:
+    @inject
+    def f(a: object = inject[x]) -> object:
+        return a
+
+    assert is_pending(f)
+    assert f() is world[x]
+    assert not is_pending(f)
+    assert f(1) == 1
+
+
+def test_forward_reference() -> None:
+    localns: dict[str, object] = {}
+
+    @inject(type_hints_locals=localns)
+    def f(service: Service = inject.me()) -> Service:
+        return service
+
+    @injectable
+    class Service:
+        pass
+
+    localns["Service"] = Service
+    assert f() is world[Service]
+
+
+def test_nothing_to_inject() -> None:
+    def f(a: object = None) -> object:
+        return a
+
+    injected_f = inject(f)
+    assert injected_f is not f
+    assert injected_f() is None
+    assert injected_f(1) == 1
+
+
+def test_freeze() -> None:
+    catalog = new_catalog(name="deferred")
+
+    @inject(app_catalog=catalog)
+    def f(a: object = inject[x]) -> object:
+        return a
+
+    assert is_pending(f)
+    catalog.freeze()
+    assert not is_pending(f)
+
+
+def test_errors() -> None:
+    catalog = new_catalog(name="deferred")
+
+    @inject(app_catalog=catalog)
+    def f(a: Unknown = inject.me()) -> object:  # type: ignore # noqa: F821
+        return a
+
+    with pytest.raises(NameError):
+        f()
+
+    with pytest.raises(NameError):
+        catalog.freeze()
+    assert not catalog.is_frozen
+
+    # Reported only once, but still raised on each call.
+    catalog.freeze()
+    assert catalog.is_frozen
+    assert is_pending(f)
+    with pytest.raises(NameError):
+        f()
+
+
+def test_freeze_unrelated_catalog() -> None:
+    catalog = new_catalog(name="deferred")
+    other = new_catalog(name="other")
+
+    @inject(app_catalog=other)
+    def f(a: Unknown = inject.me()) -> object:  # type: ignore # noqa: F821
+        return a
+
+    @inject
+    def g(a: object = inject[x]) -> object:
+        return a
+
+    catalog.freeze()
+    assert catalog.is_frozen
+    assert is_pending(f)
+    assert is_pending(g)
+
+    world.freeze()
+    assert is_pending(f)
+    assert not is_pending(g)
+
+
+def test_eager_errors() -> None:
+    @inject
+    def f(a: object = inject[x]) -> object:
+        return a
+
+    with pytest.raises(DoubleInjectionError):
+        inject(f)
+
+    def g(a: object = inject[x]) -> object:
+        return a
+
+    with pytest.raises(TypeError, match="inject.method"):
+        inject.method(g)
+
+    with pytest.raises(TypeError):
+        inject(object())  # type: ignore
+
+
+def test_methods() -> None:
+    @injectable
+    class Service:
+        @inject.method
+        def method(self, a: object = inject[x]) -> object:
+            return self, a
+
+        @inject
+        def regular(self, a: object = inject[x]) -> object:
+            return self, a
+
+    assert is_pending(Service.__dict__["method"])
+    assert Service.method() == (world[Service], world[x])
+    service = Service()
+    assert service.method() == (service, world[x])
+    assert service.regular() == (service, world[x])
+
+
+def test_rewire() -> None:
+    catalog = new_catalog(include=[])
+
+    @inject
+    def f(a: object = inject[x]) -> object:
+        return a
+
+    with catalog.test.empty() as overrides:
+        overrides[x] = "catalog"
+        inject.rewire(f, app_catalog=catalog)
+        assert is_pending(f)
+        assert f() == "catalog"
+
+
+def test_specialized() -> None:
+    config.specialize_injections = True
+    try:
+
+        @inject
+        def f(a: object = inject[x]) -> object:
+            return a
+
+    finally:
+        config.specialize_injections = False
+
+    assert f.__antidote_trampoline__ is None  # type: ignore
+    assert f() is world[x]
+    assert f.__antidote_trampoline__ is not None  # type: ignore
+    assert f() is world[x]
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+from typing import Any, Iterator
+
+import pytest
+
+from antidote import config, inject, injectable, new_catalog, PublicCatalog, ScopeGlobalVar
+from antidote.core._raw import NotFoundSentinel as NotFound
+from antidote.core._raw.onion import CatalogOnionLayerImpl
+from antidote.lib.lazy_ext import lazy
+
+
+@pytest.fixture(params=[False, True], ids=["generic", "specialized"])
+def specialized(request: Any) -> Iterator[bool]:
+    config.specialize_injections = request.param
+    try:
+        yield request.param
+    finally:
+        config.specialize_injections = False
+
+
+@pytest.fixture
+def catalog() -> PublicCatalog:
+    return new_catalog(name="prebound")
+
+
+def prebound_values(f: Any) -> tuple[object, ...] | None:
+    prebound = f.__antidote_prebound__
+    return None if prebound is None else prebound.values
+
+
+def test_frozen_catalog(catalog: PublicCatalog, specialized: bool) -> None:
+    @injectable(catalog=catalog)
+    class Service:
+        pass
+
+    @injectable(catalog=catalog, lifetime="transient")
+    class Transient:
+        pass
+
+    @inject(app_catalog=catalog)
+    def f(s: Service = inject.me(), t: Transient = inject.me()) -> tuple[Service, Transient]:
+        return s, t
+
+    # Not frozen
+    f()
+    assert prebound_values(f) is None
+
+    catalog.freeze()
+    s, t = f()
+    assert s is catalog[Service]
+    assert prebound_values(f) == (catalog[Service], NotFound)
+
+    s2, t2 = f()
+    assert s2 is s
+    assert t2 is not t
+
+
+def test_invalidation(catalog: PublicCatalog, specialized: bool) -> None:
+    @injectable(catalog=catalog)
+    class A:
+        pass
+
+    @injectable(catalog=catalog)
+    class B:
+        pass
+
+    @inject(app_catalog=catalog)
+    def f(a: A = inject.me(), b: B = inject.me()) -> tuple[A, B]:
+        return a, b
+
+    @lazy(catalog=catalog)
+    def dummy() -> object:
+        return object()
+
+    catalog.freeze()
+    # B is not instantiated yet, so it's only pre-bound on the next call.
+    catalog[A]
+    f()
+    assert prebound_values(f) == (catalog[A], NotFound)
+    f()
+    assert prebound_values(f) == (catalog[A], catalog[B])
+
+    original = f()
+    with catalog.test.clone() as overrides:
+        overrides[A] = "override"
+        assert f() == ("override", catalog[B])  # type: ignore
+        assert catalog[B] is not original[1]
+
+    assert f() == original
+
+    # new dependency in the cache
+    prebound = f.__antidote_prebound__  # type: ignore
+    catalog[dummy()]
+    assert f() == original
+    assert f.__antidote_prebound__ is not prebound  # type: ignore
+
+
+def test_scoped(catalog: PublicCatalog, specialized: bool) -> None:
+    version = ScopeGlobalVar(default=0, catalog=catalog)
+
+    @lazy.value(catalog=catalog, lifetime="scoped")
+    def current(v: int = inject[version]) -> int:
+        return v
+
+    @inject(app_catalog=catalog)
+    def f(a: int = inject[current], b: int = inject[version]) -> tuple[int, int]:
+        return a, b
+
+    catalog.freeze()
+    assert f() == (0, 0)
+    assert f() == (0, 0)
+    version.set(1)
+    assert f() == (1, 1)
+
+
+def test_methods(catalog: PublicCatalog, specialized: bool) -> None:
+    @injectable(catalog=catalog)
+    class Service:
+        pass
+
+    @injectable(catalog=catalog)
+    class Dummy:
+        @inject.method
+        def method(self, s: Service = inject.me()) -> object:
+            return self, s
+
+    catalog.freeze()
+    expected = (catalog[Dummy], catalog[Service])
+    assert Dummy.method() == expected
+    assert Dummy.method() == expected
+    assert prebound_values(Dummy.__dict__["method"]) == expected
+
+    dummy = Dummy()
+    assert dummy.method() == (dummy, catalog[Service])
+
+
+def test_not_frozen_skips_prebind(
+    catalog: PublicCatalog, specialized: bool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls = []
+    prebind = CatalogOnionLayerImpl.prebind
+
+    def spy(self: CatalogOnionLayerImpl, *args: Any) -> Any:
+        calls.append(self)
+        return prebind(self, *args)
+
+    monkeypatch.setattr(CatalogOnionLayerImpl, "prebind", spy)
+
+    @injectable(catalog=catalog)
+    class Service:
+        pass
+
+    @inject(app_catalog=catalog)
+    def f(s: Service = inject.me()) -> Service:
+        return s
+
+    assert f() is catalog[Service]
+    assert calls == []
+
+    catalog.freeze()
+    assert f() is catalog[Service]
+    assert len(calls) == 1
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Iterator
+
+import pytest
+
+from antidote import config, inject, injectable, lazy, ScopeGlobalVar, world
+from antidote.core import new_catalog
+from tests.utils import Obj
+
+x = Obj()
+y = Obj()
+
+
+@pytest.fixture(autouse=True)
+def specialize_injections() -> Iterator[None]:
+    config.specialize_injections = True
+    try:
+        yield
+    finally:
+        config.specialize_injections = False
+
+
+@pytest.fixture(autouse=True)
+def setup_world() -> Iterator[None]:
+    with world.test.new() as overrides:
+        overrides.update({x: object(), y: object()})
+        yield
+
+
+def is_specialized(f: Any) -> bool:
+    return getattr(f, "__antidote_trampoline__", None) is not None
+
+
+def test_function() -> None:
+    @inject
+    def f(a: object = inject[x], b: object = inject[y], c: object = None) -> object:
+        return a, b, c
+
+    assert is_specialized(f)
+    assert f() == (world[x], world[y], None)
+    assert f(1) == (1, world[y], None)
+    assert f(b=2) == (world[x], 2, None)
+    assert f(1, 2, 3) == (1, 2, 3)
+    assert f(c=3) == (world[x], world[y], 3)
+
+    with pytest.raises(TypeError):
+        f(d=1)  # type: ignore
+
+
+def test_not_specialized_by_default() -> None:
+    config.specialize_injections = False
+
+    @inject
+    def f(a: object = inject[x]) -> object:
+        return a
+
+    assert not is_specialized(f)
+    assert f() is world[x]
+
+
+def test_signatures() -> None:
+    @inject
+    def positional_only(a: object, /, b: object = inject[x]) -> object:
+        return a, b
+
+    @inject
+    def kw_only(a: object, *, b: object = inject[x], c: object = 3) -> object:
+        return a, b, c
+
+    @inject
+    def var_args(*args: object, b: object = inject[x], **kwargs: object) -> object:
+        return args, b, kwargs
+
+    @inject(kwargs=dict(b=y))
+    def mandatory_after_injection(a: object = inject[x], b: object = None, *, c: object) -> object:
+        return a, b, c
+
+    assert is_specialized(positional_only)
+    assert positional_only(1) == (1, world[x])
+    assert positional_only(1, 2) == (1, 2)
+    with pytest.raises(TypeError):
+        positional_only(a=1)  # type: ignore
+
+    assert is_specialized(kw_only)
+    assert kw_only(1) == (1, world[x], 3)
+    assert kw_only(1, b=2, c=4) == (1, 2, 4)
+    with pytest.raises(TypeError):
+        kw_only(1, 2)  # type: ignore
+
+    assert is_specialized(var_args)
+    assert var_args(1, 2, c=3) == ((1, 2), world[x], dict(c=3))
+    assert var_args(b=2) == ((), 2, {})
+
+    assert is_specialized(mandatory_after_injection)
+    assert mandatory_after_injection(c=1) == (world[x], world[y], 1)
+
+
+def test_fallback() -> None:
+    @inject(kwargs=dict(a=x))
+    def f(a: object, b: object) -> object:
+        return a, b
+
+    assert not is_specialized(f)
+    assert f(b=1) == (world[x], 1)  # type: ignore
+
+
+def test_methods() -> None:
+    class Dummy:
+        @inject
+        def method(self, a: object = inject[x]) -> object:
+            return self, a
+
+        @inject
+        @classmethod
+        def klass(cls, a: object = inject[x]) -> object:
+            return cls, a
+
+        @inject
+        @staticmethod
+        def static(a: object = inject[x]) -> object:
+            return a
+
+    dummy = Dummy()
+    assert dummy.method() == (dummy, world[x])
+    assert dummy.method(1) == (dummy, 1)
+    assert Dummy.method(dummy) == (dummy, world[x])
+    assert Dummy.klass() == (Dummy, world[x])
+    assert dummy.klass(a=1) == (Dummy, 1)
+    assert Dummy.static() is world[x]
+    assert dummy.static(1) == 1
+
+
+def test_inject_self() -> None:
+    @injectable
+    class Service:
+        @inject.method
+        def method(self, a: object = inject[x]) -> object:
+            return self, a
+
+    assert Service.method() == (world[Service], world[x])
+    assert Service.method(1) == (world[Service], 1)
+    service = Service()
+    assert service.method() == (service, world[x])
+
+
+def test_async() -> None:
+    @inject
+    async def f(a: object = inject[x], b: object = None) -> object:
+        return a, b
+
+    assert is_specialized(f)
+    assert asyncio.run(f()) == (world[x], None)  # type: ignore
+    assert asyncio.run(f(1, 2)) == (1, 2)  # type: ignore
+
+
+def test_scoped_consistency() -> None:
+    version = ScopeGlobalVar(default=0)
+
+    @lazy.value(lifetime="scoped")
+    def current(v: int = inject[version]) -> int:
+        return v
+
+    @inject
+    def f(a: int = inject[current], b: int = inject[version]) -> object:
+        version.set(a + 1)
+        return a, b, world[current]
+
+    assert f() == (0, 0, 1)
+    assert f() == (1, 1, 2)
+
+
+def test_rewire() -> None:
+    catalog = new_catalog(include=[])
+
+    @inject
+    def f(a: object = inject[x]) -> object:
+        return a
+
+    with catalog.test.empty() as overrides:
+        overrides[x] = "catalog"
+        assert f() is world[x]
+        inject.rewire(f, app_catalog=catalog)
+        assert is_specialized(f)
+        assert f() == "catalog"
@@ -1,9 +1,17 @@
+import asyncio
 import inspect
+import pickle
+from contextvars import ContextVar
 from typing import Any, TypeVar
 
 import pytest
 
 from antidote import inject, world
+from antidote.core._raw.wrapper import (
+    AsyncInjectedBoundWrapper,
+    InjectedBoundWrapper,
+    SyncInjectedBoundWrapper,
+)
 from tests.utils import Obj
 
 T = TypeVar("T")
@@ -446,3 +454,62 @@ def test_attributes() -> None:
     assert injected_f.b is b  # type: ignore
 
     assert injected_f.__wrapped__ is f  # type: ignore
+
+
+def test_bound_method() -> None:
+    from antidote.core._debug import get_injections
+    from antidote.core._raw import unwrap
+
+    class Dummy:
+        @wrap
+        def method(self, x: object = None) -> object:
+            return x
+
+        @wrap
+        async def async_method(self, x: object = None) -> object:
+            return x
+
+    dummy = Dummy()
+    assert Dummy.method is Dummy.__dict__["method"]
+    assert dummy.method.__self__ is dummy  # type: ignore
+    assert dummy.method is not dummy.method
+    assert get_injections(dummy.method) == [dep_x]
+    assert get_injections(dummy.async_method) == [dep_x]
+    unwrapped = unwrap(dummy.method)
+    assert unwrapped is not None
+    assert unwrapped[0] == Dummy.__dict__["method"].__wrapped__.__get__(dummy, Dummy)
+    assert unwrapped[2] is Dummy.__dict__["method"].__antidote_blueprint__
+
+    with world.test.empty() as overrides:
+        overrides[dep_x] = Obj()
+        assert dummy.method() is world[dep_x]
+        assert dummy.method(1) == 1
+        assert asyncio.run(dummy.async_method()) is world[dep_x]  # type: ignore
+
+
+def test_context_vars_set_by_the_function() -> None:
+    # Injected functions are called in the current context like any other function, changes of
+    # context vars are visible to the caller.
+    var: ContextVar[object] = ContextVar("var", default=None)
+
+    @wrap
+    def f(x: object = None) -> object:
+        var.set(x)
+        return x
+
+    with world.test.empty() as overrides:
+        overrides[dep_x] = Obj()
+        assert f() is world[dep_x]
+        assert var.get() is world[dep_x]
+        f(1)
+        assert var.get() == 1
+
+
+@pytest.mark.parametrize(
+    "cls", [InjectedBoundWrapper, SyncInjectedBoundWrapper, AsyncInjectedBoundWrapper]
+)
+def test_bound_wrapper_class_attributes(cls: type) -> None:
+    assert cls.__module__ == "antidote.core._raw.wrapper"
+    assert repr(cls) == f"<class 'antidote.core._raw.wrapper.{cls.__name__}'>"
+    assert cls.__doc__ is None
+    assert pickle.loads(pickle.dumps(cls)) is cls
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import importlib
+import inspect
+import os
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Iterator, Optional
+
+import pytest
+
+from antidote import config, inject, world
+from antidote.core import _injection
+from antidote.core._injection import InjectionParameters
+from antidote.core._injection_cache import InjectionCache
+
+MODULE = """
+from __future__ import annotations
+
+from typing import Optional
+
+from antidote import inject, injectable
+from typing_extensions import Annotated
+
+
+@injectable
+class Service:
+    pass
+
+
+def f(a: int, service: Service = inject.me(), *, opt: Optional[Service] = None) -> object:
+    return service
+
+
+def annotated(service: Annotated[Service, inject.me()]) -> object:
+    return service
+"""
+
+
+@pytest.fixture
+def cache(monkeypatch: Any, tmp_path: Path) -> Iterator[InjectionCache]:
+    cache = InjectionCache()
+    monkeypatch.setattr(_injection, "injection_cache", cache)
+    config.injection_cache_dir = str(tmp_path / "cache")
+    try:
+        yield cache
+    finally:
+        config.injection_cache_dir = None
+
+
+@pytest.fixture
+def module(tmp_path: Path) -> Iterator[ModuleType]:
+    (tmp_path / "cached_module.py").write_text(MODULE)
+    sys.path.insert(0, str(tmp_path))
+    try:
+        with world.test.new():
+            yield importlib.import_module("cached_module")
+    finally:
+        sys.path.remove(str(tmp_path))
+        sys.modules.pop("cached_module", None)
+
+
+def forbid_inspection(monkeypatch: Any) -> None:
+    def fail(*args: object, **kwargs: object) -> Any:
+        raise AssertionError()
+
+    monkeypatch.setattr(_injection, "get_type_hints", fail)
+    monkeypatch.setattr(inspect, "signature", fail)
+
+
+def as_tuples(parameters: InjectionParameters) -> object:
+    return (
+        parameters.positional_arguments_count,
+        [
+            (p.name, p.default, p.type_hint, p.type_hint_with_extras, p.to_ignore)
+            for p in parameters
+        ],
+    )
+
+
+def test_warm_start(cache: InjectionCache, module: Any, monkeypatch: Any, tmp_path: Path) -> None:
+    expected = as_tuples(InjectionParameters.of(module.f, ignore_type_hints=False))
+    assert not (tmp_path / "cache").exists()
+    cache.save()
+    assert len(os.listdir(tmp_path / "cache")) == 1
+
+    monkeypatch.setattr(_injection, "injection_cache", InjectionCache())
+    with monkeypatch.context() as m:
+        forbid_inspection(m)
+        parameters = InjectionParameters.of(module.f, ignore_type_hints=False)
+    assert as_tuples(parameters) == expected
+    assert parameters.positional_arguments_count == 2
+    assert [p.type_hint for p in parameters] == [int, module.Service, Optional[module.Service]]
+
+    with monkeypatch.context() as m:
+        forbid_inspection(m)
+        f = inject(module.f, type_hints_locals=None)
+    assert f(1) is world[module.Service]
+
+
+def test_stale_module(cache: InjectionCache, module: Any, monkeypatch: Any) -> None:
+    InjectionParameters.of(module.f, ignore_type_hints=False)
+    cache.save()
+
+    stat = os.stat(module.__file__)
+    os.utime(module.__file__, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    monkeypatch.setattr(_injection, "injection_cache", InjectionCache())
+    with monkeypatch.context() as m:
+        forbid_inspection(m)
+        with pytest.raises(AssertionError):
+            InjectionParameters.of(module.f, ignore_type_hints=False)
+
+
+def test_stale_type_hint(cache: InjectionCache, module: Any, monkeypatch: Any) -> None:
+    InjectionParameters.of(module.f, ignore_type_hints=False)
+    cache.save()
+
+    monkeypatch.delattr(module, "Service")
+    monkeypatch.setattr(_injection, "injection_cache", InjectionCache())
+    with monkeypatch.context() as m:
+        forbid_inspection(m)
+        with pytest.raises(AssertionError):
+            InjectionParameters.of(module.f, ignore_type_hints=False)
+
+
+def test_uncacheable(cache: InjectionCache, module: Any, tmp_path: Path) -> None:
+    class Local:
+        pass
+
+    def local(x: Local) -> None:
+        pass
+
+    InjectionParameters.of(module.annotated, ignore_type_hints=False)
+    InjectionParameters.of(local, ignore_type_hints=False, type_hints_locals={"Local": Local})
+    cache.save()
+    assert not (tmp_path / "cache").exists()
+
+
+def test_disabled(module: Any, monkeypatch: Any, tmp_path: Path) -> None:
+    cache = InjectionCache()
+    monkeypatch.setattr(_injection, "injection_cache", cache)
+    InjectionParameters.of(module.f, ignore_type_hints=False)
+    cache.save()
+    assert not any(name.endswith(".json") for name in os.listdir(tmp_path))
+
+
+def test_stale_dependency_module(cache: InjectionCache, monkeypatch: Any, tmp_path: Path) -> None:
+    dependency = tmp_path / "cached_dependency.py"
+
+    def write_dependency(alias: str, mtime_ns: int) -> None:
+        dependency.write_text(
+            "from antidote import injectable\n\n"
+            "@injectable\nclass V1:\n    pass\n\n"
+            "@injectable\nclass V2:\n    pass\n\n"
+            f"Service = {alias}\n"
+        )
+        os.utime(dependency, ns=(mtime_ns, mtime_ns))
+
+    def resolved_type_hint() -> object:
+        importlib.invalidate_caches()
+        with world.test.new():
+            module = importlib.import_module("cached_dependent")
+            (parameter,) = InjectionParameters.of(module.f, ignore_type_hints=False)
+            return parameter.type_hint
+
+    write_dependency("V1", 10**18)
+    (tmp_path / "cached_dependent.py").write_text(
+        "import cached_dependency\n"
+        "from antidote import inject\n\n"
+        "def f(s: cached_dependency.Service = inject.me()) -> object:\n    return s\n"
+    )
+    sys.path.insert(0, str(tmp_path))
+    try:
+        assert resolved_type_hint() is sys.modules["cached_dependency"].V1
+        cache.save()
+
+        write_dependency("V2", 2 * 10**18)
+        sys.modules.pop("cached_dependency")
+        sys.modules.pop("cached_dependent")
+        monkeypatch.setattr(_injection, "injection_cache", InjectionCache())
+        assert resolved_type_hint() is sys.modules["cached_dependency"].V2
+    finally:
+        sys.path.remove(str(tmp_path))
+        sys.modules.pop("cached_dependency", None)
+        sys.modules.pop("cached_dependent", None)
@@ -5,8 +5,14 @@ from typing import ClassVar
 
 import pytest
 
-from antidote import FrozenCatalogError, world
-from antidote.core import DependencyDebug, ProvidedDependency, Provider
+from antidote import FrozenCatalogError, LifeTime, new_catalog, world
+from antidote.core import (
+    DependencyDebug,
+    ProvidedDependency,
+    Provider,
+    ProviderCatalog,
+    ProviderRouting,
+)
 from tests.core.dummy_providers import DummyProvider
 from tests.utils import Obj
 
@@ -94,3 +100,88 @@ def test_provider_catalog() -> None:
 
     assert str(world.private.id) in str(p_catalog)
     assert str(world.private.id) in repr(p_catalog)
+
+
+def test_routing() -> None:
+    catalog = new_catalog(include=[])
+    calls: list[tuple[str, object]] = []
+
+    @catalog.include
+    class TypedProvider(Provider):
+        def routing(self) -> ProviderRouting:
+            return ProviderRouting(types=(int,))
+
+        def can_provide(self, dependency: object) -> bool:
+            calls.append(("typed", dependency))
+            return isinstance(dependency, int)
+
+        def unsafe_maybe_provide(self, dependency: object, out: ProvidedDependency) -> None:
+            calls.append(("typed", dependency))
+            if isinstance(dependency, int):
+                out.set_value(dependency, lifetime=LifeTime.TRANSIENT)
+
+    @catalog.include
+    class KeyedProvider(Provider):
+        def __init__(self, *, catalog: ProviderCatalog) -> None:
+            super().__init__(catalog=catalog)
+            self.data: dict[object, object] = {}
+
+        def routing(self) -> ProviderRouting:
+            return ProviderRouting(keys=self.data.keys())
+
+        def can_provide(self, dependency: object) -> bool:
+            calls.append(("keyed", dependency))
+            return dependency in self.data
+
+        def unsafe_maybe_provide(self, dependency: object, out: ProvidedDependency) -> None:
+            calls.append(("keyed", dependency))
+            if dependency in self.data:
+                out.set_value(self.data[dependency], lifetime=LifeTime.TRANSIENT)
+
+    keyed = catalog.providers[KeyedProvider]
+    assert catalog[True] is True  # subclass of int
+    assert calls == [("typed", True)]
+
+    calls.clear()
+    assert catalog.get("a") is None
+    assert "a" not in catalog
+    assert calls == []
+
+    # keys are live before freezing
+    keyed.data["a"] = "A"
+    assert catalog["a"] == "A"
+    assert "a" in catalog
+    assert calls == [("keyed", "a"), ("keyed", "a")]
+    assert catalog.debug("a") is not None
+
+    catalog.freeze()
+    calls.clear()
+    assert catalog["a"] == "A"
+    assert catalog.get("b") is None
+    assert catalog[2] == 2
+    assert calls == [("keyed", "a"), ("typed", 2)]
+
+
+def test_invalid_routing() -> None:
+    with pytest.raises(TypeError, match="types"):
+        ProviderRouting(types=[int])  # type: ignore
+    with pytest.raises(TypeError, match="types"):
+        ProviderRouting(types=(object(),))  # type: ignore
+    with pytest.raises(TypeError, match="keys"):
+        ProviderRouting(keys=object())  # type: ignore
+
+    catalog = new_catalog(include=[])
+
+    @catalog.include
+    class InvalidProvider(Provider):
+        def routing(self) -> ProviderRouting:
+            return object()  # type: ignore
+
+        def can_provide(self, dependency: object) -> bool:
+            return False
+
+        def unsafe_maybe_provide(self, dependency: object, out: ProvidedDependency) -> None:
+            pass
+
+    with pytest.raises(TypeError, match="routing"):
+        catalog.get(x)
@@ -1,14 +1,21 @@
 from __future__ import annotations
 
 import itertools
-from typing import TypeVar
+import threading
+from typing import cast, TypeVar
 
 import pytest
 
 from antidote import inject, LifeTime, PublicCatalog, ScopeGlobalVar
-from antidote.core import DependencyDefinitionError, ProvidedDependency, ProviderCatalog
+from antidote.core import (
+    CacheInfo,
+    CacheLimit,
+    DependencyDefinitionError,
+    ProvidedDependency,
+    ProviderCatalog,
+)
 from tests.core.dummy_providers import DummyFactoryProvider
-from tests.utils import Box, Obj
+from tests.utils import Box, FakeClock, Obj
 
 T = TypeVar("T")
 
@@ -224,3 +231,244 @@ def test_test_env(catalog: PublicCatalog, provider: DummyFactoryProvider) -> Non
         assert catalog[dummy] is catalog[dummy]
 
     assert catalog[dummy] is original
+
+
+def test_ttl(catalog: PublicCatalog, provider: DummyFactoryProvider, clock: FakeClock) -> None:
+    @provider.add_raw()
+    def dummy(catalog: ProviderCatalog, out: ProvidedDependency) -> None:
+        out.set_value(value=Obj(), lifetime=LifeTime.SINGLETON, callback=Obj, ttl=10)
+
+    @provider.add_raw()
+    def dependent(catalog: ProviderCatalog, out: ProvidedDependency) -> None:
+        out.set_value(
+            value=Box(catalog[dummy]),
+            lifetime=LifeTime.SCOPED,
+            callback=lambda: Box(catalog[dummy]),
+        )
+
+    result = catalog[dummy]
+    assert catalog[dummy] is result
+    assert catalog[dependent] == Box(result)
+    clock.now = 9.9
+    assert catalog[dummy] is result
+    assert catalog[dependent] == Box(result)
+
+    # scoped dependencies are computed again with the new value
+    clock.now = 10
+    dependent_result = cast(Box[object], catalog[dependent])
+    assert dependent_result.value is not result
+    assert dependent_result.value is catalog[dummy]
+    assert catalog[dependent] is dependent_result
+
+    # expiry is measured from the last computation
+    clock.now = 19.9
+    assert catalog[dependent] is dependent_result
+    clock.now = 20
+    assert catalog[dummy] is not dependent_result.value
+
+    with catalog.test.copy():
+        previous = catalog[dummy]
+        assert catalog[dummy] is previous
+        clock.now = 30
+        assert catalog[dummy] is not previous
+
+    assert catalog[dummy] is not previous
+    assert cast(Box[object], catalog[dependent]).value is catalog[dummy]
+
+
+def test_ttl_scoped(
+    catalog: PublicCatalog, provider: DummyFactoryProvider, clock: FakeClock
+) -> None:
+    var = ScopeGlobalVar(default="a", catalog=catalog)
+
+    @provider.add_raw()
+    def dummy(catalog: ProviderCatalog, out: ProvidedDependency) -> None:
+        out.set_value(
+            value=Box(catalog[var]),
+            lifetime=LifeTime.SCOPED,
+            callback=lambda: Box(catalog[var]),
+            ttl=10,
+        )
+
+    result = catalog[dummy]
+    assert catalog[dummy] is result
+    var.set("b")
+    result = catalog[dummy]
+    assert result == Box("b")
+    clock.now = 10
+    assert catalog[dummy] is not result
+    assert catalog[dummy] == Box("b")
+
+
+def test_ttl_invalid(
+    catalog: PublicCatalog, provider: DummyFactoryProvider, clock: FakeClock
+) -> None:
+    @provider.add_raw()
+    def transient(catalog: ProviderCatalog, out: ProvidedDependency) -> None:
+        out.set_value(value=Obj(), lifetime=LifeTime.TRANSIENT, callback=Obj, ttl=10)
+
+    @provider.add_raw()
+    def no_callback(catalog: ProviderCatalog, out: ProvidedDependency) -> None:
+        out.set_value(value=Obj(), lifetime=LifeTime.SINGLETON, ttl=10)  # type: ignore
+
+    @provider.add_raw()
+    def expiring(catalog: ProviderCatalog, out: ProvidedDependency) -> None:
+        out.set_value(value=Obj(), lifetime=LifeTime.SINGLETON, callback=Obj, ttl=10)
+
+    @provider.add_raw()
+    def singleton(catalog: ProviderCatalog, out: ProvidedDependency) -> None:
+        out.set_value(value=Box(catalog[expiring]), lifetime=LifeTime.SINGLETON)
+
+    with pytest.raises(DependencyDefinitionError, match="(?i)transient"):
+        _ = catalog[transient]
+
+    with pytest.raises(DependencyDefinitionError, match="(?i)callback"):
+        _ = catalog[no_callback]
+
+    with pytest.raises(DependencyDefinitionError, match="(?i)singleton"):
+        _ = catalog[singleton]
+
+    for ttl, error in [("1", TypeError), (True, TypeError), (0, ValueError), (-1, ValueError)]:
+
+        @provider.add_raw()
+        def invalid(catalog: ProviderCatalog, out: ProvidedDependency) -> None:
+            out.set_value(
+                value=Obj(), lifetime=LifeTime.SINGLETON, callback=Obj, ttl=ttl  # type: ignore
+            )
+
+        with pytest.raises(error, match="ttl"):
+            _ = catalog[invalid]
+
+    @provider.add_raw()
+    def invalid_serve_stale(catalog: ProviderCatalog, out: ProvidedDependency) -> None:
+        out.set_value(
+            value=Obj(),
+            lifetime=LifeTime.SINGLETON,
+            callback=Obj,
+            ttl=1,
+            serve_stale="yes",  # type: ignore
+        )
+
+    with pytest.raises(TypeError, match="serve_stale"):
+        _ = catalog[invalid_serve_stale]
+
+
+@pytest.mark.parametrize("serve_stale", [True, False])
+def test_ttl_serve_stale(
+    catalog: PublicCatalog, provider: DummyFactoryProvider, clock: FakeClock, serve_stale: bool
+) -> None:
+    refreshing = threading.Event()
+    release = threading.Event()
+    counter = itertools.count()
+
+    def build() -> int:
+        n = next(counter)
+        if n > 0:
+            refreshing.set()
+            release.wait(timeout=5)
+        return n
+
+    @provider.add_raw()
+    def dummy(catalog: ProviderCatalog, out: ProvidedDependency) -> None:
+        out.set_value(
+            value=build(),
+            lifetime=LifeTime.SINGLETON,
+            callback=build,
+            ttl=10,
+            serve_stale=serve_stale,
+        )
+
+    assert catalog[dummy] == 0
+    clock.now = 10
+    results: list[object] = []
+    thread = threading.Thread(target=lambda: results.append(catalog[dummy]))
+    thread.start()
+    assert refreshing.wait(timeout=5)
+
+    if serve_stale:
+        assert catalog[dummy] == 0
+        release.set()
+    else:
+        other = threading.Thread(target=lambda: results.append(catalog[dummy]))
+        other.start()
+        other.join(timeout=0.1)
+        assert other.is_alive()  # waiting for the new value
+        release.set()
+        other.join()
+    thread.join()
+    assert results == [1] * len(results)
+    assert catalog[dummy] == 1
+
+
+def test_cache_limit(catalog: PublicCatalog, provider: DummyFactoryProvider) -> None:
+    limit = CacheLimit(maxsize=2)
+    var = ScopeGlobalVar(default="a", catalog=catalog)
+
+    @provider.add_raw()
+    def a(catalog: ProviderCatalog, out: ProvidedDependency) -> None:
+        out.set_value(value=Obj(), lifetime=LifeTime.SINGLETON, limit=limit)
+
+    @provider.add_raw()
+    def b(catalog: ProviderCatalog, out: ProvidedDependency) -> None:
+        out.set_value(value=Obj(), lifetime=LifeTime.SINGLETON, limit=limit)
+
+    @provider.add_raw()
+    def scoped(catalog: ProviderCatalog, out: ProvidedDependency) -> None:
+        out.set_value(
+            value=Box(catalog[var]),
+            lifetime=LifeTime.SCOPED,
+            callback=lambda: Box(catalog[var]),
+            limit=limit,
+        )
+
+    result_a = catalog[a]
+    result_b = catalog[b]
+    assert catalog[a] is result_a
+    assert limit.info() == CacheInfo(maxsize=2, hits=1, misses=2, evictions=0)
+
+    # b is the least recently used
+    result_scoped = catalog[scoped]
+    assert catalog[a] is result_a
+    assert catalog[b] is not result_b
+    assert limit.info() == CacheInfo(maxsize=2, hits=2, misses=4, evictions=2)
+
+    # scoped was evicted by b, a is the least recently used now.
+    assert catalog[scoped] is not result_scoped
+    assert catalog[scoped] == Box("a")
+    var.set("b")
+    assert catalog[scoped] == Box("b")
+    assert limit.info().evictions == 3
+
+    # evicted values are not tracked anymore
+    catalog.evict(b)
+    result_a = catalog[a]
+    assert catalog[scoped] == Box("b")
+    assert catalog[a] is result_a
+
+    # test environments have their own values
+    with catalog.test.copy():
+        assert catalog[a] is result_a
+        catalog[b]
+        catalog[scoped]
+        assert catalog[a] is not result_a
+    assert catalog[a] is result_a
+
+
+def test_cache_limit_invalid(catalog: PublicCatalog, provider: DummyFactoryProvider) -> None:
+    @provider.add_raw()
+    def transient(catalog: ProviderCatalog, out: ProvidedDependency) -> None:
+        out.set_value(value=Obj(), lifetime=LifeTime.TRANSIENT, limit=CacheLimit(maxsize=1))
+
+    @provider.add_raw()
+    def invalid(catalog: ProviderCatalog, out: ProvidedDependency) -> None:
+        out.set_value(value=Obj(), lifetime=LifeTime.SINGLETON, limit=1)  # type: ignore
+
+    with pytest.raises(DependencyDefinitionError, match="(?i)transient"):
+        _ = catalog[transient]
+
+    with pytest.raises(TypeError, match="limit"):
+        _ = catalog[invalid]
+
+    for maxsize, error in [("1", TypeError), (True, TypeError), (0, ValueError), (-1, ValueError)]:
+        with pytest.raises(error, match="maxsize"):
+            CacheLimit(maxsize=maxsize)  # type: ignore
@@ -283,3 +283,147 @@ def test_unlock_transient_scope() -> None:
     ThreadSafetyBench.run(worker, n_threads=5)
     assert not concurrent_maybe_provide
     assert concurrent_safe_provides
+
+
+@pytest.mark.timeout(3)
+def test_single_flight(catalog: PublicCatalog) -> None:
+    catalog.include(antidote_lib)
+    calls: list[int] = []
+
+    @injectable(catalog=catalog)
+    class Slow:
+        def __init__(self) -> None:
+            calls.append(1)
+            ThreadSafetyBench.random_delay(0.1)
+
+    instances: list[object] = []
+
+    def worker() -> None:
+        instances.append(catalog[Slow])
+
+    ThreadSafetyBench.run(worker)
+    assert len(calls) == 1
+    assert len(set(map(id, instances))) == 1
+
+
+@pytest.mark.timeout(3)
+def test_unrelated_dependencies_created_concurrently(catalog: PublicCatalog) -> None:
+    catalog.include(antidote_lib)
+    barrier = threading.Barrier(2, timeout=1)
+    version = ScopeGlobalVar(default=0, catalog=catalog)
+
+    @injectable(catalog=catalog)
+    class A:
+        def __init__(self) -> None:
+            barrier.wait()
+
+    @injectable(catalog=catalog)
+    class B:
+        def __init__(self) -> None:
+            barrier.wait()
+            # Scope vars can be updated while singletons are being created.
+            version.set(1)
+
+    threads = [
+        threading.Thread(target=lambda: catalog[A]),
+        threading.Thread(target=lambda: catalog[B]),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not barrier.broken
+    assert catalog[version] == 1
+
+
+@pytest.mark.timeout(3)
+def test_no_deadlock_with_scope_lock(catalog: PublicCatalog) -> None:
+    catalog.include(antidote_lib)
+    version = ScopeGlobalVar(default=0, catalog=catalog)
+    started = threading.Event()
+
+    @lazy(catalog=catalog, lifetime="transient")
+    def x() -> object:
+        started.set()
+        ThreadSafetyBench.random_delay(0.1)
+        return catalog[version]
+
+    @lazy(catalog=catalog, lifetime="transient")
+    def y() -> object:
+        # Holds the scope lock while waiting for x, which is created by another thread needing it.
+        v = catalog[version]
+        started.wait()
+        return v, catalog[x()]
+
+    thread = threading.Thread(target=lambda: catalog[x()])
+    thread.start()
+    started.wait()
+    assert catalog[y()] == (0, 0)
+    thread.join()
+
+
+@pytest.mark.timeout(3)
+def test_deadlock_restarts_resolution(catalog: PublicCatalog) -> None:
+    catalog.include(antidote_lib)
+    version = ScopeGlobalVar(default=0, catalog=catalog)
+    started = threading.Event()
+    holding = threading.Event()
+    created: list[object] = []
+
+    @lazy(catalog=catalog, lifetime="scoped")
+    def slow() -> object:
+        started.set()
+        holding.wait()
+        # Needs the scope lock, held by the other thread waiting for this value.
+        value = Box(catalog[version])
+        created.append(value)
+        return value
+
+    @lazy(catalog=catalog, lifetime="transient")
+    def holder() -> object:
+        catalog[version]
+        holding.set()
+        started.wait()
+        return catalog[slow()]
+
+    results: list[object] = []
+    thread = threading.Thread(target=lambda: results.append(catalog[slow()]))
+    thread.start()
+    started.wait()
+    result = catalog[holder()]
+    thread.join()
+    # The thread detecting the deadlock started again instead of creating another value.
+    assert created == [result]
+    assert results == [result]
+    assert catalog[slow()] is result
+
+
+@pytest.mark.timeout(3)
+def test_deadlock_within_injected_function(catalog: PublicCatalog) -> None:
+    catalog.include(antidote_lib)
+    version = ScopeGlobalVar(default=0, catalog=catalog)
+    started = threading.Event()
+    holding = threading.Event()
+
+    @lazy(catalog=catalog, lifetime="scoped")
+    def slow() -> object:
+        started.set()
+        holding.wait()
+        # Needs the scope lock, held by the injected function below.
+        return Box(catalog[version])
+
+    @inject(app_catalog=catalog)
+    def f(v: object = inject[version]) -> object:
+        holding.set()
+        started.wait()
+        time.sleep(0.1)
+        return catalog[slow()]
+
+    thread = threading.Thread(target=lambda: catalog[slow()])
+    thread.start()
+    # It cannot be started again once the function is running.
+    with pytest.raises(RuntimeError, match="deadlock"):
+        f()
+    thread.join()
+    assert catalog[slow()] == Box(0)
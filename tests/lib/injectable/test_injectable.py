@@ -1,6 +1,9 @@
 # pyright: reportUnusedClass=false
 from __future__ import annotations
 
+import asyncio
+import threading
+
 import pytest
 
 from antidote import (
@@ -13,6 +16,8 @@ from antidote import (
     Wiring,
     world,
 )
+from antidote.core import PoolLimit
+from tests.utils import FakeClock
 
 
 @pytest.fixture(autouse=True)
@@ -240,3 +245,151 @@ def test_private_accessible(catalog: PublicCatalog) -> None:
 
     assert catalog[Dummy].private is catalog.private[Private]
     assert catalog[Dummy2].private is catalog.private[Private]
+
+
+def test_ttl(clock: FakeClock) -> None:
+    @injectable(ttl=10)
+    class Token:
+        pass
+
+    @injectable(lifetime="scoped", ttl=5, serve_stale=True)
+    class Flags:
+        def __init__(self, token: Token = inject.me()) -> None:
+            self.token = token
+
+    token = world[Token]
+    flags = world[Flags]
+    assert world[Token] is token
+    assert flags.token is token
+
+    clock.now = 5
+    assert world[Token] is token
+    assert world[Flags] is not flags
+    assert world[Flags].token is token
+
+    clock.now = 10
+    assert world[Token] is not token
+    assert world[Flags].token is world[Token]
+
+    with pytest.raises(ValueError, match="(?i)transient"):
+        injectable(lifetime="transient", ttl=1)
+    with pytest.raises(TypeError, match="ttl"):
+        injectable(ttl="1")  # type: ignore
+    with pytest.raises(TypeError, match="serve_stale"):
+        injectable(ttl=1, serve_stale=1)  # type: ignore
+
+
+def test_thread() -> None:
+    closed: list[object] = []
+
+    @injectable(lifetime="thread", finalizer=closed.append)
+    class Connection:
+        pass
+
+    @injectable
+    class Repository:
+        def __init__(self) -> None:
+            pass
+
+        @inject
+        def connection(self, connection: Connection = inject.me()) -> Connection:
+            return connection
+
+    connection = world[Connection]
+    assert world[Connection] is connection
+    assert world[Repository].connection() is connection
+
+    results: list[Connection] = []
+    thread = threading.Thread(target=lambda: results.append(world[Repository].connection()))
+    thread.start()
+    thread.join()
+    assert results[0] is not connection
+    assert closed == results
+
+    with pytest.raises(ValueError, match="(?i)thread"):
+        injectable(lifetime="thread", ttl=1)
+    with pytest.raises(ValueError, match="(?i)thread"):
+        injectable(finalizer=print)
+    with pytest.raises(TypeError, match="finalizer"):
+        injectable(lifetime="thread", finalizer=1)  # type: ignore
+
+
+def test_pooled() -> None:
+    pool = PoolLimit(max_size=2)
+
+    @injectable(lifetime="pooled", pool=pool)
+    class Connection:
+        pass
+
+    @injectable
+    class Repository:
+        @inject
+        def connections(
+            self, a: Connection = inject.me(), b: Connection = inject.me()
+        ) -> tuple[Connection, Connection]:
+            return a, b
+
+    a, b = world[Repository].connections()
+    assert a is not b
+    assert set(world[Repository].connections()) == {a, b}
+    assert pool.info().idle == 2
+
+    with pytest.raises(ValueError, match="(?i)require a pool"):
+        injectable(lifetime="pooled")
+    with pytest.raises(ValueError, match="(?i)pooled"):
+        injectable(pool=pool)
+    with pytest.raises(ValueError, match="(?i)pooled"):
+        injectable(lifetime="pooled", pool=pool, ttl=1)
+    with pytest.raises(TypeError, match="pool"):
+        injectable(lifetime="pooled", pool=object())  # type: ignore
+
+
+def test_resolution() -> None:
+    @injectable(lifetime="resolution")
+    class UnitOfWork:
+        pass
+
+    @injectable(lifetime="transient")
+    class Repository:
+        def __init__(self, uow: UnitOfWork = inject.me()) -> None:
+            self.uow = uow
+
+    @injectable(lifetime="transient")
+    class Handler:
+        def __init__(
+            self,
+            users: Repository = inject.me(),
+            orders: Repository = inject.me(),
+            uow: UnitOfWork = inject.me(),
+        ) -> None:
+            self.repositories = [users, orders]
+            self.uow = uow
+
+    handler = world[Handler]
+    assert [r.uow for r in handler.repositories] == [handler.uow, handler.uow]
+    assert world[Handler].uow is not handler.uow
+
+    with pytest.raises(ValueError, match="(?i)resolution"):
+        injectable(lifetime="resolution", ttl=1)
+
+
+def test_loop() -> None:
+    closed: list[object] = []
+
+    @injectable(lifetime="loop", finalizer=lambda client: client.close())
+    class Client:
+        async def close(self) -> None:
+            await asyncio.sleep(0)
+            closed.append(self)
+
+    @inject
+    async def f(client: Client = inject.me()) -> Client:
+        assert world[Client] is client
+        return client
+
+    first = asyncio.run(f())
+    assert closed == [first]
+    assert asyncio.run(f()) is not first
+
+    with pytest.raises(ValueError, match="(?i)loop"):
+        injectable(lifetime="loop", ttl=1)
@@ -482,6 +482,51 @@ def test_overriding() -> None:
         implements(Base).overriding(object())  # type: ignore
 
 
+def test_switch() -> None:
+    @interface
+    class Base:
+        ...
+
+    @implements(Base).when(qualified_by=qA)
+    class V1(Base):
+        ...
+
+    @_(implements(Base).as_default)
+    class Default(Base):
+        ...
+
+    @injectable
+    class V2(Base):
+        ...
+
+    class Unknown(Base):
+        ...
+
+    world.freeze()
+    assert isinstance(world[Base], V1)
+    assert isinstance(world[instanceOf(Base).single(qualified_by=qA)], V1)
+
+    implements(Base).switch(V1, V2)
+    assert isinstance(world[Base], V2)
+    assert isinstance(world[instanceOf(Base).single(qualified_by=qA)], V2)
+    assert isinstance(world[instanceOf(Base).single(qualified_by=qB)], Default)
+
+    with world.test.clone():
+        implements(Base).switch(V2, V1)
+        assert isinstance(world[Base], V1)
+    assert isinstance(world[Base], V2)
+
+    implements(Base).switch(Default, V1)
+    assert isinstance(world[instanceOf(Base).single(qualified_by=qB)], V1)
+
+    with pytest.raises(ValueError, match="Default"):
+        implements(Base).switch(Default, V1)
+
+    with pytest.raises(FrozenCatalogError):
+        implements(Base).switch(V2, Unknown)
+    assert isinstance(world[Base], V2)
+
+
 def test_by_default() -> None:
     @interface
     class Base:
@@ -1,6 +1,7 @@
 # pyright: reportUnusedClass=false
 from __future__ import annotations
 
+import dataclasses
 import itertools
 
 import pytest
@@ -34,6 +35,22 @@ def test_qualified_by_eq_hash() -> None:
     assert QualifiedBy(x, y) == QualifiedBy(y, y, x, x, y, x, y, x)
 
 
+def test_qualified_query_eq_hash() -> None:
+    @interface
+    class Base:
+        ...
+
+    query = instanceOf(Base).single(qualified_by=[x, y])
+    assert query is instanceOf(Base).single(qualified_by=[y, x])
+    assert query == instanceOf(Base).single(QualifiedBy(x, y))
+    assert hash(query) == hash(instanceOf(Base).single(QualifiedBy(x, y)))
+    assert query != instanceOf(Base).single(qualified_by=x)
+    all_query: object = instanceOf(Base).all(qualified_by=[x, y])
+    assert query != all_query
+    assert query != object()
+    assert [f.name for f in dataclasses.fields(query)] == ["interface", "constraints", "all"]
+
+
 def test_qualified_by_predicate() -> None:
     assert QualifiedBy(object()).weight() is not None
     assert QualifiedBy.merge(QualifiedBy(x), QualifiedBy(y)) == QualifiedBy(x, y)
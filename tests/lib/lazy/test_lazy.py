@@ -1,7 +1,9 @@
 # pyright: reportUnusedClass=false, reportUnusedFunction=false
 from __future__ import annotations
 
+import itertools
 import re
+import threading
 from dataclasses import dataclass, field
 from typing import Dict, Optional
 
@@ -21,8 +23,9 @@ from antidote import (
     world,
 )
 from antidote._internal import debug_repr
+from antidote.core import CacheInfo, PoolLimit
 from antidote.lib.lazy_ext import Lazy
-from tests.utils import Box, expected_debug, Obj
+from tests.utils import Box, expected_debug, FakeClock, Obj
 
 w = Obj()
 x = Obj()
@@ -1142,3 +1145,194 @@ def test_inject_signature() -> None:
 
     assert world[f()] is world[Service]  # type: ignore
     assert world[Dummy.method()] is world[Service]  # type: ignore
+
+
+def test_ttl(clock: FakeClock) -> None:
+    world.include(antidote_lib_injectable)
+    counter = itertools.count()
+
+    @lazy(ttl=10)
+    def load(name: str) -> Box[int]:
+        return Box(next(counter))
+
+    @lazy.value(ttl=10)
+    def value() -> Box[int]:
+        return Box(next(counter))
+
+    @injectable
+    class Conf:
+        @lazy.method(ttl=10)
+        def get(self, key: str) -> Box[int]:
+            return Box(next(counter))
+
+        @lazy.property(ttl=10)
+        def prop(self) -> Box[int]:
+            return Box(next(counter))
+
+    dependencies: list[Dependency[Box[int]]] = [load("a"), value, Conf.get("a"), Conf.prop]
+    results = [world[d] for d in dependencies]
+    assert [world[d] for d in dependencies] == results
+    clock.now = 10
+    new_results = [world[d] for d in dependencies]
+    assert all(a.value != b.value for a, b in zip(results, new_results))
+    assert [world[d] for d in dependencies] == new_results
+
+    with pytest.raises(ValueError, match="(?i)transient"):
+        lazy(lifetime="transient", ttl=1)
+    with pytest.raises(ValueError, match="(?i)weak"):
+        lazy(lifetime="weak", ttl=1)
+    with pytest.raises(TypeError, match="ttl"):
+        lazy.value(ttl="1")  # type: ignore
+
+
+def test_maxsize() -> None:
+    world.include(antidote_lib_injectable)
+    calls: list[object] = []
+
+    @lazy(maxsize=2)
+    def load(name: str) -> Box[str]:
+        calls.append(name)
+        return Box(name)
+
+    @injectable
+    class Conf:
+        @lazy.method(lifetime="singleton", maxsize=1)
+        def get(self, key: str) -> Box[str]:
+            calls.append(key)
+            return Box(key)
+
+    a = world[load("a")]
+    world[load("b")]
+    assert world[load(name="a")] is a
+    world[load("c")]  # evicts b
+    assert world[load("a")] is a
+    assert calls == ["a", "b", "c"]
+    world[load("b")]
+    assert calls == ["a", "b", "c", "b"]
+    assert load.cache_info() == CacheInfo(maxsize=2, hits=2, misses=4, evictions=2)
+
+    calls.clear()
+    x = world[Conf.get("x")]
+    assert world[Conf.get("x")] is x
+    world[Conf.get("y")]
+    assert world[Conf.get("x")] is not x
+    assert calls == ["x", "y", "x"]
+    assert Conf.get.cache_info() == CacheInfo(maxsize=1, hits=1, misses=3, evictions=2)
+
+    @lazy
+    def unbounded() -> Box[str]:
+        return Box("")
+
+    assert unbounded.cache_info() is None
+
+    with pytest.raises(ValueError, match="(?i)transient"):
+        lazy(lifetime="transient", maxsize=1)
+    with pytest.raises(ValueError, match="(?i)weak"):
+        lazy(lifetime="weak", maxsize=1)
+    with pytest.raises(ValueError, match="(?i)thread"):
+        lazy(lifetime="thread", maxsize=1)
+    with pytest.raises(TypeError, match="maxsize"):
+        lazy.value(maxsize=1)  # type: ignore
+    with pytest.raises(TypeError, match="maxsize"):
+        lazy.property(maxsize=1)  # type: ignore
+    with pytest.raises(TypeError, match="maxsize"):
+        lazy(maxsize="1")  # type: ignore
+    with pytest.raises(ValueError, match="maxsize"):
+        lazy(maxsize=0)
+
+
+def test_maxsize_scoped() -> None:
+    version = ScopeGlobalVar[int](default=0)
+    calls: list[int] = []
+
+    @lazy(lifetime="scoped", maxsize=2)
+    def load(n: int, v: int = inject[version]) -> Box[int]:
+        calls.append(n)
+        return Box(n)
+
+    world[load(1)]
+    two = world[load(2)]
+    three = world[load(3)]  # evicts 1
+    # Only the evicted value is computed again, not those sharing its scope vars.
+    assert world[load(3)] is three
+    assert world[load(2)] is two
+    assert calls == [1, 2, 3]
+    world[load(1)]
+    assert calls == [1, 2, 3, 1]
+    assert load.cache_info() == CacheInfo(maxsize=2, hits=2, misses=4, evictions=2)
+
+
+def test_maxsize_concurrent_hits() -> None:
+    @lazy(maxsize=1)
+    def load() -> Box[str]:
+        return Box("")
+
+    world[load()]
+
+    def worker() -> None:
+        for _ in range(1000):
+            world[load()]
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert load.cache_info() == CacheInfo(maxsize=1, hits=4000, misses=1, evictions=0)
+
+
+def test_thread_finalizer() -> None:
+    closed: list[object] = []
+
+    @lazy.value(lifetime="thread", finalizer=closed.append)
+    def connection() -> Box[str]:
+        return Box(threading.current_thread().name)
+
+    assert world[connection] is world[connection]
+    thread = threading.Thread(target=lambda: world[connection], name="worker")
+    thread.start()
+    thread.join()
+    assert closed == [Box("worker")]
+
+    with pytest.raises(ValueError, match="(?i)thread"):
+        lazy(finalizer=print)
+    with pytest.raises(TypeError, match="finalizer"):
+        lazy.method(lifetime="thread", finalizer="close")  # type: ignore
+
+
+def test_pooled() -> None:
+    pool = PoolLimit(max_size=1)
+    created: list[int] = []
+
+    @lazy(lifetime="pooled", pool=pool)
+    def session(name: str) -> Box[str]:
+        created.append(1)
+        return Box(name)
+
+    @inject
+    def f(a: Box[str] = inject[session("a")], b: Box[str] = inject[session("b")]) -> object:
+        return a, b
+
+    assert f() == (Box("a"), Box("b"))
+    assert f() == (Box("a"), Box("b"))
+    # each call of the lazy function has its own pool
+    assert len(created) == 2
+    assert pool.info().idle == 2
+
+    # created outside an injected call, the value is kept for the next one
+    with pytest.raises(RuntimeError, match="injected call"):
+        _ = world[session("c")]
+    assert len(created) == 3
+    assert pool.info().idle == 3
+
+    @inject
+    def g(c: Box[str] = inject[session("c")]) -> object:
+        return c
+
+    assert g() == Box("c")
+    assert len(created) == 3
+
+    with pytest.raises(ValueError, match="(?i)pooled"):
+        lazy.value(pool=pool)
+    with pytest.raises(ValueError, match="(?i)pooled"):
+        lazy.method(lifetime="pooled", pool=pool, maxsize=2)
@@ -6,3 +6,23 @@ from antidote import config
 def test_invalid_auto_detect_type_hints_locals() -> None:
     with pytest.raises(TypeError, match=".*auto_detect_type_hints_locals.*"):
         config.auto_detect_type_hints_locals = "auto"  # type: ignore
+
+
+def test_invalid_specialize_injections() -> None:
+    with pytest.raises(TypeError, match=".*specialize_injections.*"):
+        config.specialize_injections = "yes"  # type: ignore
+
+
+def test_invalid_defer_injections() -> None:
+    with pytest.raises(TypeError, match=".*defer_injections.*"):
+        config.defer_injections = "yes"  # type: ignore
+
+
+def test_invalid_injection_cache_dir() -> None:
+    with pytest.raises(TypeError, match=".*injection_cache_dir.*"):
+        config.injection_cache_dir = 1  # type: ignore
+
+
+def test_invalid_clock() -> None:
+    with pytest.raises(TypeError, match=".*clock.*"):
+        config.clock = 1  # type: ignore
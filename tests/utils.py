@@ -23,6 +23,14 @@ class Box(Generic[T]):
         return f"Box({self.value!r})@{short_id(self)}"
 
 
+@dataclass
+class FakeClock:
+    now: float = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
 class Obj:
     """
     Inspired from https://stackoverflow.com/a/41586688